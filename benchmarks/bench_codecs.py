@@ -0,0 +1,83 @@
+# benchmarks/bench_codecs.py
+"""
+Dump time, load time and file size of each write_json codec on store-shaped
+documents: a meeting record, the Jira export and the email log, at several
+sizes built from synthetic transcripts (benchmarks/synthetic.py).
+
+Run from the repo root:
+    python -m benchmarks.bench_codecs --out codecs.json
+"""
+import argparse
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.bench_suite import measure
+from benchmarks.synthetic import generate_transcript
+from src import serialization
+from src.extractors import extract_action_items, summarize_transcript
+from src.utils import read_json, write_json
+
+SIZES = {"small": 20_000, "medium": 500_000, "large": 5_000_000}
+
+
+def documents(target_bytes, seed):
+    text = generate_transcript(target_bytes, seed=seed)
+    actions = extract_action_items(text)
+    issues = [{"id": f"ISSUE-{i:08x}", "summary": a["task"][:140], "assignee": a["owner"], "due": a["due"],
+               "status": "open", "created_at": "2025-11-20T10:00:00Z", "updated_at": "2025-11-20T10:00:00Z"}
+              for i, a in enumerate(actions)]
+    emails = [{"to": i["assignee"] or "unassigned@example.com", "subject": f"New task: {i['summary'][:60]}",
+               "body": f"You have been assigned {i['id']}: {i['summary']}", "ts": i["created_at"]}
+              for i in issues]
+    return {
+        "meeting": {"summary": summarize_transcript(text), "actions": actions, "followed_up": False,
+                    "reminders": []},
+        "jira_export": issues,
+        "email_log": emails,
+    }
+
+
+def codecs():
+    names = ["pretty", "json"]
+    if serialization.msgpack is not None:
+        names.append("msgpack")
+    return names
+
+
+def run(sizes, seconds, seed):
+    results = {"orjson": serialization.orjson is not None, "msgpack": serialization.msgpack is not None,
+               "sizes": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in sizes:
+            entry = results["sizes"][label] = {}
+            for doc_name, doc in documents(SIZES[label], seed).items():
+                for codec in codecs():
+                    path = Path(tmp) / f"{label}-{doc_name}-{codec}.json"
+                    r = {"bytes": write_json(path, doc, codec=codec),
+                         "dump": measure(lambda: write_json(path, doc, codec=codec), seconds),
+                         "load": measure(lambda: read_json(path), seconds)}
+                    entry[f"{doc_name}.{codec}"] = r
+                    print(f"{label:6} {doc_name:12} {codec:8} {r['bytes']:>10} bytes  "
+                          f"dump {r['dump']['median_s'] * 1000:8.2f} ms  load {r['load']['median_s'] * 1000:8.2f} ms",
+                          file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--seconds", type=float, default=0.5, help="time budget per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="also write the JSON results to this file")
+    opts = parser.parse_args()
+
+    text = json.dumps(run(opts.sizes, opts.seconds, opts.seed), indent=2)
+    if opts.out:
+        Path(opts.out).write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
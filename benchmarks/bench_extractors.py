@@ -0,0 +1,102 @@
+# benchmarks/bench_extractors.py
+"""
+Throughput (MB/s) of extract_action_items against the previous
+line-splitting implementation, on a long synthetic transcript.
+Both must return identical items; this is checked before timing.
+
+Run from the repo root:  python -m benchmarks.bench_extractors
+"""
+import argparse
+import json
+import random
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.extractors import DATE_ISO_RE, EMAIL_RE, extract_action_items
+
+REFERENCE_KEYWORDS = re.compile(
+    r'\b(action|todo|assign|to do|we will|please|follow up|follow-up|task)\b',
+    re.I
+)
+
+
+def reference_extract_action_items(transcript):
+    # The implementation before the single-pass scanner, kept for comparison.
+    results = []
+    lines = [line.strip() for line in transcript.split("\n") if line.strip()]
+    for ln in lines:
+        if REFERENCE_KEYWORDS.search(ln):
+            owner = None
+            due = None
+            email_match = EMAIL_RE.search(ln)
+            if email_match:
+                owner = email_match.group(1)
+            if not owner:
+                name_pattern = re.search(r'([A-Z][a-z]{1,20})\s+(will|to)\b', ln)
+                if name_pattern:
+                    owner = name_pattern.group(1) + "@example.com"
+            date_match = DATE_ISO_RE.search(ln)
+            if date_match:
+                due = date_match.group(1)
+            elif re.search(r'next week', ln, re.I):
+                due = datetime.utcnow().date().isoformat()
+            results.append({"task": ln, "owner": owner, "due": due, "notes": ""})
+    return results
+
+
+CHATTER = [
+    "Alice: Thanks everyone for joining, let's get started.",
+    "Bob: The numbers from last quarter look solid overall.",
+    "Carol: I think the customer feedback was mostly positive.",
+    "David: Can you share your screen for a second?",
+    "Alice: Sure, one moment while I find the right window.",
+    "Bob:   we talked about this in the previous sync as well.  ",
+    "",
+]
+
+
+def make_transcript(target_bytes: int, action_ratio: float = 0.2, seed: int = 7):
+    rng = random.Random(seed)
+    actions = Path("data/sample_transcript.txt").read_text().splitlines()
+    lines, size = [], 0
+    while size < target_bytes:
+        line = rng.choice(actions) if rng.random() < action_ratio else rng.choice(CHATTER)
+        if rng.random() < 0.05:
+            line += "\r"
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
+
+
+def throughput(fn, text, seconds):
+    runs = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        fn(text)
+        runs += 1
+    elapsed = time.perf_counter() - start
+    return runs * len(text.encode("utf-8")) / elapsed / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=4.0, help="transcript size in MB")
+    parser.add_argument("--seconds", type=float, default=3.0, help="time budget per implementation")
+    opts = parser.parse_args()
+
+    results = []
+    for ratio in (0.05, 0.2, 0.5):
+        text = make_transcript(int(opts.mb * 1e6), action_ratio=ratio)
+        assert extract_action_items(text) == reference_extract_action_items(text)
+        before = throughput(reference_extract_action_items, text, opts.seconds)
+        after = throughput(extract_action_items, text, opts.seconds)
+        results.append({"action_ratio": ratio, "mb": opts.mb, "before_mb_s": round(before, 1),
+                        "after_mb_s": round(after, 1), "speedup": round(after / before, 2)})
+        print(f"action lines {ratio:4.0%}: before {before:6.1f} MB/s  after {after:6.1f} MB/s  x{after / before:.2f}")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/bench_reports.py
+"""
+Reports-per-second for DOCX and PDF rendering, cold vs warm.
+
+cold: a fresh ReportRenderer per report, i.e. styles, fonts and the base
+      DOCX document are rebuilt every time (what every report paid before
+      the renderer was shared).
+warm: one ReportRenderer reused across reports (what ReportTool does now).
+
+Run from the repo root:  python -m benchmarks.bench_reports
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from src.tools.report_tool import ReportRenderer
+
+
+class _ColdRenderer(ReportRenderer):
+    def new_docx(self):
+        return self._make_docx_base()
+
+
+def make_report_inputs(n_actions: int):
+    actions, issues, notifications = [], [], []
+    for i in range(n_actions):
+        owner = f"owner{i % 7}@example.com"
+        actions.append({"task": f"Action: follow up on item {i} with the vendor", "owner": owner,
+                        "due": "2025-12-01", "notes": ""})
+        issues.append({"id": f"ISSUE-{i:08x}", "summary": actions[-1]["task"], "assignee": owner,
+                       "due": "2025-12-01"})
+        notifications.append({"issue": issues[-1]["id"], "email_status": "sent"})
+    summary = "- Reviewed the sales deck.\n- Agreed on the vendor timeline.\n- Budget check pending."
+    return ("bench-meeting", summary, actions, issues, notifications)
+
+
+def bench(fmt: str, warm: bool, args, out_dir: Path, seconds: float):
+    shared = ReportRenderer()
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        renderer = shared if warm else _ColdRenderer()
+        getattr(renderer, f"build_{fmt}")(out_dir / f"report.{fmt}", *args)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=2.0, help="time budget per measurement")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 200], help="action list lengths")
+    opts = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in opts.sizes:
+            args = make_report_inputs(n)
+            for fmt in ("docx", "pdf"):
+                cold = bench(fmt, False, args, Path(tmp), opts.seconds)
+                warm = bench(fmt, True, args, Path(tmp), opts.seconds)
+                results.append({"format": fmt, "actions": n, "cold_rps": round(cold, 1),
+                                "warm_rps": round(warm, 1), "speedup": round(warm / cold, 2)})
+                print(f"{fmt:4} actions={n:<4} cold={cold:7.1f}/s  warm={warm:7.1f}/s  x{warm / cold:.2f}")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmarks/bench_store_writers.py
+"""
+Append throughput on one shared file with 1..N writer processes, each
+running several threads (as uvicorn workers handling concurrent requests
+would). Appends go through utils.append_bytes, so bursts inside a process
+are group-committed with one fsync.
+
+Run from the repo root:
+    python -m benchmarks.bench_store_writers --processes 1 2 4 --threads 8
+"""
+import argparse
+import json
+import multiprocessing
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.utils import append_bytes
+
+RECORD = b'{"id": "ISSUE-00000000", "summary": "Send the notes", "assignee": "anu@example.com"}\n'
+
+
+def _writer(path, threads, per_thread, start):
+    def work():
+        for _ in range(per_thread):
+            append_bytes(path, RECORD)
+    start.wait()
+    pool = [threading.Thread(target=work) for _ in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+
+
+def run(processes, threads, per_thread):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in processes:
+            path = Path(tmp) / f"log-{n}.jsonl"
+            start = multiprocessing.Event()
+            procs = [multiprocessing.Process(target=_writer, args=(path, threads, per_thread, start))
+                     for _ in range(n)]
+            for p in procs:
+                p.start()
+            t = time.perf_counter()
+            start.set()
+            for p in procs:
+                p.join()
+            elapsed = time.perf_counter() - t
+            appends = n * threads * per_thread
+            assert path.stat().st_size == appends * len(RECORD)
+            results.append({"processes": n, "threads": threads, "appends": appends,
+                            "seconds": round(elapsed, 3), "appends_s": round(appends / elapsed)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", type=int, default=8, help="writer threads per process")
+    parser.add_argument("--appends", type=int, default=200, help="appends per thread")
+    opts = parser.parse_args()
+    print(json.dumps(run(opts.processes, opts.threads, opts.appends), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+# benchmarks/bench_suite.py
+"""
+End-to-end benchmark suite on seeded synthetic transcripts
+(benchmarks/synthetic.py) of several sizes.
+
+Measures extract_action_items, summarize_transcript, each report format,
+each store (memory json/sqlite, Jira, sheet, email) and the whole
+Coordinator.run_pipeline. Prints one JSON document; save it per commit and
+compare two runs with --compare.
+
+Run from the repo root:
+    python -m benchmarks.bench_suite --out bench-new.json
+    python -m benchmarks.bench_suite --compare bench-old.json bench-new.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import generate_transcript
+from src.extractors import extract_action_items, summarize_transcript
+
+SIZES = {"small": 2_000, "medium": 50_000, "large": 1_000_000}
+
+
+def measure(fn, seconds, min_runs=1):
+    """
+    Calls fn() repeatedly for about `seconds` (at least `min_runs` times).
+    """
+    times = []
+    start = time.perf_counter()
+    while len(times) < min_runs or time.perf_counter() - start < seconds:
+        t = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t)
+    return {"runs": len(times), "median_s": statistics.median(times), "min_s": min(times)}
+
+
+def bench_text(text, seconds):
+    mb = len(text.encode("utf-8")) / 1e6
+    out = {}
+    for name, fn in (("extract", extract_action_items), ("summarize", summarize_transcript)):
+        r = measure(lambda: fn(text), seconds)
+        r["mb_s"] = round(mb / r["median_s"], 2)
+        out[name] = r
+    return out
+
+
+def bench_reports(meeting_id, summary, actions, issues, notifications, out_dir, seconds):
+    from src.tools.report_tool import ReportTool
+    tool = ReportTool()
+    args = (meeting_id, summary, actions, issues, notifications)
+    out = {"txt": measure(lambda: tool._build_plain_text(*args), seconds)}
+    for fmt in ("docx", "pdf", "rtf"):
+        builder = getattr(tool, f"_build_{fmt}")
+        out[fmt] = measure(lambda: builder(out_dir / f"bench.{fmt}", *args), seconds)
+    return out
+
+
+def bench_stores(summary, actions, issues, text, work_dir, seconds):
+    from src.memory.memory_store import MemoryStore
+    from src.memory.sqlite_store import SqliteMemoryStore
+    from src.tools.email_tool import EmailTool
+    from src.tools.jira_tool import JiraTool
+    from src.tools.sheet_tool import SheetTool
+
+    meeting = {"transcript": text, "summary": summary, "actions": actions}
+    batch = [{"summary": a["task"][:140], "assignee": a["owner"], "due": a["due"]} for a in actions]
+    json_store = MemoryStore(work_dir / "mem-json")
+    sqlite_store = SqliteMemoryStore(work_dir / "mem-sqlite" / "meetings.db", import_from=None)
+    jira = JiraTool(log_path=work_dir / "jira.jsonl", export_path=work_dir / "jira.json")
+    sheet = SheetTool(path=work_dir / "sheet.csv")
+    email = EmailTool(path=work_dir / "email.jsonl", legacy_path=work_dir / "none.json")
+    rows = [[i["summary"], i["assignee"], i["due"]] for i in batch]
+    digests = {}
+    for issue in issues:
+        digests.setdefault(issue["assignee"] or "unassigned@example.com", []).append(issue)
+
+    json_store.store_meeting("probe", meeting)
+    sqlite_store.store_meeting("probe", meeting)
+    seq = iter(range(10 ** 9))
+    return {
+        "memory_json": measure(lambda: json_store.store_meeting(f"m{next(seq)}", meeting), seconds),
+        "memory_json_load": measure(lambda: json_store.load_meeting("probe")["actions"], seconds),
+        "memory_sqlite": measure(lambda: sqlite_store.store_meeting(f"m{next(seq)}", meeting), seconds),
+        "memory_sqlite_load": measure(lambda: sqlite_store.load_meeting("probe")["actions"], seconds),
+        "jira": measure(lambda: jira.create_issues(batch), seconds),
+        "sheet": measure(lambda: sheet.append_rows(rows), seconds),
+        "email": measure(lambda: email.send_digests(digests), seconds),
+    }
+
+
+def bench_pipeline(text, seconds):
+    from src.coordinator import Coordinator
+    coord = Coordinator()
+    seq = iter(range(10 ** 9))
+    return measure(lambda: coord.run_pipeline(text, f"bench-{next(seq)}"), seconds)
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, seconds, seed, action_density, email_ratio):
+    results = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "params": {"seconds": seconds, "seed": seed, "action_density": action_density,
+                   "email_ratio": email_ratio},
+        "sizes": {},
+    }
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        for label in sizes:
+            text = generate_transcript(SIZES[label], action_density=action_density,
+                                       email_ratio=email_ratio, seed=seed)
+            actions = extract_action_items(text)
+            summary = summarize_transcript(text)
+            issues = [{"id": f"ISSUE-{i:08x}", "summary": a["task"][:140], "assignee": a["owner"],
+                       "due": a["due"]} for i, a in enumerate(actions)]
+            notifications = [{"issue": i, "email_status": "sent"} for i in issues]
+            work_dir = Path(tmp) / label
+            work_dir.mkdir()
+
+            entry = {"bytes": len(text.encode("utf-8")), "action_items": len(actions)}
+            entry.update(bench_text(text, seconds))
+            # The pipeline and tools use paths relative to the working
+            # directory, so everything below writes under the temp dir.
+            os.chdir(work_dir)
+            try:
+                with contextlib.redirect_stdout(devnull):
+                    entry["reports"] = bench_reports(label, summary, actions, issues, notifications,
+                                                     work_dir, seconds)
+                    entry["stores"] = bench_stores(summary, actions, issues, text, work_dir, seconds)
+                    entry["pipeline"] = bench_pipeline(text, seconds)
+            finally:
+                os.chdir(cwd)
+            results["sizes"][label] = entry
+            print(f"{label:6} {entry['bytes']:>9} bytes  extract {entry['extract']['mb_s']:7.2f} MB/s  "
+                  f"pipeline {entry['pipeline']['median_s'] * 1000:8.1f} ms", file=sys.stderr)
+    return results
+
+
+def _flatten(node, prefix=""):
+    # {"sizes": {"small": {"extract": {"median_s": ...}}}} -> {"small.extract": ...}
+    out = {}
+    for key, value in node.items():
+        if isinstance(value, dict):
+            if "median_s" in value:
+                out[prefix + key] = value["median_s"]
+            else:
+                out.update(_flatten(value, prefix + key + "."))
+    return out
+
+
+def compare(old_path, new_path, threshold):
+    old = _flatten(json.loads(Path(old_path).read_text())["sizes"])
+    new = _flatten(json.loads(Path(new_path).read_text())["sizes"])
+    rows = []
+    for key in sorted(old.keys() & new.keys()):
+        ratio = new[key] / old[key] if old[key] else float("inf")
+        flag = "SLOWER" if ratio > 1 + threshold else ("faster" if ratio < 1 - threshold else "")
+        rows.append({"benchmark": key, "old_s": old[key], "new_s": new[key], "ratio": round(ratio, 3)})
+        print(f"{key:36} {old[key] * 1000:10.3f} ms -> {new[key] * 1000:10.3f} ms  x{ratio:6.2f} {flag}",
+              file=sys.stderr)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--seconds", type=float, default=1.0, help="time budget per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--action-density", type=float, default=0.2)
+    parser.add_argument("--email-ratio", type=float, default=0.5)
+    parser.add_argument("--out", help="also write the JSON results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                        help="compare two saved result files instead of running")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative change flagged by --compare")
+    opts = parser.parse_args()
+
+    if opts.compare:
+        print(json.dumps(compare(*opts.compare, opts.threshold)))
+        return
+
+    results = run(opts.sizes, opts.seconds, opts.seed, opts.action_density, opts.email_ratio)
+    text = json.dumps(results, indent=2)
+    if opts.out:
+        Path(opts.out).write_text(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# benchmarks/synthetic.py
+"""
+Seeded synthetic meeting transcripts for benchmarks.
+
+Action lines are built from the phrasing of data/sample_transcript.txt
+("Action: <Name> (<email>) will ...", "Please assign someone to ...",
+"Todo: ...", "We will ... by <date>") with varying owners, contact
+styles and date formats; the rest is meeting chatter. The same arguments
+always produce the same transcript.
+"""
+import random
+from pathlib import Path
+
+SAMPLE_TRANSCRIPT = Path(__file__).resolve().parents[1] / "data" / "sample_transcript.txt"
+
+SPEAKERS = ["Alice", "Bob", "Carol", "David", "Priya", "Rohit", "Anu", "Mei", "Omar", "Sara"]
+
+TASKS = [
+    "deliver the sales deck", "prepare the slides", "check the budget", "schedule follow-up meeting",
+    "confirm the vendor details", "review the contract draft", "update the roadmap",
+    "send the meeting notes", "book the venue", "share the hiring plan",
+]
+
+# Templates in the style of data/sample_transcript.txt. {owner} is a name,
+# optionally followed by an email in parentheses.
+ACTION_TEMPLATES = [
+    "Action: {owner} will {task}{due}.",
+    "{owner} to {task}{due}.",
+    "We will {task}{due}.",
+    "Please assign someone to {task}{due}.",
+    "Todo: {task}{due}.",
+    "Task: {task}, owner {owner}{due}.",
+    "Follow-up: {owner} will {task}{due}.",
+]
+
+CHATTER = [
+    "Thanks everyone for joining, let's get started.",
+    "The numbers from last quarter look solid overall.",
+    "I think the customer feedback was mostly positive.",
+    "Can you share your screen for a second?",
+    "Sure, one moment while I find the right window.",
+    "We talked about this in the previous sync as well.",
+    "Let's park that and come back to it later.",
+    "The pilot went better than expected in the north region.",
+    "I agree, the onboarding flow needs another look.",
+    "Does anyone have questions on the metrics so far?",
+]
+
+DATE_FORMATS = ("iso", "next_week", "text", "none")
+
+
+def sample_lines():
+    # The sample transcript's own lines are mixed in verbatim.
+    return [ln for ln in SAMPLE_TRANSCRIPT.read_text().splitlines() if ln.strip()]
+
+
+def _due(rng, date_formats):
+    fmt = rng.choice(date_formats)
+    day = rng.randint(1, 28)
+    month = rng.randint(1, 12)
+    if fmt == "iso":
+        return f" by 2025-{month:02d}-{day:02d}"
+    if fmt == "next_week":
+        return " next week"
+    if fmt == "text":
+        # not recognised by the extractor; exercises the misses
+        return rng.choice([f" by {day}/{month}/2025", f" by March {day}", " by Friday"])
+    return ""
+
+
+def _owner(rng, email_ratio):
+    name = rng.choice(SPEAKERS)
+    if rng.random() < email_ratio:
+        return f"{name} ({name.lower()}@example.com)"
+    return name
+
+
+def generate_transcript(target_bytes=20_000, action_density=0.2, email_ratio=0.5,
+                        date_formats=DATE_FORMATS, seed=0):
+    """
+    Returns a transcript of about `target_bytes` bytes in which roughly
+    `action_density` of the lines are action items. `email_ratio` is the
+    share of named owners given with an email address; due dates are drawn
+    from `date_formats` (a subset of DATE_FORMATS).
+    """
+    rng = random.Random(seed)
+    samples = sample_lines()
+    lines, size = [], 0
+    while size < target_bytes:
+        speaker = rng.choice(SPEAKERS)
+        r = rng.random()
+        if r < action_density * 0.1:
+            line = rng.choice(samples)
+        elif r < action_density:
+            text = rng.choice(ACTION_TEMPLATES).format(
+                owner=_owner(rng, email_ratio), task=rng.choice(TASKS), due=_due(rng, date_formats))
+            line = f"{speaker}: {text}"
+        else:
+            line = f"{speaker}: {rng.choice(CHATTER)}"
+        lines.append(line)
+        size += len(line) + 1
+    return "\n".join(lines)
@@ -1,49 +1,44 @@
 # evaluate.py
-import json
-from src.extractors import extract_action_items
-
-def compare_actions(pred, gold):
-    """
-    Compare predicted vs gold actions.
-    Measures:
-        - owner correctness
-        - due date correctness
-    """
-
-    tp_owner = fp_owner = fn_owner = 0
-    tp_due = fp_due = fn_due = 0
+"""
+Scores extract_action_items against labelled meetings.
 
-    # Gold lists
-    gold_owners = [g.get("owner") for g in gold if g.get("owner")]
-    gold_dues = [g.get("due") for g in gold if g.get("due")]
+Labels are either a JSON array or JSONL (one {"transcript", "actions"}
+object per line) and are streamed, never loaded whole. Meetings are scored
+in a process pool, a bounded window of batches at a time, so memory stays
+flat however large the corpus is.
 
-    # Pred lists
-    pred_owners = [p.get("owner") for p in pred if p.get("owner")]
-    pred_dues = [p.get("due") for p in pred if p.get("due")]
-
-    # Compare owners
-    for owner in pred_owners:
-        if owner in gold_owners:
-            tp_owner += 1
-        else:
-            fp_owner += 1
+    python evaluate.py [labels_file] [--workers N] [--batch-size N] [--json]
+"""
+import argparse
+import json
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain, islice
 
-    for owner in gold_owners:
-        if owner not in pred_owners:
-            fn_owner += 1
+from src.extractors import extract_action_items
 
-    # Compare due dates
-    for due in pred_dues:
-        if due in gold_dues:
-            tp_due += 1
-        else:
-            fp_due += 1
+FIELDS = ("owner", "due")
+FIELD_NAMES = {"owner": "Owner Extraction", "due": "Due Date Extraction"}
+READ_CHUNK = 1 << 16
+_SEPARATORS_RE = re.compile(r"[\s,]*")
 
-    for due in gold_dues:
-        if due not in pred_dues:
-            fn_due += 1
 
-    return tp_owner, fp_owner, fn_owner, tp_due, fp_due, fn_due
+def compare_actions(pred, gold, fields=FIELDS):
+    """
+    Compare predicted vs gold actions per field (owner and due date by
+    default) as multisets: a value predicted twice only counts twice if it
+    is labelled twice. Returns {field: (tp, fp, fn)}.
+    """
+    counts = {}
+    for field in fields:
+        pred_values = Counter(p.get(field) for p in pred if p.get(field))
+        gold_values = Counter(g.get(field) for g in gold if g.get(field))
+        tp = sum((pred_values & gold_values).values())
+        counts[field] = (tp, sum(pred_values.values()) - tp, sum(gold_values.values()) - tp)
+    return counts
 
 
 def safe_pr(tp, fp, fn):
@@ -53,35 +48,166 @@ def safe_pr(tp, fp, fn):
     return {"precision": precision, "recall": recall, "f1": f1}
 
 
-def evaluate(labels_file="data/labels.json"):
+def iter_labels(labels_file):
+    """
+    Yields labelled meetings one at a time from a JSON array or a JSONL file.
+    """
     with open(labels_file, "r", encoding="utf-8") as f:
-        labels = json.load(f)
-
-    owner_tp = owner_fp = owner_fn = 0
-    due_tp = due_fp = due_fn = 0
-
-    for item in labels:
+        head = f.read(READ_CHUNK)
+        start = head.lstrip()
+        if start.startswith("["):
+            yield from _iter_json_array(f, head[len(head) - len(start) + 1:])
+            return
+        # Only the new chunk is searched for a newline; text after the last
+        # one waits in `pending` until a chunk completes it.
+        pending = []
+        for chunk in chain([head], iter(lambda: f.read(READ_CHUNK), "")):
+            cut = chunk.rfind("\n") + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            lines = "".join(pending).split("\n")
+            yield from (json.loads(line) for line in lines if line.strip())
+            pending = [chunk[cut:]]
+        rest = "".join(pending)
+        if rest.strip():
+            yield json.loads(rest)
+
+
+def _iter_json_array(f, buf):
+    # Decode one element at a time with raw_decode, reading more input only
+    # when the buffered text ends inside an element. Each read is at least
+    # as long as the partial element, so large elements stay linear.
+    decoder = json.JSONDecoder()
+    pos = 0
+    eof = False
+    while True:
+        pos = _SEPARATORS_RE.match(buf, pos).end()
+        if pos < len(buf):
+            if buf[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield item
+                continue
+        elif eof:
+            raise ValueError("unterminated JSON array")
+        more = f.read(max(READ_CHUNK, len(buf) - pos))
+        buf = buf[pos:] + more
+        pos = 0
+        eof = not more
+
+
+def _batches(items, size):
+    it = iter(items)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def score_batch(batch, fields=FIELDS):
+    """
+    Scores a list of labelled meetings. Returns (counts, meetings, bytes,
+    extraction seconds), counts being {field: [tp, fp, fn]}.
+    """
+    counts = {field: [0, 0, 0] for field in fields}
+    n_bytes = 0
+    extract_s = 0.0
+    for item in batch:
         transcript = item["transcript"]
-        gold = item["actions"]
-
+        n_bytes += len(transcript.encode("utf-8"))
+        start = time.perf_counter()
         pred = extract_action_items(transcript)
+        extract_s += time.perf_counter() - start
+        for field, triple in compare_actions(pred, item.get("actions") or [], fields).items():
+            for i, n in enumerate(triple):
+                counts[field][i] += n
+    return counts, len(batch), n_bytes, extract_s
 
-        (tp_o, fp_o, fn_o, tp_d, fp_d, fn_d) = compare_actions(pred, gold)
-
-        owner_tp += tp_o
-        owner_fp += fp_o
-        owner_fn += fn_o
-        due_tp += tp_d
-        due_fp += fp_d
-        due_fn += fn_d
-
-    owner_scores = safe_pr(owner_tp, owner_fp, owner_fn)
-    due_scores = safe_pr(due_tp, due_fp, due_fn)
 
-    print("\n### EVALUATION RESULTS ###")
-    print("Owner Extraction:", owner_scores)
-    print("Due Date Extraction:", due_scores)
+def evaluate(labels_file="data/labels.json", workers=None, batch_size=256, fields=FIELDS, quiet=False):
+    """
+    Returns {"fields": {field: {precision, recall, f1, tp, fp, fn}},
+    "meetings", "bytes", "seconds", "meetings_per_s", "mb_per_s",
+    "extract_mb_per_s"}. workers=0 scores in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    totals = {field: [0, 0, 0] for field in fields}
+    meetings = n_bytes = 0
+    extract_s = 0.0
+
+    def add(result):
+        nonlocal meetings, n_bytes, extract_s
+        counts, n, b, s = result
+        for field, triple in counts.items():
+            for i, v in enumerate(triple):
+                totals[field][i] += v
+        meetings += n
+        n_bytes += b
+        extract_s += s
+
+    start = time.perf_counter()
+    batches = _batches(iter_labels(labels_file), batch_size)
+    if workers <= 0:
+        for batch in batches:
+            add(score_batch(batch, fields))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Keep at most two batches per worker in flight.
+            running = set()
+            for batch in batches:
+                if len(running) >= 2 * workers:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        add(future.result())
+                running.add(pool.submit(score_batch, batch, fields))
+            for future in running:
+                add(future.result())
+    elapsed = time.perf_counter() - start
+
+    results = {
+        "fields": {
+            field: dict(safe_pr(*totals[field]), tp=totals[field][0], fp=totals[field][1], fn=totals[field][2])
+            for field in fields
+        },
+        "meetings": meetings,
+        "bytes": n_bytes,
+        "seconds": elapsed,
+        "meetings_per_s": meetings / elapsed if elapsed else 0.0,
+        "mb_per_s": n_bytes / 1e6 / elapsed if elapsed else 0.0,
+        "extract_mb_per_s": n_bytes / 1e6 / extract_s if extract_s else 0.0,
+    }
+
+    if not quiet:
+        print("\n### EVALUATION RESULTS ###")
+        for field in fields:
+            scores = {k: results["fields"][field][k] for k in ("precision", "recall", "f1")}
+            print(f"{FIELD_NAMES.get(field, field)}:", scores)
+        print(f"Meetings: {meetings} in {elapsed:.2f}s ({results['meetings_per_s']:.1f}/s, "
+              f"{results['mb_per_s']:.2f} MB/s; extraction alone {results['extract_mb_per_s']:.2f} MB/s)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("labels_file", nargs="?", default="data/labels.json")
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (0 = in-process)")
+    parser.add_argument("--batch-size", type=int, default=256, help="meetings per task")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    opts = parser.parse_args()
+
+    results = evaluate(opts.labels_file, workers=opts.workers, batch_size=opts.batch_size, quiet=opts.json)
+    if opts.json:
+        print(json.dumps(results))
 
 
 if __name__ == "__main__":
-    evaluate()
\ No newline at end of file
+    main()
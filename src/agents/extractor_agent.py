@@ -1,5 +1,6 @@
 # src/agents/extractor_agent.py
-from ..extractors import extract_action_items
+from ..extractors import IncrementalExtractor, extract_action_items
+from ..spool import iter_transcript_chunks
 
 class ExtractorAgent:
     """
@@ -7,3 +8,12 @@ class ExtractorAgent:
     """
     def run(self, transcript: str):
         return extract_action_items(transcript)
+
+    def run_file(self, path):
+        # Same items for a transcript file, read a chunk at a time
+        extractor = IncrementalExtractor()
+        items = []
+        for chunk in iter_transcript_chunks(path):
+            items.extend(extractor.feed(chunk))
+        items.extend(extractor.close())
+        return items
@@ -1,6 +1,10 @@
 # src/agents/loop_agent.py
 import asyncio
-from ..memory.memory_store import MemoryStore
+import heapq
+import itertools
+from datetime import date, datetime, timedelta
+from ..memory.memory_store import open_memory_store
+from ..tools.email_tool import EmailTool
 from ..utils import timestamp
 
 class LoopAgent:
@@ -8,33 +12,246 @@ class LoopAgent:
     Long-running loop agent that periodically checks mem/ for meetings without 'followed_up'
     and simulates a follow-up/reminder action. Demonstrates long-running operations.
     Use `run_forever()` in an async context (or run it in a separate thread/process).
+    Each tick asks the store only for meetings still pending follow-up; with the
+    sqlite backend that is an indexed query, independent of history size.
+
+    `run_events()` is the change-driven alternative: it reacts to
+    store_meeting() notifications (and, with `watch_interval`, to writes by
+    other processes) and only processes the meetings that changed.
     """
-    def __init__(self, interval_seconds: int = 30):
+    def __init__(self, interval_seconds: int = 30, mem=None, workers: int = 4):
         self.interval = interval_seconds
-        self.mem = MemoryStore()
+        self.mem = mem or open_memory_store()
+        self.workers = max(1, workers)
+
+    def tick(self):
+        """
+        Adds a follow-up to every pending meeting; returns their ids.
+        """
+        return [m for m in self.mem.pending_followups() if self.follow_up(m)]
+
+    def follow_up(self, meeting_id):
+        added = self.mem.mark_followed_up(meeting_id, {
+            "at": timestamp(),
+            "note": "Auto follow-up generated by LoopAgent"
+        })
+        if added:
+            print(f"[LoopAgent] added follow-up for {meeting_id}")
+        return added
 
     async def run_forever(self):
         print("[LoopAgent] started run_forever loop (interval {}s)".format(self.interval))
         while True:
             try:
-                meetings = self.mem.list_meetings()
-                for fname in meetings:
-                    # fname includes the .json extension; strip it for meeting_id
-                    meeting_id = fname.replace(".json", "")
-                    data = self.mem.load_meeting(meeting_id)
-                    if not data:
-                        continue
-
-                    # If we haven't added a follow-up marker, add one and save
-                    if not data.get("followed_up"):
-                        data["followed_up"] = True
-                        data.setdefault("reminders", []).append({
-                            "at": timestamp(),
-                            "note": "Auto follow-up generated by LoopAgent"
-                        })
-                        self.mem.store_meeting(meeting_id, data)
-                        print(f"[LoopAgent] added follow-up for {meeting_id}")
+                await asyncio.to_thread(self.tick)
             except Exception as e:
                 # never crash the loop; log error and continue
                 print(f"[LoopAgent] encountered error: {e}")
             await asyncio.sleep(self.interval)
+
+    async def run_events(self, watch_interval: float = None):
+        """
+        Event-driven loop. Meetings reported by the store's change feed are
+        put in a dirty set and handled by `self.workers` concurrent workers;
+        nothing is scanned while idle. Pass `watch_interval` (seconds) when
+        other processes write to the same store: their changes are then
+        picked up with the store's cheap `changed_since()` check.
+        """
+        print(f"[LoopAgent] started event loop ({self.workers} workers)")
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        dirty = set()
+
+        def mark_dirty(meeting_id):
+            if meeting_id not in dirty:
+                dirty.add(meeting_id)
+                queue.put_nowait(meeting_id)
+
+        unsubscribe = self.mem.subscribe(lambda m: loop.call_soon_threadsafe(mark_dirty, m))
+        tasks = [asyncio.create_task(self._worker(queue, dirty)) for _ in range(self.workers)]
+        try:
+            # Catch up once on whatever was stored before we subscribed.
+            if watch_interval is not None:
+                _, cursor = await asyncio.to_thread(self.mem.changed_since, None)
+            for meeting_id in await asyncio.to_thread(self.mem.pending_followups):
+                mark_dirty(meeting_id)
+
+            if watch_interval is None:
+                await asyncio.gather(*tasks)
+            while True:
+                await asyncio.sleep(watch_interval)
+                try:
+                    changed, cursor = await asyncio.to_thread(self.mem.changed_since, cursor)
+                except Exception as e:
+                    print(f"[LoopAgent] encountered error: {e}")
+                    continue
+                for meeting_id in changed:
+                    mark_dirty(meeting_id)
+        finally:
+            unsubscribe()
+            for t in tasks:
+                t.cancel()
+
+    async def run_reminders(self, lead_days: int = 1):
+        """
+        Runs a ReminderScheduler over this agent's store.
+        """
+        await ReminderScheduler(self.mem, lead_days=lead_days).run()
+
+    async def _worker(self, queue, dirty):
+        while True:
+            meeting_id = await queue.get()
+            dirty.discard(meeting_id)
+            try:
+                await asyncio.to_thread(self.follow_up, meeting_id)
+            except Exception as e:
+                # never crash the loop; log error and continue
+                print(f"[LoopAgent] encountered error: {e}")
+
+
+class ReminderScheduler:
+    """
+    Emails an action item's owner `lead_days` before its due date.
+    Open items (with an owner and a due date, not yet reminded) are loaded
+    once into a min-heap keyed by fire time; the scheduler sleeps until the
+    earliest one and re-schedules a meeting's items when store_meeting()
+    reports it changed. A reminder counts as sent once it is in the email
+    log, which is appended before the meeting's "reminders" list is updated
+    and is not overwritten when a meeting is stored again, so reminders are
+    not sent twice, also after a restart. Reminders whose send fails stay
+    queued.
+    """
+    def __init__(self, mem, email=None, lead_days: int = 1, now=datetime.utcnow):
+        self.mem = mem
+        self.email = email or EmailTool()
+        self.lead = timedelta(days=lead_days)
+        self.now = now
+        self._heap = []
+        self._seq = itertools.count()
+        self._generation = {}
+        self._sent = None  # (meeting_id, action index, due) already emailed
+
+    def __len__(self):
+        return len(self._heap)
+
+    def load(self):
+        self._load_sent()
+        for meeting_id in self.mem.meeting_ids():
+            self.schedule_meeting(meeting_id)
+
+    def schedule_meeting(self, meeting_id, data=None):
+        """
+        (Re)schedules every open item of a meeting. Entries queued for an
+        older version of the meeting are skipped when they come up.
+        """
+        data = data if data is not None else self.mem.load_meeting(meeting_id)
+        generation = self._generation.get(meeting_id, 0) + 1
+        self._generation[meeting_id] = generation
+        if not data:
+            return
+
+        self._load_sent()
+        for r in data.get("reminders", []):
+            if r.get("kind") == "due":
+                self._sent.add((meeting_id, r.get("action"), r.get("due")))
+        now = self.now()
+        for index, action in enumerate(data.get("actions") or []):
+            owner, due = action.get("owner"), action.get("due")
+            if not owner or not due or (meeting_id, index, due) in self._sent:
+                continue
+            try:
+                due_at = datetime.combine(date.fromisoformat(due), datetime.min.time())
+            except ValueError:
+                continue
+            if due_at + timedelta(days=1) <= now:
+                continue  # already overdue
+            heapq.heappush(self._heap, (due_at - self.lead, next(self._seq), meeting_id, generation, index, action))
+
+    def next_fire_at(self):
+        return self._heap[0][0] if self._heap else None
+
+    def fire_due(self):
+        """
+        Sends every reminder whose time has come, in one email-log append.
+        Returns the reminders sent. If sending fails they are queued again
+        and the error is raised.
+        """
+        self._load_sent()
+        now = self.now()
+        entries, ready = [], []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            _, _, meeting_id, generation, index, action = entry
+            if self._generation.get(meeting_id) != generation:
+                continue
+            if (meeting_id, index, action["due"]) in self._sent:
+                continue
+            entries.append(entry)
+            ready.append({"to": action["owner"], "meeting_id": meeting_id, "action": index,
+                          "task": action.get("task"), "due": action["due"]})
+        if not ready:
+            return []
+
+        try:
+            self.email.send_reminders(ready)
+        except BaseException:
+            for entry in entries:
+                heapq.heappush(self._heap, entry)
+            raise
+        self._sent.update((r["meeting_id"], r["action"], r["due"]) for r in ready)
+
+        # The email log already has them; the meeting's list is for display.
+        for r in ready:
+            try:
+                self.mem.add_reminder(r["meeting_id"], {
+                    "at": timestamp(),
+                    "kind": "due",
+                    "action": r["action"],
+                    "due": r["due"],
+                    "note": f"Due-date reminder sent to {r['to']}"
+                })
+            except Exception as e:
+                print(f"[ReminderScheduler] could not record reminder for {r['meeting_id']}: {e}")
+        return ready
+
+    def _load_sent(self):
+        if self._sent is None:
+            self._sent = {
+                (e.get("meeting_id"), e.get("action"), e.get("due"))
+                for e in self.email.entries() if e.get("kind") == "due_reminder"
+            }
+
+    async def run(self):
+        print(f"[ReminderScheduler] started (lead {self.lead.days} days)")
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        changed = set()
+
+        def on_change(meeting_id):
+            changed.add(meeting_id)
+            wake.set()
+
+        unsubscribe = self.mem.subscribe(lambda m: loop.call_soon_threadsafe(on_change, m))
+        try:
+            await asyncio.to_thread(self.load)
+            while True:
+                try:
+                    while changed:
+                        await asyncio.to_thread(self.schedule_meeting, changed.pop())
+                    await asyncio.to_thread(self.fire_due)
+                except Exception as e:
+                    # never crash the loop; log error and continue
+                    print(f"[ReminderScheduler] encountered error: {e}")
+
+                # Sleep until the earliest reminder or the next change.
+                fire_at = self.next_fire_at()
+                timeout = None if fire_at is None else max(0.0, (fire_at - self.now()).total_seconds())
+                wake.clear()
+                if changed:
+                    continue
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            unsubscribe()
@@ -4,21 +4,49 @@ from ..tools.email_tool import EmailTool
 class NotifierAgent:
     """
     Agent responsible for notifying owners by email (simulated).
+    In digest mode (the default) each owner gets a single email per meeting
+    listing all of their issues; otherwise one email is sent per issue.
     """
-    def __init__(self):
+    def __init__(self, digest: bool = True):
         self.email = EmailTool()
+        self.digest = digest
 
-    def run(self, created_issues):
-        results = []
+    def run(self, created_issues, meeting_id=None):
+        return self.run_many([(created_issues, meeting_id)])[0]
 
-        for issue in created_issues:
-            to_email = issue.get("assignee")
+    def run_many(self, meetings):
+        """
+        Notifies owners for several meetings with one email-log append.
+        `meetings` is a list of (created_issues, meeting_id) pairs; returns
+        one list of notification results per meeting.
+        """
+        assigned = [
+            (meeting_id, [issue for issue in issues if issue.get("assignee")])
+            for issues, meeting_id in meetings
+        ]
 
-            if to_email:
-                status = self.email.send_assignment(to_email, issue)
-                results.append({
-                    "issue": issue["id"],
-                    "email_status": status["status"]
-                })
+        if self.digest:
+            batches = []
+            for meeting_id, issues in assigned:
+                digests = {}
+                for issue in issues:
+                    digests.setdefault(issue["assignee"], []).append(issue)
+                batches.append((meeting_id, digests))
+            sent = self.email.send_digest_batches(batches)
+            statuses = [
+                [by_owner[issue["assignee"]] for issue in issues]
+                for (_, issues), by_owner in zip(assigned, sent)
+            ]
+        else:
+            sent = iter(self.email.send_assignments(
+                [(issue["assignee"], issue) for _, issues in assigned for issue in issues]
+            ))
+            statuses = [[next(sent) for _ in issues] for _, issues in assigned]
 
-        return results
+        return [
+            [
+                {"issue": issue["id"], "email_status": status["status"]}
+                for issue, status in zip(issues, meeting_statuses)
+            ]
+            for (_, issues), meeting_statuses in zip(assigned, statuses)
+        ]
@@ -1,9 +1,19 @@
 # src/agents/summarizer_agent.py
-from ..extractors import summarize_transcript
+from ..summarizers import summarize, summarize_lines
+from ..spool import iter_transcript_lines
 
 class SummarizerAgent:
     """
-    Agent that produces a compact summary.
+    Agent that produces a compact summary. `strategy` is "lead" (first
+    sentences) or "centroid" (TF-IDF centroid ranking); by default it is
+    taken from M2A_SUMMARIZER.
     """
+    def __init__(self, strategy: str = None):
+        self.strategy = strategy
+
     def run(self, transcript: str):
-        return summarize_transcript(transcript)
\ No newline at end of file
+        return summarize(transcript, self.strategy)
+
+    def run_file(self, path):
+        # Same summary for a transcript file, read line by line
+        return summarize_lines(iter_transcript_lines(path), self.strategy)
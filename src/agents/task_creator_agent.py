@@ -6,37 +6,48 @@ from ..utils import timestamp
 class TaskCreatorAgent:
     """
     Agent that creates tasks in Jira (local mock) and logs them to a sheet (CSV).
+    All issues and sheet rows of a call are committed with one write per store.
     """
     def __init__(self):
         self.jira = JiraTool()
         self.sheet = SheetTool()
 
     def run(self, actions: list):
-        created_issues = []
+        return self.run_many([actions])[0]
 
-        for action in actions:
-            title = action.get("task", "")[:140]
-            owner = action.get("owner")
-            due = action.get("due")
-            notes = action.get("notes", "")
+    def run_many(self, action_lists: list):
+        """
+        Creates the issues for several meetings at once; returns one list of
+        issues per entry of `action_lists`.
+        """
+        batch = []
+        for actions in action_lists:
+            for action in actions:
+                batch.append({
+                    "summary": action.get("task", "")[:140],
+                    "assignee": action.get("owner"),
+                    "due": action.get("due"),
+                    "description": action.get("notes", "")
+                })
 
-            # create issue in mock Jira
-            issue = self.jira.create_issue(
-                summary=title,
-                assignee=owner,
-                due=due,
-                description=notes
-            )
+        # create issues in mock Jira
+        created = self.jira.create_issues(batch)
 
-            # write to "sheet" (CSV)
-            self.sheet.append_row([
+        # write to "sheet" (CSV)
+        self.sheet.append_rows([
+            [
                 issue["id"],
-                title,
-                owner or "",
-                due or "",
+                issue["summary"],
+                issue["assignee"] or "",
+                issue["due"] or "",
                 timestamp()
-            ])
+            ]
+            for issue in created
+        ])
 
-            created_issues.append(issue)
-
-        return created_issues
\ No newline at end of file
+        results = []
+        start = 0
+        for actions in action_lists:
+            results.append(created[start:start + len(actions)])
+            start += len(actions)
+        return results
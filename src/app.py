@@ -1,12 +1,22 @@
 # src/app.py - FastAPI app with Netflix-style UI
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+import json
+import queue
+
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
 from pathlib import Path
+from typing import List, Optional
 
-from .coordinator import Coordinator
+from .coordinator import Coordinator, BATCH_PARALLELISM
+from .spool import TranscriptSpool
+from .extractors import IncrementalExtractor
+from .jobs import JobQueue
+from .roster import ROSTER_PATH, load_roster
+from . import metrics
 
 app = FastAPI(title="Meeting2Action – Enterprise Console (Local)")
 
@@ -14,9 +24,8 @@ app = FastAPI(title="Meeting2Action – Enterprise Console (Local)")
 reports_dir = Path("artifacts/reports")
 reports_dir.mkdir(parents=True, exist_ok=True)
 
-# Mount static and reports
+# Mount static files (reports are served by download_report below)
 app.mount("/static", StaticFiles(directory="static"), name="static")
-app.mount("/artifacts/reports", StaticFiles(directory=str(reports_dir)), name="reports")
 
 templates = Jinja2Templates(directory="templates")
 
@@ -25,6 +34,7 @@ class ParseRequest(BaseModel):
   meeting_id: str = "meeting-1"
 
 coord = Coordinator()
+jobs = JobQueue(coord)
 
 @app.get("/", response_class=HTMLResponse)
 def home(request: Request):
@@ -34,6 +44,193 @@ def home(request: Request):
 def health():
   return {"status": "ok"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics_endpoint():
+  # Prometheus text format; per process, so scrape each uvicorn worker.
+  return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
 @app.post("/parse_transcript/")
 def parse_transcript(req: ParseRequest):
-  return coord.run_pipeline(req.transcript, req.meeting_id)
\ No newline at end of file
+  return coord.run_pipeline(req.transcript, req.meeting_id)
+
+@app.post("/upload_transcript/")
+async def upload_transcript(request: Request, meeting_id: str = "meeting-1"):
+  """
+  /parse_transcript/ for large transcripts, sent as a multipart form (a
+  "file" field, optionally "meeting_id") or as the raw UTF-8 request body
+  (chunked transfer encoding works). The upload is spooled to disk as it
+  arrives and processed from there, so memory use stays flat however
+  long the transcript is.
+  """
+  form = None
+  try:
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+      # Starlette itself spools the file part to a temporary file past 1 MB
+      form = await request.form()
+      upload = form.get("file")
+      if upload is None or isinstance(upload, str):
+        raise HTTPException(status_code=422, detail='expected a "file" field')
+      meeting_id = form.get("meeting_id") or meeting_id
+      with TranscriptSpool(meeting_id) as spool:
+        await run_in_threadpool(_copy_to_spool, upload.file, spool)
+        return await _run_spooled(spool, meeting_id)
+    with TranscriptSpool(meeting_id) as spool:
+      async for chunk in request.stream():
+        spool.write(chunk)
+      return await _run_spooled(spool, meeting_id)
+  except UnicodeDecodeError:
+    raise HTTPException(status_code=422, detail="transcript is not valid UTF-8")
+  finally:
+    if form is not None:
+      await form.close()
+
+def _copy_to_spool(f, spool):
+  for chunk in iter(lambda: f.read(1 << 20), b""):
+    spool.write(chunk)
+
+async def _run_spooled(spool, meeting_id):
+  key = spool.close()
+  return await run_in_threadpool(coord.run_pipeline_file, spool.path, meeting_id, key)
+
+@app.post("/parse_transcripts/")
+async def parse_transcripts(request: Request, parallelism: int = BATCH_PARALLELISM):
+  """
+  Batch variant of /parse_transcript/. The body is either a JSON list of
+  ParseRequest objects or NDJSON (one ParseRequest per line, sent as
+  application/x-ndjson). Results are streamed back as NDJSON lines in
+  completion order, each tagged with its "index" in the request.
+  """
+  body = await request.body()
+  try:
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+      raw = [json.loads(line) for line in body.splitlines() if line.strip()]
+    else:
+      raw = json.loads(body)
+      if not isinstance(raw, list):
+        raise ValueError("expected a JSON list of transcripts")
+    reqs = [ParseRequest(**item) for item in raw]
+  except (ValueError, TypeError, ValidationError) as e:
+    raise HTTPException(status_code=422, detail=str(e))
+
+  parallelism = max(1, min(parallelism, BATCH_PARALLELISM))
+  results = coord.run_batch([(r.transcript, r.meeting_id) for r in reqs], parallelism=parallelism)
+  lines = (json.dumps(result) + "\n" for result in results)
+  return StreamingResponse(lines, media_type="application/x-ndjson")
+
+@app.get("/artifacts/reports/{filename}")
+def download_report(filename: str):
+  # DOCX/PDF/RTF are rendered on first download, then served from disk.
+  path = coord.reporter.render(filename)
+  if path is None:
+    raise HTTPException(status_code=404, detail="Report not found")
+  return FileResponse(path)
+
+@app.post("/jobs/", status_code=202)
+async def submit_job(req: ParseRequest):
+  # Only enqueues; the pipeline runs on the JobQueue workers.
+  try:
+    return jobs.submit(req.transcript, req.meeting_id)
+  except queue.Full:
+    raise HTTPException(status_code=503, detail="Job queue is full, retry later")
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+  job = jobs.get(job_id)
+  if job is None:
+    raise HTTPException(status_code=404, detail="Unknown job id")
+  return job
+
+@app.get("/search")
+def search(q: Optional[str] = None, field: Optional[List[str]] = Query(None), owner: Optional[str] = None,
+           due_from: Optional[str] = None, due_to: Optional[str] = None,
+           limit: int = Query(20, ge=1, le=200), offset: int = Query(0, ge=0)):
+  """
+  Ranked search over stored meetings and their action items, e.g.
+  /search?q=vendor+contract or /search?owner=rohit@example.com&due_to=2025-12-31.
+  `field` (repeatable) limits the words in `q` to transcript, summary,
+  task, owner or due.
+  """
+  try:
+    results = coord.mem.search(q, fields=field, owner=owner, due_from=due_from, due_to=due_to,
+                               limit=limit, offset=offset)
+  except ValueError as e:
+    raise HTTPException(status_code=422, detail=str(e))
+  return {"query": q, "results": results}
+
+@app.get("/issues")
+def list_issues(assignee: Optional[str] = None, due_from: Optional[str] = None, due_to: Optional[str] = None,
+                created_from: Optional[str] = None, created_to: Optional[str] = None,
+                limit: int = Query(50, ge=1, le=500), offset: int = Query(0, ge=0)):
+  """
+  Jira issues filtered by assignee, due-date range and creation time
+  (ISO dates, inclusive), paginated with limit/offset.
+  """
+  total, issues = coord.task_creator.jira.query_issues(
+    assignee=assignee, due_from=due_from, due_to=due_to,
+    created_from=created_from, created_to=created_to, limit=limit, offset=offset)
+  return {"total": total, "limit": limit, "offset": offset, "issues": issues}
+
+@app.get("/issues/export")
+def export_issues():
+  """
+  Refreshes artifacts/jira_issues.json (every issue as one JSON array) and
+  returns it.
+  """
+  path = coord.task_creator.jira.export_json()
+  return FileResponse(path, media_type="application/json")
+
+@app.post("/roster/reload")
+def reload_roster():
+  """
+  Recompiles the owner roster (M2A_ROSTER). Edits to the file are also
+  picked up on their own: the roster is recompiled when its mtime changes.
+  """
+  if not ROSTER_PATH:
+    raise HTTPException(status_code=404, detail="No roster configured (set M2A_ROSTER)")
+  try:
+    roster = load_roster(reload=True)
+  except (OSError, ValueError) as e:
+    raise HTTPException(status_code=422, detail=f"Cannot load roster: {e}")
+  return {"path": ROSTER_PATH, "people": roster.people, "names": len(roster)}
+
+@app.websocket("/ws/live/{meeting_id}")
+async def live_transcript(websocket: WebSocket, meeting_id: str):
+  """
+  Live extraction while a meeting is running. The client sends JSON
+  messages {"text": "<next transcript chunk>"} and finally {"final": true};
+  the server pushes {"type": "action_items", "items": [...]} whenever
+  completed lines contain new action items, then {"type": "done", ...}.
+  A malformed message is answered with {"type": "error", "detail": ...}
+  and otherwise ignored; a binary frame closes the socket (1003).
+  """
+  await websocket.accept()
+  extractor = IncrementalExtractor()
+  try:
+    while True:
+      message = await websocket.receive()
+      if message["type"] == "websocket.disconnect":
+        return
+      if message.get("text") is None:
+        await websocket.close(code=1003)
+        return
+      try:
+        msg = json.loads(message["text"])
+      except ValueError:
+        await websocket.send_json({"type": "error", "meeting_id": meeting_id, "detail": "Message is not valid JSON"})
+        continue
+      if not isinstance(msg, dict) or not isinstance(msg.get("text", ""), str):
+        await websocket.send_json({"type": "error", "meeting_id": meeting_id,
+                                   "detail": 'Expected {"text": "<string>"} or {"final": true}'})
+        continue
+      if msg.get("final"):
+        items = extractor.close()
+      else:
+        items = await run_in_threadpool(extractor.feed, msg.get("text", ""))
+      if items:
+        await websocket.send_json({"type": "action_items", "meeting_id": meeting_id, "items": items})
+      if msg.get("final"):
+        await websocket.send_json({"type": "done", "meeting_id": meeting_id, "total": extractor.items_found})
+        await websocket.close()
+        return
+  except WebSocketDisconnect:
+    return
@@ -1,10 +1,18 @@
 # src/coordinator.py
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from .agents.summarizer_agent import SummarizerAgent
 from .agents.extractor_agent import ExtractorAgent
 from .agents.task_creator_agent import TaskCreatorAgent
 from .agents.notifier_agent import NotifierAgent
-from .memory.memory_store import MemoryStore
+from .memory.memory_store import open_memory_store
 from .tools.report_tool import ReportTool
+from .result_cache import ResultCache, file_result_key, result_key
+from .stage_graph import Stage, run_stages
+from .metrics import ACTION_ITEMS, MEETINGS, STAGE_SECONDS, timed
+
+STAGE_THREADS = int(os.environ.get("M2A_STAGE_THREADS", "4"))
+BATCH_PARALLELISM = int(os.environ.get("M2A_BATCH_PARALLELISM", "4"))
 
 class Coordinator:
     """
@@ -14,47 +22,199 @@ class Coordinator:
     2. Extract action items
     3. Store in memory (mem/)
     4. Create tasks (Jira mock + Sheet CSV)
-    5. Notify owners (email log)
+    5. Notify owners (one digest email per owner)
     6. Generate beautiful reports (DOCX/PDF/RTF)
+
+    The steps run as a dependency graph: summarize and extract start together,
+    the memory store write overlaps task creation and notification, and the
+    report formats are rendered in a process pool (see ReportTool).
+
+    `on_stage(stage, status)`, if given, is called with "running" and "done"
+    around each stage so callers (e.g. the job queue) can report progress.
+
+    Results are cached by (meeting_id, transcript hash) in a ResultCache:
+    resubmitting the same meeting returns the first result without creating
+    issues, emails or reports again.
     """
 
-    def __init__(self):
+    def __init__(self, stage_threads: int = STAGE_THREADS):
         self.summarizer = SummarizerAgent()
         self.extractor = ExtractorAgent()
         self.task_creator = TaskCreatorAgent()
         self.notifier = NotifierAgent()
-        self.mem = MemoryStore()
+        self.mem = open_memory_store()
         self.reporter = ReportTool()
+        self.stage_pool = ThreadPoolExecutor(max_workers=stage_threads, thread_name_prefix="stage")
+        self.results = ResultCache()
 
-    def run_pipeline(self, transcript: str, meeting_id: str):
-        # 1. Summary
-        summary = self.summarizer.run(transcript)
+    def run_pipeline(self, transcript: str, meeting_id: str, on_stage=None):
+        return self.results.get_or_compute(
+            meeting_id, transcript, lambda: self._run_pipeline(transcript, meeting_id, on_stage)
+        )
 
-        # 2. Extract actions
-        actions = self.extractor.run(transcript)
+    def run_pipeline_file(self, path, meeting_id: str, key: str = None, on_stage=None):
+        """
+        run_pipeline for a transcript in a UTF-8 file (e.g. an upload spooled
+        by TranscriptSpool, which also provides `key`). Summaries,
+        extraction and the memory store read the file in chunks, so memory
+        use does not grow with the transcript.
+        """
+        if key is None:
+            key = file_result_key(meeting_id, path)
+        return self.results.get_or_compute_key(key, lambda: self._run_stages(
+            meeting_id, on_stage,
+            summarize=lambda: self.summarizer.run_file(path),
+            extract=lambda: self.extractor.run_file(path),
+            store=lambda data: self.mem.store_meeting(meeting_id, data, transcript_path=path),
+        ))
 
-        # 3. Store meeting data in local memory folder
-        meeting_data = {
-            "transcript": transcript,
-            "summary": summary,
-            "actions": actions
-        }
-        self.mem.store_meeting(meeting_id, meeting_data)
+    def _run_pipeline(self, transcript: str, meeting_id: str, on_stage=None):
+        return self._run_stages(
+            meeting_id, on_stage,
+            summarize=lambda: self.summarizer.run(transcript),
+            extract=lambda: self.extractor.run(transcript),
+            # Store meeting data in local memory folder
+            store=lambda data: self.mem.store_meeting(meeting_id, dict(data, transcript=transcript)),
+        )
 
-        # 4. Create tasks issue list
-        created_issues = self.task_creator.run(actions)
+    def _run_stages(self, meeting_id, on_stage, summarize, extract, store):
+        def store_stage(summarize, extract):
+            store({"summary": summarize, "actions": extract})
 
-        # 5. Notify owners through local email log
-        notifications = self.notifier.run(created_issues)
+        def reports(summarize, extract, tasks, notify):
+            return self.reporter.generate(meeting_id, summarize, extract, tasks, notify)
 
-        # 6. Generate report files (DOCX, PDF, RTF)
-        report_files = self.reporter.generate(meeting_id, summary, actions, created_issues, notifications)
+        results = run_stages([
+            _timed_stage("summarize", summarize),
+            _timed_stage("extract", extract),
+            _timed_stage("store", store_stage, deps=("summarize", "extract")),
+            _timed_stage("tasks", lambda extract: self.task_creator.run(extract), deps=("extract",)),
+            _timed_stage("notify", lambda tasks: self.notifier.run(tasks, meeting_id=meeting_id), deps=("tasks",)),
+            _timed_stage("reports", reports, deps=("summarize", "extract", "tasks", "notify")),
+        ], self.stage_pool, on_stage=on_stage)
+        MEETINGS.inc()
+        ACTION_ITEMS.inc(len(results["extract"]))
 
         return {
             "meeting_id": meeting_id,
-            "summary": summary,
-            "action_items": actions,
-            "tasks": created_issues,
-            "notifications": notifications,
-            "reports": report_files
+            "summary": results["summarize"],
+            "action_items": results["extract"],
+            "tasks": results["tasks"],
+            "notifications": results["notify"],
+            "reports": results["reports"]
         }
+
+    def run_batch(self, items, parallelism: int = BATCH_PARALLELISM):
+        """
+        Processes many (transcript, meeting_id) pairs and yields each result
+        (as returned by run_pipeline, plus its "index" in `items`) as soon
+        as it is ready. Summaries and extraction run `parallelism` meetings
+        at a time; meetings that finish together share one Jira append, one
+        sheet append and one email-log append. A meeting that fails yields
+        {"index", "meeting_id", "error"} instead. Meetings already in the
+        result cache are yielded first, without running again.
+
+        Each distinct meeting runs once: repeats within the batch share its
+        result, and a meeting that another request (e.g. a retried batch,
+        in any worker process) is already running waits for that run, as
+        in run_pipeline.
+        """
+        items = list(items)
+        groups = {}  # result key -> indexes of the items with that meeting
+        for i, (transcript, meeting_id) in enumerate(items):
+            groups.setdefault(result_key(meeting_id, transcript), []).append(i)
+
+        claims = {}
+        pool = ThreadPoolExecutor(max_workers=max(1, parallelism), thread_name_prefix="batch")
+        try:
+            # One key order for every caller, so claims cannot deadlock.
+            for key in sorted(groups):
+                indexes = groups[key]
+                try:
+                    cached, claim = self.results.claim(key)
+                except Exception as e:
+                    for i in indexes:
+                        yield {"index": i, "meeting_id": items[i][1], "error": str(e)}
+                    continue
+                if claim is None:
+                    for i in indexes:
+                        yield dict(cached, index=i)
+                else:
+                    claims[key] = claim
+
+            pending = {
+                pool.submit(self._analyze, *items[groups[key][0]]): key
+                for key in claims
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                analyzed = []
+                for future in done:
+                    key = pending.pop(future)
+                    try:
+                        analyzed.append((key,) + future.result())
+                    except Exception as e:
+                        claims[key].fail(e)
+                        yield from self._errors(items, groups[key], e)
+                yield from self._commit(analyzed, items, groups, claims)
+        finally:
+            # Also reached when the consumer stops early (e.g. client
+            # disconnect): unfinished meetings are left to whoever asks next.
+            pool.shutdown(wait=False, cancel_futures=True)
+            for claim in claims.values():
+                claim.release()
+
+    def _analyze(self, transcript, meeting_id):
+        with timed(STAGE_SECONDS, stage="summarize"):
+            summary = self.summarizer.run(transcript)
+        with timed(STAGE_SECONDS, stage="extract"):
+            actions = self.extractor.run(transcript)
+        return summary, actions
+
+    def _commit(self, analyzed, items, groups, claims):
+        # Store a group of analysed meetings with one write per shared store.
+        if not analyzed:
+            return
+        meeting_ids = [items[groups[key][0]][1] for key, _, _ in analyzed]
+        try:
+            for (key, summary, actions), meeting_id in zip(analyzed, meeting_ids):
+                self.mem.store_meeting(meeting_id, {
+                    "transcript": items[groups[key][0]][0],
+                    "summary": summary,
+                    "actions": actions
+                })
+            issue_lists = self.task_creator.run_many([actions for _, _, actions in analyzed])
+            notification_lists = self.notifier.run_many(list(zip(issue_lists, meeting_ids)))
+        except Exception as e:
+            for key, _, _ in analyzed:
+                claims[key].fail(e)
+                yield from self._errors(items, groups[key], e)
+            return
+
+        MEETINGS.inc(len(analyzed))
+        ACTION_ITEMS.inc(sum(len(actions) for _, _, actions in analyzed))
+        for (key, summary, actions), meeting_id, issues, notifications in zip(
+                analyzed, meeting_ids, issue_lists, notification_lists):
+            result = {
+                "meeting_id": meeting_id,
+                "summary": summary,
+                "action_items": actions,
+                "tasks": issues,
+                "notifications": notifications,
+                "reports": self.reporter.generate(meeting_id, summary, actions, issues, notifications)
+            }
+            claims[key].done(result)
+            for i in groups[key]:
+                yield dict(result, index=i)
+
+    def _errors(self, items, indexes, error):
+        for i in indexes:
+            yield {"index": i, "meeting_id": items[i][1], "error": str(error)}
+
+
+def _timed_stage(name, fn, deps=()):
+    # A Stage whose run time is recorded in STAGE_SECONDS.
+    def run(**kwargs):
+        with timed(STAGE_SECONDS, stage=name):
+            return fn(**kwargs)
+    return Stage(name, run, deps)
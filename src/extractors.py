@@ -1,15 +1,21 @@
 # src/extractors.py
 import re
-from typing import List, Dict
+from typing import Dict, Iterator, List
 from datetime import datetime
+from .roster import Roster, load_roster
 
 # REGEX patterns
 EMAIL_RE = re.compile(r'([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})')
 DATE_ISO_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')  # yyyy-mm-dd
+# action|todo|assign|to do|we will|please|follow up|follow-up|task, factored by
+# prefix; the leading lookahead on the first letters lets the regex engine
+# skip ahead instead of trying every alternative at every position.
 ACTION_KEYWORDS = re.compile(
-    r'\b(action|todo|assign|to do|we will|please|follow up|follow-up|task)\b',
+    r'(?=[atwpf])\b(a(?:ction|ssign)|t(?:o ?do|ask)|we will|please|follow[ -]up)\b',
     re.I
 )
+NAME_OWNER_RE = re.compile(r'([A-Z][a-z]{1,20})\s+(will|to)\b')  # "Name will", "Name to"
+NEXT_WEEK_RE = re.compile(r'next week', re.I)
 
 
 def summarize_transcript(transcript: str, max_sentences: int = 3) -> str:
@@ -27,49 +33,105 @@ def summarize_transcript(transcript: str, max_sentences: int = 3) -> str:
     return "\n".join([f"- {s}" for s in top])
 
 
-def extract_action_items(transcript: str) -> List[Dict]:
+def extract_action_items(transcript: str, roster=None) -> List[Dict]:
     """
     Extracts action items using regex + rule-based logic.
     Returns list of:
         {"task": ..., "owner": ..., "due": ..., "notes": ...}
+
+    Owners are an email in the line, else a person of `roster` (a Roster
+    or the path of a roster file; default M2A_ROSTER) named in it, else
+    "Name@example.com" from "Name will" / "Name to".
+    """
+    return list(iter_action_items(transcript, roster))
+
+
+def iter_action_items(transcript: str, roster=None) -> Iterator[Dict]:
+    """
+    Lazily yields the same items as extract_action_items.
+    The text is scanned once for action keywords without splitting it into
+    lines; only the lines that contain a keyword are looked at for owner
+    and due-date tokens, and the scan then resumes at the next line.
     """
-    results = []
-    lines = [line.strip() for line in transcript.split("\n") if line.strip()]
-
-    for ln in lines:
-        # action keyword check
-        if ACTION_KEYWORDS.search(ln):
-            task = ln
-            owner = None
-            due = None
-            notes = ""
-
-            # extract email as owner
-            email_match = EMAIL_RE.search(ln)
-            if email_match:
-                owner = email_match.group(1)
-
-            # owner detection by name (fallback)
-            if not owner:
-                # look for pattern "Name will", "Name to"
-                name_pattern = re.search(r'([A-Z][a-z]{1,20})\s+(will|to)\b', ln)
-                if name_pattern:
-                    owner = name_pattern.group(1) + "@example.com"
-
-            # due date detection
-            date_match = DATE_ISO_RE.search(ln)
-            if date_match:
-                due = date_match.group(1)
-            else:
-                # relative example: "next week"
-                if re.search(r'next week', ln, re.I):
-                    due = datetime.utcnow().date().isoformat()
-
-            results.append({
-                "task": task,
-                "owner": owner,
-                "due": due,
-                "notes": notes
-            })
-
-    return results
\ No newline at end of file
+    roster = _resolve_roster(roster)
+    search = ACTION_KEYWORDS.search
+    pos = 0
+    while True:
+        m = search(transcript, pos)
+        if not m:
+            return
+        start = transcript.rfind("\n", 0, m.start()) + 1
+        end = transcript.find("\n", m.end())
+        if end == -1:
+            end = len(transcript)
+        yield _action_item(transcript[start:end].strip(), roster)
+        pos = end + 1
+
+
+def _resolve_roster(roster):
+    return roster if isinstance(roster, Roster) else load_roster(roster)
+
+
+def _action_item(ln: str, roster: Roster = None) -> Dict:
+    owner = None
+    due = None
+
+    # extract email as owner (cheap "@"/"-" checks skip regexes that cannot match)
+    email_match = EMAIL_RE.search(ln) if "@" in ln else None
+    if email_match:
+        owner = email_match.group(1)
+    else:
+        # a person from the roster, else owner detection by name (fallback)
+        owner = roster.find(ln) if roster is not None else None
+        if owner is None:
+            name_match = NAME_OWNER_RE.search(ln)
+            if name_match:
+                owner = name_match.group(1) + "@example.com"
+
+    # due date detection
+    date_match = DATE_ISO_RE.search(ln) if "-" in ln else None
+    if date_match:
+        due = date_match.group(1)
+    elif NEXT_WEEK_RE.search(ln):
+        # relative example: "next week"
+        due = datetime.utcnow().date().isoformat()
+
+    return {
+        "task": ln,
+        "owner": owner,
+        "due": due,
+        "notes": ""
+    }
+
+
+class IncrementalExtractor:
+    """
+    Extracts action items from a transcript that arrives in chunks
+    (e.g. a live meeting). `feed()` returns only the items found in lines
+    completed by that chunk; a line split across chunks is held back until
+    its newline arrives, and `close()` flushes the final unterminated line.
+    Each call costs O(chunk + held-back line), not O(transcript so far),
+    and the concatenated output equals extract_action_items(full transcript).
+    """
+    def __init__(self, roster=None):
+        self._partial = ""
+        self._roster = _resolve_roster(roster)
+        self.items_found = 0
+
+    def feed(self, chunk: str) -> List[Dict]:
+        text = self._partial + chunk
+        cut = text.rfind("\n")
+        if cut == -1:
+            self._partial = text
+            return []
+        self._partial = text[cut + 1:]
+        return self._found(iter_action_items(text[:cut], self._roster))
+
+    def close(self) -> List[Dict]:
+        text, self._partial = self._partial, ""
+        return self._found(iter_action_items(text, self._roster))
+
+    def _found(self, items):
+        items = list(items)
+        self.items_found += len(items)
+        return items
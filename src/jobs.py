@@ -0,0 +1,151 @@
+# src/jobs.py
+import os
+import queue
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from .utils import read_json, timestamp, write_json
+
+DEFAULT_WORKERS = int(os.environ.get("M2A_JOB_WORKERS", "2"))
+DEFAULT_MAX_PENDING = int(os.environ.get("M2A_JOB_MAX_PENDING", "1000"))
+MAX_FINISHED_JOBS = 1000
+# One {job_id}.json per job, so every worker process can report any job.
+JOBS_DIR = Path("artifacts/jobs")
+JOB_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+
+class JobQueue:
+    """
+    Background queue for pipeline runs.
+    `submit()` returns a job id immediately; a pool of worker threads drains
+    the queue through `Coordinator.run_pipeline` and records stage-level
+    progress that `get()` reports. Only the most recent finished jobs are kept.
+
+    Each job's state is also written to artifacts/jobs/{job_id}.json on every
+    change, so with `uvicorn --workers N` a status poll answered by another
+    worker process still finds the job.
+    """
+    def __init__(self, coordinator, workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_MAX_PENDING,
+                 path=JOBS_DIR):
+        self.coordinator = coordinator
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.workers = max(1, workers)
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._jobs = OrderedDict()
+        self._finished = 0
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def submit(self, transcript: str, meeting_id: str):
+        """
+        Enqueues a pipeline run. Raises queue.Full when the backlog is full.
+        """
+        self._start()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "meeting_id": meeting_id,
+            "status": "queued",
+            "stages": {},
+            "submitted_at": timestamp(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None
+        }
+        with self._lock:
+            self._jobs[job["job_id"]] = job
+            self._save(job)
+        try:
+            self._queue.put_nowait((job["job_id"], transcript))
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job["job_id"]]
+                self._job_path(job["job_id"]).unlink(missing_ok=True)
+            raise
+        return self.get(job["job_id"])
+
+    def get(self, job_id: str):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                snapshot = dict(job)
+                snapshot["stages"] = dict(job["stages"])
+                return snapshot
+        # Submitted to another worker process
+        if not JOB_ID_RE.match(job_id):
+            return None
+        try:
+            return read_json(self._job_path(job_id))
+        except ValueError:
+            return None
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _work(self):
+        while True:
+            job_id, transcript = self._queue.get()
+            try:
+                self._run(job_id, transcript)
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id, transcript):
+        with self._lock:
+            job = self._jobs[job_id]
+            job["status"] = "running"
+            job["started_at"] = timestamp()
+            self._save(job)
+
+        def on_stage(stage, status):
+            with self._lock:
+                job["stages"][stage] = status
+                self._save(job)
+
+        try:
+            result = self.coordinator.run_pipeline(transcript, job["meeting_id"], on_stage=on_stage)
+        except Exception as e:
+            print(f"[JobQueue] job {job_id} failed: {e}")
+            outcome = {"status": "failed", "error": str(e)}
+        else:
+            outcome = {"status": "done", "result": result}
+
+        with self._lock:
+            job.update(outcome)
+            job["finished_at"] = timestamp()
+            self._save(job)
+            self._finished += 1
+            self._evict()
+
+    def _job_path(self, job_id):
+        return self.path / f"{job_id}.json"
+
+    def _save(self, job):
+        # Under self._lock, so a job's updates reach the file in order.
+        try:
+            write_json(self._job_path(job["job_id"]), job)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[JobQueue] cannot save job {job['job_id']}: {e}")
+
+    def _evict(self):
+        # Drop the oldest finished jobs once more than MAX_FINISHED_JOBS are kept.
+        if self._finished <= MAX_FINISHED_JOBS:
+            return
+        for job_id in list(self._jobs):
+            if self._finished <= MAX_FINISHED_JOBS:
+                break
+            if self._jobs[job_id]["status"] in ("done", "failed"):
+                del self._jobs[job_id]
+                self._job_path(job_id).unlink(missing_ok=True)
+                self._finished -= 1
@@ -1,24 +1,236 @@
 # src/memory/memory_store.py
+import os
+import threading
 from pathlib import Path
 import json
-from ..utils import write_json, read_json
+from ..utils import write_json, read_json, write_bytes_atomic, atomic_open, file_lock
+from ..metrics import BYTES_WRITTEN, STORE_WRITE_SECONDS, timed
+from .search_index import SearchIndex
+from .transcripts import (
+    TRANSCRIPT_EXT, MeetingRecord, compress_transcript, compress_transcript_file, decompress_transcript
+)
+
+MEMORY_BACKEND = os.environ.get("M2A_MEMORY_BACKEND", "json")
+# The change journal (mem/changes.log) is started over past this size.
+JOURNAL_MAX_BYTES = 1 << 20
+
+# In-process change notifications, keyed by the resolved store location so
+# every store instance over the same files sees the same events.
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+def subscribe(location, callback):
+    """
+    Calls `callback(meeting_id)` after every store_meeting() on the store at
+    `location` in this process. Returns a function that unsubscribes.
+    """
+    key = str(Path(location).resolve())
+    with _listeners_lock:
+        _listeners.setdefault(key, []).append(callback)
+
+    def unsubscribe():
+        with _listeners_lock:
+            if callback in _listeners.get(key, []):
+                _listeners[key].remove(callback)
+    return unsubscribe
+
+def publish(location, meeting_id):
+    with _listeners_lock:
+        callbacks = list(_listeners.get(str(Path(location).resolve()), []))
+    for callback in callbacks:
+        try:
+            callback(meeting_id)
+        except Exception as e:
+            print(f"[MemoryStore] change listener failed: {e}")
+
 
 class MemoryStore:
     """
     Simple file-based memory store.
-    Stores per-meeting JSON under mem/{meeting_id}.json
+    Stores per-meeting JSON under mem/{meeting_id}.json; the transcript is
+    kept next to it as a compressed blob (mem/{meeting_id}.transcript.gz,
+    or .zst with zstandard installed) named by the record's
+    "transcript_ref" and read only when accessed. Older files with the
+    transcript inline are still read, and are split on their next write.
+    Every stored meeting is also indexed in mem/search.db (see search()).
+    Writes hold a lock on mem/meetings.lock, so read-modify-write updates
+    from several processes never overwrite each other, and append the
+    meeting id to mem/changes.log, which changed_since() reads from a byte
+    offset.
     """
     def __init__(self, base="mem"):
         self.base = Path(base)
         self.base.mkdir(parents=True, exist_ok=True)
+        self.index = SearchIndex(self.base / "search.db")
+        if self.index.created:
+            self.reindex()
+
+    def store_meeting(self, meeting_id, data: dict, transcript_path=None):
+        """
+        Stores `data`. With `transcript_path` the transcript is streamed from
+        that UTF-8 file instead of being taken from data["transcript"].
+        """
+        data = dict(data.items())
+        with timed(STORE_WRITE_SECONDS, store="memory"), self._lock():
+            written = self._write_record(meeting_id, dict(data), transcript_path)
+            self.index.update(meeting_id, data, transcript_path=transcript_path)
+        BYTES_WRITTEN.inc(written, store="memory")
+        publish(self.base, meeting_id)
+
+    def search(self, q=None, **filters):
+        """
+        Ranked full-text search; see SearchIndex.search for the filters.
+        """
+        return self.index.search(q, **filters)
 
-    def store_meeting(self, meeting_id, data: dict):
-        path = self.base / f"{meeting_id}.json"
-        write_json(path, data)
+    def reindex(self):
+        for meeting_id in self.meeting_ids():
+            data = self.load_meeting(meeting_id)
+            if isinstance(data, dict):
+                self.index.update(meeting_id, data)
 
     def load_meeting(self, meeting_id):
-        path = self.base / f"{meeting_id}.json"
-        return read_json(path)
+        data = self._read_record(meeting_id)
+        if not isinstance(data, dict):
+            return data
+        ref = data.pop("transcript_ref", None)
+        if ref is None or "transcript" in data:
+            return MeetingRecord(data)
+        return MeetingRecord(data, lambda: self._read_transcript(ref))
+
+    def _lock(self):
+        return file_lock(self.base / "meetings")
+
+    def _read_record(self, meeting_id):
+        return read_json(self.base / f"{meeting_id}.json")
+
+    def _write_record(self, meeting_id, data, transcript_path=None):
+        # `data` is the raw record; an inline transcript is moved to its blob.
+        # Returns the number of bytes written.
+        written = 0
+        if "transcript" in data or transcript_path is not None:
+            transcript = data.pop("transcript", None)
+            data.pop("transcript_ref", None)
+            if transcript_path is not None:
+                ref = f"{meeting_id}.transcript.{TRANSCRIPT_EXT}"
+                with atomic_open(self.base / ref) as f:
+                    compress_transcript_file(transcript_path, f)
+                    written += f.tell()
+                data["transcript_ref"] = ref
+            elif transcript is not None:
+                blob, ext = compress_transcript(transcript)
+                ref = f"{meeting_id}.transcript.{ext}"
+                write_bytes_atomic(self.base / ref, blob)
+                written += len(blob)
+                data["transcript_ref"] = ref
+            for stale in self.base.glob(f"{meeting_id}.transcript.*"):
+                if stale.name != data.get("transcript_ref"):
+                    stale.unlink(missing_ok=True)
+        written += write_json(self.base / f"{meeting_id}.json", data)
+        self._journal(meeting_id)
+        return written
+
+    def _journal(self, meeting_id):
+        # Called under self._lock(). A full journal is replaced by an empty
+        # file; readers see the new inode and start over (see changed_since).
+        path = self.base / "changes.log"
+        try:
+            if path.stat().st_size >= JOURNAL_MAX_BYTES:
+                write_bytes_atomic(path, b"")
+        except FileNotFoundError:
+            pass
+        with path.open("ab") as f:
+            f.write(meeting_id.encode("utf-8") + b"\n")
+
+    def _read_transcript(self, ref):
+        try:
+            return decompress_transcript((self.base / ref).read_bytes())
+        except FileNotFoundError:
+            print(f"[MemoryStore] transcript blob {ref} is missing")
+            return None
 
     def list_meetings(self):
         return [p.name for p in self.base.glob("*.json")]
+
+    def meeting_ids(self):
+        return [p.stem for p in self.base.glob("*.json")]
+
+    def subscribe(self, callback):
+        return subscribe(self.base, callback)
+
+    def changed_since(self, cursor=None):
+        """
+        Meetings written since `cursor` by any process, read from the change
+        journal: only the entries appended since the last call are read, so
+        an idle check costs one open and stat whatever the history size.
+        Returns (meeting_ids, new_cursor); pass cursor=None to get every
+        meeting (also returned when the journal was started over).
+        """
+        path = self.base / "changes.log"
+        try:
+            f = path.open("rb")
+        except FileNotFoundError:
+            return (self.meeting_ids() if cursor is None else []), (None, 0)
+        with f:
+            st = os.fstat(f.fileno())
+            inode, offset = cursor or (None, 0)
+            full = cursor is None or inode != st.st_ino or st.st_size < offset
+            if full:
+                offset = 0
+            f.seek(offset)
+            data = f.read(st.st_size - offset)
+        # A line still being appended is left for the next call
+        data = data[:data.rfind(b"\n") + 1]
+        new_cursor = (st.st_ino, offset + len(data))
+        if full:
+            return self.meeting_ids(), new_cursor
+        return list(dict.fromkeys(data.decode("utf-8").splitlines())), new_cursor
+
+    def pending_followups(self, limit=None):
+        # No index here: every meeting file is read. Use the sqlite backend
+        # when the history is large.
+        pending = []
+        for meeting_id in self.meeting_ids():
+            data = self.load_meeting(meeting_id)
+            if data and not data.get("followed_up"):
+                pending.append(meeting_id)
+                if limit is not None and len(pending) >= limit:
+                    break
+        return pending
+
+    def mark_followed_up(self, meeting_id, reminder):
+        """
+        Sets followed_up and appends `reminder` unless the meeting is
+        missing or already followed up. Returns whether it was marked.
+        """
+        with self._lock():
+            data = self._read_record(meeting_id)
+            if not data or data.get("followed_up"):
+                return False
+            data["followed_up"] = True
+            data.setdefault("reminders", []).append(reminder)
+            self._write_record(meeting_id, data)
+        return True
+
+    def add_reminder(self, meeting_id, reminder):
+        with self._lock():
+            data = self._read_record(meeting_id)
+            if not data:
+                return False
+            data.setdefault("reminders", []).append(reminder)
+            self._write_record(meeting_id, data)
+        return True
+
+
+def open_memory_store(backend=None, base="mem"):
+    """
+    Returns the configured memory store: "json" (mem/*.json files, the
+    default) or "sqlite" (mem/meetings.db). Set M2A_MEMORY_BACKEND to choose.
+    """
+    backend = backend or MEMORY_BACKEND
+    if backend == "json":
+        return MemoryStore(base)
+    if backend == "sqlite":
+        from .sqlite_store import SqliteMemoryStore
+        return SqliteMemoryStore(Path(base) / "meetings.db", import_from=base)
+    raise ValueError(f"unknown memory backend {backend!r}")
@@ -0,0 +1,204 @@
+# src/memory/search_index.py
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from ..spool import iter_transcript_chunks
+
+SEARCH_FIELDS = ("transcript", "summary", "task", "owner", "due")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_rows (
+    rowid      INTEGER PRIMARY KEY,
+    meeting_id TEXT NOT NULL,
+    action     INTEGER,
+    task       TEXT,
+    owner      TEXT,
+    due        TEXT
+);
+CREATE INDEX IF NOT EXISTS search_rows_meeting ON search_rows (meeting_id);
+CREATE INDEX IF NOT EXISTS search_rows_owner ON search_rows (owner, due) WHERE action IS NOT NULL;
+CREATE INDEX IF NOT EXISTS search_rows_due ON search_rows (due) WHERE action IS NOT NULL;
+CREATE VIRTUAL TABLE IF NOT EXISTS search_docs USING fts5(
+    transcript, summary, task, owner, due,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+# Transcripts longer than this (in characters) are indexed in pieces
+INDEX_CHUNK = 1 << 20
+
+class SearchIndex:
+    """
+    Full-text index over stored meetings (SQLite FTS5, mem/search.db).
+    Each meeting is one row (transcript + summary) and each action item
+    another (task, owner, due), so a search is a single indexed lookup
+    that never opens the meeting files. `update()` replaces a meeting's
+    rows and is called by the memory stores on every store_meeting().
+    Transcripts longer than INDEX_CHUNK take one row per piece (cut at
+    newlines), so a long transcript is never indexed as a single string;
+    the words of a query must then occur in the same piece.
+    """
+    def __init__(self, path="mem/search.db"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self.created = not self.path.exists()
+        with self._conn() as conn:
+            conn.executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def update(self, meeting_id, data: dict, transcript_path=None):
+        """
+        Replaces the rows of `meeting_id`. With `transcript_path` the
+        transcript is read from that file, one piece at a time.
+        """
+        if transcript_path is not None:
+            pieces = iter_transcript_chunks(transcript_path, INDEX_CHUNK)
+        else:
+            pieces = _pieces(data.get("transcript") or "")
+        actions = [
+            (i, "", "", action.get("task") or "", _norm_owner(action.get("owner")) or "", action.get("due") or "")
+            for i, action in enumerate(data.get("actions") or [])
+        ]
+
+        with self._conn() as conn:
+            self._delete(conn, meeting_id)
+            summary = data.get("summary") or ""
+            n = None
+            for n, piece in enumerate(pieces):
+                self._insert(conn, meeting_id, (None, piece, summary if n == 0 else "", "", "", ""))
+            if n is None:
+                self._insert(conn, meeting_id, (None, "", summary, "", "", ""))
+            for row in actions:
+                self._insert(conn, meeting_id, row)
+
+    def _insert(self, conn, meeting_id, row):
+        action, transcript, summary, task, owner, due = row
+        cur = conn.execute(
+            "INSERT INTO search_rows (meeting_id, action, task, owner, due) VALUES (?, ?, ?, ?, ?)",
+            (meeting_id, action, task or None, owner or None, due or None)
+        )
+        conn.execute(
+            "INSERT INTO search_docs (rowid, transcript, summary, task, owner, due) VALUES (?, ?, ?, ?, ?, ?)",
+            (cur.lastrowid, transcript, summary, task, owner, due)
+        )
+
+    def remove(self, meeting_id):
+        with self._conn() as conn:
+            self._delete(conn, meeting_id)
+
+    def _delete(self, conn, meeting_id):
+        rowids = [r[0] for r in conn.execute("SELECT rowid FROM search_rows WHERE meeting_id = ?", (meeting_id,))]
+        if rowids:
+            marks = ",".join("?" * len(rowids))
+            conn.execute(f"DELETE FROM search_docs WHERE rowid IN ({marks})", rowids)
+            conn.execute(f"DELETE FROM search_rows WHERE rowid IN ({marks})", rowids)
+
+    def search(self, q=None, fields=None, owner=None, due_from=None, due_to=None, limit=20, offset=0):
+        """
+        Ranked hits for the words in `q` (all must match), optionally only
+        in `fields` (a subset of SEARCH_FIELDS). owner / due_from / due_to
+        restrict the results to action items; without `q` they list the
+        matching action items by due date.
+
+        Each hit is {"meeting_id", "kind": "meeting"|"action", "action",
+        "task", "owner", "due", "snippet", "score"}.
+        """
+        fields = list(fields or [])
+        unknown = [f for f in fields if f not in SEARCH_FIELDS]
+        if unknown:
+            raise ValueError(f"unknown search field(s): {', '.join(unknown)}")
+
+        where, params = [], []
+        if owner is not None or due_from is not None or due_to is not None:
+            where.append("r.action IS NOT NULL")
+        if owner is not None:
+            where.append("r.owner = ?")
+            params.append(_norm_owner(owner))
+        if due_from is not None:
+            where.append("r.due >= ?")
+            params.append(due_from)
+        if due_to is not None:
+            where.append("r.due <= ?")
+            params.append(due_to)
+
+        terms = _TERM_RE.findall(q or "")
+        if terms:
+            match = " ".join(f'"{t}"' for t in terms)
+            if fields:
+                match = "{" + " ".join(fields) + "}: (" + match + ")"
+            sql = (
+                "SELECT r.meeting_id, r.action, r.task, r.owner, r.due, "
+                "snippet(search_docs, -1, '[', ']', '...', 12), bm25(search_docs) AS rank "
+                "FROM search_docs JOIN search_rows r ON r.rowid = search_docs.rowid "
+                "WHERE search_docs MATCH ?"
+            )
+            params.insert(0, match)
+            sql += "".join(" AND " + w for w in where) + " ORDER BY rank"
+        elif where:
+            sql = (
+                "SELECT r.meeting_id, r.action, r.task, r.owner, r.due, NULL, NULL "
+                "FROM search_rows r WHERE " + " AND ".join(where) +
+                " ORDER BY r.due IS NULL, r.due, r.meeting_id, r.action"
+            )
+        else:
+            return []
+
+        # A long transcript has several rows and only its best-ranked one
+        # counts: duplicates are skipped here, fetching more rows if any were.
+        want = fetch = offset + limit
+        while True:
+            rows = self._conn().execute(sql + " LIMIT ?", params + [fetch]).fetchall()
+            hits = _best_per_meeting(rows)
+            if len(hits) >= want or len(rows) < fetch:
+                break
+            fetch *= 2
+
+        return [
+            {
+                "meeting_id": meeting_id,
+                "kind": "meeting" if action is None else "action",
+                "action": action,
+                "task": task,
+                "owner": owner,
+                "due": due,
+                "snippet": snippet,
+                "score": None if rank is None else round(-rank, 4)
+            }
+            for meeting_id, action, task, owner, due, snippet, rank in hits[offset:want]
+        ]
+
+
+def _best_per_meeting(rows):
+    hits, seen = [], set()
+    for row in rows:
+        if row[1] is None:
+            if row[0] in seen:
+                continue
+            seen.add(row[0])
+        hits.append(row)
+    return hits
+
+
+def _pieces(text):
+    # `text` cut at newlines into pieces of about INDEX_CHUNK characters
+    start = 0
+    while start < len(text):
+        end = text.find("\n", start + INDEX_CHUNK - 1)
+        end = len(text) if end == -1 else end + 1
+        yield text[start:end]
+        start = end
+
+
+def _norm_owner(owner):
+    return owner.strip().lower() if owner else None
@@ -0,0 +1,254 @@
+# src/memory/sqlite_store.py
+import io
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from ..utils import timestamp
+from ..metrics import BYTES_WRITTEN, STORE_WRITE_SECONDS, timed
+from .memory_store import MemoryStore, publish, subscribe
+from .search_index import SearchIndex
+from .transcripts import MeetingRecord, compress_transcript, compress_transcript_file, decompress_transcript
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    meeting_id   TEXT PRIMARY KEY,
+    followed_up  INTEGER NOT NULL DEFAULT 0,
+    reminders    TEXT NOT NULL DEFAULT '[]',
+    action_count INTEGER NOT NULL DEFAULT 0,
+    created_at   TEXT NOT NULL,
+    updated_at   TEXT NOT NULL,
+    data         TEXT NOT NULL,
+    change_seq   INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS meetings_pending_followup
+    ON meetings (created_at) WHERE followed_up = 0;
+CREATE INDEX IF NOT EXISTS meetings_change_seq ON meetings (change_seq);
+CREATE TABLE IF NOT EXISTS transcripts (
+    meeting_id TEXT PRIMARY KEY,
+    transcript TEXT NOT NULL
+);
+"""
+
+# Keys kept in their own columns/tables rather than in the `data` JSON.
+_COLUMN_KEYS = ("transcript", "followed_up", "reminders")
+
+class SqliteMemoryStore:
+    """
+    SQLite-backed memory store (mem/meetings.db).
+    Meeting metadata (followed_up, reminders, created/updated time, action
+    count) is kept in indexed columns and transcripts in a separate table,
+    so follow-up queries never read or parse a transcript. Transcripts are
+    stored compressed and loaded by load_meeting() only when accessed
+    (rows written as plain text by older versions still read). Existing
+    mem/*.json meetings are imported when the database is first created.
+    Every stored meeting is also indexed in mem/search.db (see search()).
+    """
+    def __init__(self, path="mem/meetings.db", import_from="mem"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        is_new = not self.path.exists()
+        with self._conn() as conn:
+            columns = [r[1] for r in conn.execute("PRAGMA table_info(meetings)")]
+            if columns and "change_seq" not in columns:
+                conn.execute("ALTER TABLE meetings ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0")
+            conn.executescript(SCHEMA)
+        self.index = SearchIndex(self.path.with_name("search.db"))
+        if is_new and import_from:
+            self.import_json_dir(import_from)
+        elif self.index.created:
+            self.reindex()
+
+    def _conn(self):
+        # sqlite3 connections are per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def store_meeting(self, meeting_id, data: dict, transcript_path=None):
+        """
+        Stores `data`. With `transcript_path` the transcript is compressed
+        from that UTF-8 file instead of being taken from data["transcript"]
+        (only the compressed blob is held in memory).
+        """
+        now = timestamp()
+        data = dict(data.items())
+        rest = json.dumps({k: v for k, v in data.items() if k not in _COLUMN_KEYS})
+        reminders = json.dumps(data.get("reminders", []))
+        if transcript_path is not None:
+            buf = io.BytesIO()
+            compress_transcript_file(transcript_path, buf)
+            blob = buf.getvalue()
+        elif data.get("transcript") is not None:
+            blob = compress_transcript(data["transcript"])[0]
+        else:
+            blob = None
+        with timed(STORE_WRITE_SECONDS, store="memory"):
+            with self._conn() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO meetings (meeting_id, followed_up, reminders, action_count, created_at, updated_at, data, change_seq)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, (SELECT COALESCE(MAX(change_seq), 0) + 1 FROM meetings))
+                    ON CONFLICT (meeting_id) DO UPDATE SET
+                        followed_up = excluded.followed_up,
+                        reminders = excluded.reminders,
+                        action_count = excluded.action_count,
+                        updated_at = excluded.updated_at,
+                        data = excluded.data,
+                        change_seq = excluded.change_seq
+                    """,
+                    (meeting_id, int(bool(data.get("followed_up"))), reminders,
+                     len(data.get("actions") or []), now, now, rest)
+                )
+                if blob is not None:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO transcripts (meeting_id, transcript) VALUES (?, ?)",
+                        (meeting_id, blob)
+                    )
+            self.index.update(meeting_id, data, transcript_path=transcript_path)
+        BYTES_WRITTEN.inc(len(rest) + len(reminders) + len(blob or b""), store="memory")
+        publish(self.path, meeting_id)
+
+    def search(self, q=None, **filters):
+        """
+        Ranked full-text search; see SearchIndex.search for the filters.
+        """
+        return self.index.search(q, **filters)
+
+    def reindex(self):
+        for meeting_id in self.meeting_ids():
+            self.index.update(meeting_id, self.load_meeting(meeting_id))
+
+    def load_meeting(self, meeting_id):
+        row = self._conn().execute(
+            """
+            SELECT m.followed_up, m.reminders, m.data,
+                   EXISTS (SELECT 1 FROM transcripts t WHERE t.meeting_id = m.meeting_id)
+            FROM meetings m WHERE m.meeting_id = ?
+            """,
+            (meeting_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        followed_up, reminders, data, has_transcript = row
+        load = (lambda: self._load_transcript(meeting_id)) if has_transcript else None
+        meeting = MeetingRecord(json.loads(data), load)
+        if followed_up:
+            meeting["followed_up"] = True
+        reminders = json.loads(reminders)
+        if reminders:
+            meeting["reminders"] = reminders
+        return meeting
+
+    def _load_transcript(self, meeting_id):
+        row = self._conn().execute(
+            "SELECT transcript FROM transcripts WHERE meeting_id = ?", (meeting_id,)
+        ).fetchone()
+        return decompress_transcript(row[0]) if row else None
+
+    def meeting_ids(self):
+        return [r[0] for r in self._conn().execute("SELECT meeting_id FROM meetings ORDER BY created_at")]
+
+    def list_meetings(self):
+        # Same shape as MemoryStore.list_meetings (file names)
+        return [f"{meeting_id}.json" for meeting_id in self.meeting_ids()]
+
+    def subscribe(self, callback):
+        return subscribe(self.path, callback)
+
+    def changed_since(self, cursor=None):
+        """
+        Meetings stored since `cursor` by any process, read from the
+        change_seq index. Returns (meeting_ids, new_cursor); pass
+        cursor=None to get everything.
+        """
+        rows = self._conn().execute(
+            "SELECT meeting_id, change_seq FROM meetings WHERE change_seq > ? ORDER BY change_seq",
+            (cursor or 0,)
+        ).fetchall()
+        if not rows:
+            return [], cursor or 0
+        return [r[0] for r in rows], rows[-1][1]
+
+    def meeting_info(self, meeting_id):
+        """
+        Metadata only: no transcript, summary or actions.
+        """
+        row = self._conn().execute(
+            "SELECT followed_up, reminders, action_count, created_at, updated_at FROM meetings WHERE meeting_id = ?",
+            (meeting_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "meeting_id": meeting_id,
+            "followed_up": bool(row[0]),
+            "reminders": json.loads(row[1]),
+            "action_count": row[2],
+            "created_at": row[3],
+            "updated_at": row[4]
+        }
+
+    def pending_followups(self, limit=None):
+        """
+        Ids of meetings that have not been followed up yet, oldest first.
+        Served from a partial index, so the cost does not grow with history.
+        """
+        sql = "SELECT meeting_id FROM meetings WHERE followed_up = 0 ORDER BY created_at"
+        params = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+        return [r[0] for r in self._conn().execute(sql, params)]
+
+    def mark_followed_up(self, meeting_id, reminder):
+        """
+        Sets followed_up and appends `reminder`, touching only metadata
+        columns. Returns False if the meeting is missing or already followed up.
+        """
+        with self._conn() as conn:
+            # Take the write lock before reading, so a concurrent writer in
+            # another process cannot slip in between the SELECT and UPDATE.
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT reminders FROM meetings WHERE meeting_id = ? AND followed_up = 0", (meeting_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            reminders = json.loads(row[0]) + [reminder]
+            conn.execute(
+                "UPDATE meetings SET followed_up = 1, reminders = ?, updated_at = ? WHERE meeting_id = ? AND followed_up = 0",
+                (json.dumps(reminders), timestamp(), meeting_id)
+            )
+        return True
+
+    def add_reminder(self, meeting_id, reminder):
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT reminders FROM meetings WHERE meeting_id = ?", (meeting_id,)).fetchone()
+            if row is None:
+                return False
+            conn.execute(
+                "UPDATE meetings SET reminders = ?, updated_at = ? WHERE meeting_id = ?",
+                (json.dumps(json.loads(row[0]) + [reminder]), timestamp(), meeting_id)
+            )
+        return True
+
+    def import_json_dir(self, base):
+        """
+        Copies every mem/*.json meeting into the database.
+        """
+        source = MemoryStore(base)
+        for p in sorted(Path(base).glob("*.json")):
+            try:
+                data = source.load_meeting(p.stem)
+            except ValueError:
+                print(f"[SqliteMemoryStore] skipping unreadable {p}")
+                continue
+            if isinstance(data, dict):
+                self.store_meeting(p.stem, data)
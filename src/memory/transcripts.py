@@ -0,0 +1,123 @@
+# src/memory/transcripts.py
+import gzip
+import os
+import shutil
+
+try:
+    import zstandard
+except ImportError:  # optional, gzip is always available
+    zstandard = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Extension of the blobs compress_transcript makes
+TRANSCRIPT_EXT = "zst" if zstandard is not None else "gz"
+
+def compress_transcript(text: str):
+    """
+    Returns (blob, extension). Uses zstd when the `zstandard` package is
+    installed, gzip otherwise.
+    """
+    raw = text.encode("utf-8")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=6).compress(raw), "zst"
+    return gzip.compress(raw, compresslevel=6), "gz"
+
+def compress_transcript_file(src, dst):
+    """
+    compress_transcript for a UTF-8 transcript file `src`, streamed into
+    the binary file object `dst`. Returns the extension.
+    """
+    with open(src, "rb") as f:
+        if zstandard is not None:
+            size = os.fstat(f.fileno()).st_size
+            zstandard.ZstdCompressor(level=6).copy_stream(f, dst, size=size)
+            return "zst"
+        with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6) as gz:
+            shutil.copyfileobj(f, gz, 1 << 20)
+        return "gz"
+
+def decompress_transcript(blob) -> str:
+    """
+    Inverse of compress_transcript; plain text is returned unchanged.
+    """
+    if isinstance(blob, str):
+        return blob
+    blob = bytes(blob)
+    if blob.startswith(GZIP_MAGIC):
+        return gzip.decompress(blob).decode("utf-8")
+    if blob.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError("transcript is zstd-compressed but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompress(blob).decode("utf-8")
+    return blob.decode("utf-8")
+
+
+class MeetingRecord(dict):
+    """
+    A stored meeting whose transcript is loaded from its blob only when
+    first accessed (record["transcript"], .get("transcript"), iteration or
+    comparison). Reading summary, actions or reminders never touches it.
+    """
+    def __init__(self, data, load_transcript=None):
+        super().__init__(data)
+        self._load_transcript = load_transcript
+
+    @property
+    def transcript_loaded(self):
+        return self._load_transcript is None
+
+    def _materialize(self):
+        if self._load_transcript is not None:
+            load, self._load_transcript = self._load_transcript, None
+            dict.__setitem__(self, "transcript", load())
+
+    def __missing__(self, key):
+        if key == "transcript" and self._load_transcript is not None:
+            self._materialize()
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == "transcript":
+            self._materialize()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        return (key == "transcript" and self._load_transcript is not None) or dict.__contains__(self, key)
+
+    def __eq__(self, other):
+        self._materialize()
+        return dict.__eq__(self, other)
+
+    __hash__ = None
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self._materialize()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def copy(self):
+        self._materialize()
+        return dict(dict.items(self))
+
+    def metadata(self):
+        """
+        Everything except the transcript, without loading it.
+        """
+        return {k: v for k, v in dict.items(self) if k != "transcript"}
@@ -0,0 +1,164 @@
+# src/metrics.py
+import os
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Set M2A_METRICS=0 to turn recording off; every call then returns at once.
+ENABLED = os.environ.get("M2A_METRICS", "1") != "0"
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = []
+
+class Counter:
+    """
+    Monotonic counter, optionally split by labels.
+    """
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+        if not self.labels:
+            self._values[()] = 0
+        _registry.append(self)
+
+    def inc(self, amount=1, **labels):
+        if not ENABLED:
+            return
+        key = tuple(labels[n] for n in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(tuple(labels[n] for n in self.labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, dict(zip(self.labels, key)), value
+
+
+class Histogram:
+    """
+    Latency histogram (seconds) with cumulative Prometheus buckets.
+    """
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._values = {}  # label values -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        if not ENABLED:
+            return
+        key = tuple(labels[n] for n in self.labels)
+        i = bisect_left(self.buckets, value)
+        with self._lock:
+            slot = self._values.get(key)
+            if slot is None:
+                slot = self._values[key] = [0] * (len(self.buckets) + 2)
+            if i < len(self.buckets):
+                slot[i] += 1
+            slot[-2] += value
+            slot[-1] += 1
+
+    def count(self, **labels):
+        slot = self._values.get(tuple(labels[n] for n in self.labels))
+        return slot[-1] if slot else 0
+
+    def samples(self):
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        for key, slot in items:
+            labels = dict(zip(self.labels, key))
+            cumulative = 0
+            for bound, n in zip(self.buckets, slot):
+                cumulative += n
+                yield self.name + "_bucket", dict(labels, le=_fmt(bound)), cumulative
+            yield self.name + "_bucket", dict(labels, le="+Inf"), slot[-1]
+            yield self.name + "_sum", labels, slot[-2]
+            yield self.name + "_count", labels, slot[-1]
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(perf_counter() - self.start, **self.labels)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+_NULL_TIMER = _NullTimer()
+
+def timed(histogram, **labels):
+    """
+    `with timed(STAGE_SECONDS, stage="extract"): ...` records the block's
+    wall time (also when it raises).
+    """
+    if not ENABLED:
+        return _NULL_TIMER
+    return _Timer(histogram, labels)
+
+
+def render():
+    """
+    All metrics in the Prometheus text exposition format.
+    """
+    lines = []
+    for metric in _registry:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            if labels:
+                label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"{name}{{{label_text}}} {_fmt(value)}")
+            else:
+                lines.append(f"{name} {_fmt(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def _fmt(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# Metrics recorded by the pipeline. Counts are per process.
+STAGE_SECONDS = Histogram("m2a_stage_seconds", "Pipeline stage latency.", ["stage"])
+STORE_WRITE_SECONDS = Histogram("m2a_store_write_seconds", "Latency of writes to each store.", ["store"])
+REPORT_SECONDS = Histogram("m2a_report_render_seconds", "Report rendering latency per format.", ["format"])
+BYTES_WRITTEN = Counter("m2a_store_bytes_written_total", "Bytes written to each store.", ["store"])
+ACTION_ITEMS = Counter("m2a_action_items_total", "Action items extracted.")
+ISSUES_CREATED = Counter("m2a_issues_created_total", "Jira issues created.")
+MEETINGS = Counter("m2a_meetings_processed_total", "Meetings run through the pipeline.")
+RESULT_CACHE = Counter("m2a_result_cache_total", "Pipeline result cache lookups by outcome.", ["outcome"])
@@ -0,0 +1,215 @@
+# src/result_cache.py
+import copy
+import hashlib
+import os
+import threading
+from contextlib import ExitStack
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from .utils import file_lock, read_json, write_json
+from .metrics import RESULT_CACHE
+from .roster import roster_stamp
+
+RESULTS_DIR = Path("artifacts/results")
+RESULT_CACHE_SIZE = int(os.environ.get("M2A_RESULT_CACHE_SIZE", "256"))
+
+def result_hasher(meeting_id: str):
+    # sha256 to feed the UTF-8 transcript to; see result_key. Owners depend
+    # on the roster, so its stamp is part of the key.
+    h = hashlib.sha256()
+    h.update(meeting_id.encode("utf-8"))
+    h.update(b"\0")
+    h.update(roster_stamp().encode("ascii"))
+    h.update(b"\0")
+    return h
+
+def result_key(meeting_id: str, transcript: str):
+    h = result_hasher(meeting_id)
+    h.update(transcript.encode("utf-8"))
+    return h.hexdigest()
+
+def file_result_key(meeting_id: str, path):
+    # result_key of the transcript in a UTF-8 file, read in chunks
+    h = result_hasher(meeting_id)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ResultCache:
+    """
+    Pipeline results keyed by (meeting_id, sha256 of the transcript, roster).
+    The most recent `max_entries` are kept in memory (LRU) and every result
+    is persisted under artifacts/results/{key}.json, so a repeated
+    submission, also after a restart, returns the stored result without
+    running any stage. Concurrent calls for the same key wait for the one
+    computation already in flight: threads of this process on a Future,
+    other processes (uvicorn workers) on a lock on the result file. Failed
+    runs are not cached. Callers get their own copy of a cached result.
+    """
+    def __init__(self, path=RESULTS_DIR, max_entries: int = RESULT_CACHE_SIZE):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._lru = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, meeting_id: str, transcript: str, compute):
+        return self.get_or_compute_key(result_key(meeting_id, transcript), compute)
+
+    def get_or_compute_key(self, key: str, compute):
+        """
+        get_or_compute for a key already computed with result_hasher (e.g.
+        while a transcript file was being written).
+        """
+        result, claim = self.claim(key)
+        if claim is None:
+            return result
+        try:
+            result = compute()
+        except BaseException as e:
+            claim.fail(e)
+            raise
+        claim.done(result)
+        return result
+
+    def claim(self, key: str):
+        """
+        For callers that compute a result in several steps (run_batch).
+        Returns (result, None) when the result is stored, waiting first for
+        a computation of it in flight in this or another process (and
+        raising its error if it fails). Otherwise returns (None, claim):
+        the caller is the only one computing `key` and must end with
+        claim.done(result), claim.fail(error) or claim.release().
+
+        A caller holding claims on several keys waits on others' claims, so
+        such callers must claim their keys in sorted order.
+        """
+        while True:
+            with self._lock:
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    RESULT_CACHE.inc(outcome="hit")
+                    return copy.deepcopy(self._lru[key]), None
+                future = self._inflight.get(key)
+                owner = future is None
+                if owner:
+                    future = self._inflight[key] = Future()
+
+            if not owner:
+                try:
+                    result = future.result()
+                except _Released:
+                    continue  # given up without a result: claim it again
+                RESULT_CACHE.inc(outcome="coalesced")
+                return copy.deepcopy(result), None
+
+            claim = _Claim(self, key, future)
+            try:
+                # Checked again under the lock: another process may have
+                # just finished the same meeting.
+                claim.lock.enter_context(file_lock(self._result_path(key)))
+                result = self._load(key)
+            except BaseException as e:
+                claim.fail(e)
+                raise
+            if result is None:
+                RESULT_CACHE.inc(outcome="miss")
+                return None, claim
+            RESULT_CACHE.inc(outcome="hit")
+            claim.done(result, save=False)
+            return copy.deepcopy(result), None
+
+    def get(self, meeting_id: str, transcript: str):
+        """
+        The stored result, or None. Never computes or waits.
+        """
+        key = result_key(meeting_id, transcript)
+        with self._lock:
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                RESULT_CACHE.inc(outcome="hit")
+                return copy.deepcopy(self._lru[key])
+        result = self._load(key)
+        if result is not None:
+            RESULT_CACHE.inc(outcome="hit")
+            with self._lock:
+                self._remember(key, copy.deepcopy(result))
+        return result
+
+    def put(self, meeting_id: str, transcript: str, result):
+        key = result_key(meeting_id, transcript)
+        self._save(key, result)
+        with self._lock:
+            self._remember(key, copy.deepcopy(result))
+
+    def _remember(self, key, result):
+        if self.max_entries <= 0:
+            return
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def _result_path(self, key):
+        return self.path / f"{key}.json"
+
+    def _load(self, key):
+        try:
+            return read_json(self._result_path(key))
+        except ValueError:
+            return None
+
+    def _save(self, key, result):
+        # write_json replaces the file atomically: no truncated results
+        write_json(self._result_path(key), result)
+
+
+class _Released(Exception):
+    # Set on a claim's Future when it was given up without a result
+    pass
+
+
+class _Claim:
+    # The right to compute one key: its in-process Future and the file lock
+    # that keeps other processes waiting.
+    def __init__(self, cache, key, future):
+        self.cache = cache
+        self.key = key
+        self.future = future
+        self.lock = ExitStack()
+        self.finished = False
+
+    def done(self, result, save=True):
+        path = self.cache._result_path(self.key)
+        try:
+            if save:
+                self.cache._save(self.key, result)
+            # The result is on disk, so whoever gets the lock later (also on
+            # this unlinked file) finds it; drop the lock file rather than
+            # keep one per result.
+            path.with_name(path.name + ".lock").unlink(missing_ok=True)
+        except BaseException as e:
+            self.fail(e)
+            raise
+        stored = copy.deepcopy(result)
+        with self.cache._lock:
+            self.cache._remember(self.key, stored)
+        self._finish(lambda: self.future.set_result(stored))
+
+    def fail(self, error):
+        self._finish(lambda: self.future.set_exception(error))
+
+    def release(self):
+        if not self.finished:
+            self.fail(_Released())
+
+    def _finish(self, settle):
+        self.finished = True
+        self.lock.close()
+        with self.cache._lock:
+            self.cache._inflight.pop(self.key, None)
+        settle()
@@ -0,0 +1,214 @@
+# src/roster.py
+import csv
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+# CSV (name,email[,aliases]) or JSON roster used to resolve owners by name
+# in extract_action_items; unset = no roster.
+ROSTER_PATH = os.environ.get("M2A_ROSTER")
+
+ALIAS_SEPARATOR = ";"
+OWNER_VERB_RE = re.compile(r'\s+(?:will|to)\b')
+
+# Names that are also common words, mostly at the start of a sentence
+# ("Will we ship...", "May I add..."). They only count as an owner when
+# followed by "will" or "to".
+COMMON_WORD_NAMES = frozenset((
+    "amber april art bill bob buck case chase dawn don drew faith frank gene "
+    "grace grant guy hope iris ivy jack jay joy june mark max may miles pat "
+    "ray rich rob rose ruby sue summer victor will"
+).split())
+
+
+class Roster:
+    """
+    People (name, email, aliases) compiled into an Aho-Corasick automaton
+    over their lowercased names and aliases. `find(line)` scans a line once,
+    so its cost depends on the line, not on the size of the roster.
+
+    A first name is added as an alias when no one else in the roster has
+    it; a name or alias shared by several people is dropped as ambiguous.
+    Matches must be whole words starting with a capital letter in the text
+    (so "will" is never Will), and names in COMMON_WORD_NAMES must be
+    followed by "will" or "to" (so "Will we ship" is not Will either).
+    `stamp` identifies the roster's contents.
+    """
+    def __init__(self, people):
+        names, firsts = {}, {}
+        for person in people:
+            email = (person.get("email") or "").strip()
+            name = (person.get("name") or "").strip()
+            if not email:
+                continue
+            for n in [name] + [a.strip() for a in person.get("aliases") or []]:
+                if n:
+                    names.setdefault(n.lower(), set()).add(email)
+            if " " in name:
+                firsts.setdefault(name.split()[0].lower(), set()).add(email)
+
+        # lowercased name or alias -> email
+        self.emails = {n: next(iter(found)) for n, found in names.items() if len(found) == 1}
+        for first, found in firsts.items():
+            if len(found) == 1 and first not in names:
+                self.emails[first] = next(iter(found))
+        self.people = len(set(self.emails.values()))
+        self.stamp = hashlib.sha256(
+            "\n".join(f"{n}\t{e}" for n, e in sorted(self.emails.items())).encode("utf-8")
+        ).hexdigest()
+        self._compile()
+
+    def _compile(self):
+        # goto: one {char: node} dict per node; out: the patterns ending at
+        # a node, including through failure links, as (length, email, common)
+        goto, fail, out = [{}], [0], [[]]
+        for pattern, email in self.emails.items():
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][ch] = nxt
+                    goto.append({})
+                    fail.append(0)
+                    out.append([])
+                node = nxt
+            out[node].append((len(pattern), email, pattern in COMMON_WORD_NAMES))
+
+        queue = list(goto[0].values())  # depth 1 fails to the root
+        for node in queue:  # breadth first; the list grows while iterating
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def matches(self, line: str):
+        """
+        (start, end, email) of every roster name in `line`, left to right;
+        of overlapping matches the longest is kept.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        # per character, so that positions stay those of `line`
+        text = line.lower() if line.isascii() else [c.lower() for c in line]
+        found = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, email, common in out[node]:
+                start = i + 1 - length
+                if (line[start].isupper() and _is_word(line, start, i + 1)
+                        and not (common and not OWNER_VERB_RE.match(line, i + 1))):
+                    found.append((start, i + 1, email))
+        found.sort(key=lambda m: (m[0], -m[1]))
+        kept, end = [], 0
+        for m in found:
+            if m[0] >= end:
+                kept.append(m)
+                end = m[1]
+        return kept
+
+    def find(self, line: str):
+        """
+        The email of the owner named in `line`, or None: the first name
+        followed by "will" or "to", else the first name.
+        """
+        matches = self.matches(line)
+        for start, end, email in matches:
+            if OWNER_VERB_RE.match(line, end):
+                return email
+        return matches[0][2] if matches else None
+
+    def __len__(self):
+        return len(self.emails)
+
+
+def _is_word(line, start, end):
+    return (start == 0 or not line[start - 1].isalnum()) and (end == len(line) or not line[end].isalnum())
+
+
+def read_roster(path) -> Roster:
+    """
+    Builds a Roster from a CSV file with name, email and optional aliases
+    (separated by ";") columns, or from a JSON list of {"name", "email",
+    "aliases": [...]} objects.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        people = json.loads(path.read_text(encoding="utf-8"))
+    else:
+        with path.open(newline="", encoding="utf-8-sig") as f:
+            people = [dict(row, aliases=(row.get("aliases") or "").split(ALIAS_SEPARATOR))
+                      for row in csv.DictReader(f)]
+    return Roster(people)
+
+
+_cache = {}
+_cache_lock = threading.Lock()
+_unreadable = set()  # paths whose error was already reported
+
+def load_roster(path=None, reload=False):
+    """
+    The compiled roster for `path` (default: M2A_ROSTER), or None without
+    one. It is compiled once and reused until the file's mtime or size
+    changes, or until `reload` is set, so edits apply without a restart.
+    If the file cannot be read or parsed (e.g. it is being saved), the last
+    roster compiled from it is used, or None; with `reload` the error is
+    raised.
+    """
+    path = path or ROSTER_PATH
+    if not path:
+        return None
+    key = str(Path(path).resolve())
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        if reload:
+            raise
+        return _last_good(key, path, e)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None and cached[0] == stamp and not reload:
+        return cached[1]
+    try:
+        roster = read_roster(path)
+    except (OSError, ValueError) as e:
+        if reload:
+            raise
+        roster = _last_good(key, path, e)
+        with _cache_lock:
+            # Not parsed again until the file changes once more
+            _cache[key] = (stamp, roster)
+        return roster
+    with _cache_lock:
+        _unreadable.discard(key)
+        _cache[key] = (stamp, roster)
+    return roster
+
+
+def _last_good(key, path, error):
+    # The roster last compiled from `path`, reporting the error once
+    with _cache_lock:
+        cached = _cache.get(key)
+        if key not in _unreadable:
+            _unreadable.add(key)
+            print(f"[roster] cannot read {path}: {error}; using the last roster loaded")
+    return cached[1] if cached is not None else None
+
+
+def roster_stamp():
+    """
+    Identifies the default roster's contents ("" without one), so cached
+    pipeline results are not reused once the roster changes.
+    """
+    roster = load_roster()
+    return roster.stamp if roster is not None else ""
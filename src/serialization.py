@@ -0,0 +1,77 @@
+# src/serialization.py
+import json
+import os
+
+try:
+    import orjson
+except ImportError:  # optional, the json module is always available
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional
+    msgpack = None
+
+# How utils.write_json encodes files:
+#   "json"    compact JSON (orjson when installed), the default
+#   "pretty"  indented JSON, as files were written before
+#   "msgpack" MessagePack (needs the msgpack package, else "json" is used)
+# Files are read back whatever codec wrote them.
+JSON_CODEC = os.environ.get("M2A_JSON_CODEC", "json")
+CODECS = ("json", "pretty", "msgpack")
+
+# 0xc1 is never used by MessagePack and cannot start a JSON document, so the
+# prefix tells the two apart.
+MSGPACK_MAGIC = b"\xc1mpk"
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_SUBCLASS
+
+def _plain(obj):
+    # dict/list/str/int subclasses (e.g. MeetingRecord) as their base type,
+    # going through their own methods
+    if isinstance(obj, dict):
+        return dict(obj.items())
+    for base in (list, tuple, str, int, float):
+        if isinstance(obj, base):
+            return base(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_json(obj) -> bytes:
+    """
+    Compact JSON as UTF-8 bytes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_plain, option=_ORJSON_OPTS)
+        except TypeError:
+            pass  # e.g. integers past 64 bits: let the json module decide
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def loads_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def encode(obj, codec=None) -> bytes:
+    """
+    Serializes `obj` with `codec` (default: M2A_JSON_CODEC).
+    """
+    codec = codec or JSON_CODEC
+    if codec not in CODECS:
+        raise ValueError(f"unknown codec {codec!r}; expected one of {list(CODECS)}")
+    if codec == "msgpack" and msgpack is not None:
+        return MSGPACK_MAGIC + msgpack.packb(obj, use_bin_type=True, default=_plain)
+    if codec == "pretty":
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return dumps_json(obj)
+
+def decode(data: bytes):
+    """
+    Inverse of encode() for any codec.
+    """
+    if data.startswith(MSGPACK_MAGIC):
+        if msgpack is None:
+            raise RuntimeError("file is MessagePack-encoded but the msgpack package is not installed")
+        return msgpack.unpackb(data[len(MSGPACK_MAGIC):], raw=False, strict_map_key=False)
+    return loads_json(data)
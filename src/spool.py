@@ -0,0 +1,82 @@
+# src/spool.py
+import codecs
+import uuid
+from pathlib import Path
+from .result_cache import result_hasher
+
+UPLOADS_DIR = Path("artifacts/uploads")
+# Transcript files are read this many bytes at a time (cut at a newline).
+CHUNK_BYTES = 1 << 20
+
+
+class TranscriptSpool:
+    """
+    Writes an uploaded transcript to a file under artifacts/uploads/ as its
+    chunks arrive, checking that it is UTF-8 and computing its result-cache
+    key on the way, so the upload is never held in memory. Use as a context
+    manager; the file is deleted on exit.
+    """
+    def __init__(self, meeting_id: str, path=UPLOADS_DIR):
+        self.path = Path(path) / f"{uuid.uuid4().hex}.txt"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.size = 0
+        self._hash = result_hasher(meeting_id)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._file = self.path.open("wb")
+
+    def write(self, chunk: bytes):
+        # Raises ValueError (UnicodeDecodeError) on invalid UTF-8
+        self._decoder.decode(chunk)
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def close(self):
+        """
+        Finishes the file and returns its result-cache key.
+        """
+        self._decoder.decode(b"", final=True)
+        self._file.close()
+        return self._hash.hexdigest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+        self.path.unlink(missing_ok=True)
+
+
+def iter_transcript_chunks(path, chunk_bytes: int = CHUNK_BYTES):
+    """
+    Yields the transcript in `path` as str chunks of about `chunk_bytes`,
+    each ending at a newline (except the last). Only the chunk being
+    decoded is held in memory. (Plain reads rather than mmap: touched
+    pages of a mapping count towards the worker's RSS.)
+    """
+    with open(path, "rb") as f:
+        parts = []
+        for block in iter(lambda: f.read(chunk_bytes), b""):
+            cut = block.rfind(b"\n") + 1
+            if not cut:
+                parts.append(block)  # inside a long line
+                continue
+            parts.append(block[:cut])
+            yield b"".join(parts).decode("utf-8")
+            parts = [block[cut:]] if cut < len(block) else []
+        if parts:
+            yield b"".join(parts).decode("utf-8")
+
+
+def iter_transcript_lines(path, chunk_bytes: int = CHUNK_BYTES):
+    """
+    Yields the lines of the transcript in `path`, without their newlines,
+    as "\\n".join of them gives back the transcript.
+    """
+    last = None
+    for chunk in iter_transcript_chunks(path, chunk_bytes):
+        lines = chunk.split("\n")
+        last = lines.pop()
+        yield from lines
+    if last is not None:
+        yield last
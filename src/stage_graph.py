@@ -0,0 +1,64 @@
+# src/stage_graph.py
+from concurrent.futures import FIRST_COMPLETED, wait
+
+class Stage:
+    """
+    One node of a pipeline graph. `fn` is called with the results of the
+    stages named in `deps` as keyword arguments.
+    """
+    def __init__(self, name: str, fn, deps=()):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+
+
+def run_stages(stages, executor, on_stage=None):
+    """
+    Runs `stages` on `executor`, starting each one as soon as all of its
+    dependencies have finished, so independent stages overlap and the total
+    time follows the critical path. Returns {stage name: result}.
+    If a stage raises, no further stages are started, the running ones are
+    awaited and the first error is re-raised.
+    """
+    by_name = {s.name: s for s in stages}
+    for s in stages:
+        missing = [d for d in s.deps if d not in by_name]
+        if missing:
+            raise ValueError(f"stage {s.name!r} depends on unknown stages {missing}")
+
+    results = {}
+    running = {}
+    pending = list(stages)
+    error = None
+
+    def start_ready():
+        for s in list(pending):
+            if all(d in results for d in s.deps):
+                pending.remove(s)
+                if on_stage:
+                    on_stage(s.name, "running")
+                kwargs = {d: results[d] for d in s.deps}
+                running[executor.submit(s.fn, **kwargs)] = s
+
+    start_ready()
+    while running:
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            s = running.pop(future)
+            try:
+                results[s.name] = future.result()
+            except Exception as e:
+                if on_stage:
+                    on_stage(s.name, "failed")
+                error = error or e
+                continue
+            if on_stage:
+                on_stage(s.name, "done")
+        if error is None:
+            start_ready()
+
+    if error is not None:
+        raise error
+    if pending:
+        raise ValueError(f"stages {[s.name for s in pending]} form a dependency cycle")
+    return results
@@ -0,0 +1,230 @@
+# src/summarizers.py
+import os
+import random
+import re
+import time
+
+import numpy as np
+
+from .extractors import summarize_transcript
+
+# "lead" (first sentences, the original behaviour) or "centroid".
+SUMMARIZER = os.environ.get("M2A_SUMMARIZER", "lead")
+# The centroid summarizer scores at most this many sentences (a random
+# sample on longer transcripts) and stops tokenizing after this many ms.
+SUMMARY_MAX_SENTENCES = int(os.environ.get("M2A_SUMMARY_MAX_SENTENCES", "20000"))
+SUMMARY_BUDGET_MS = float(os.environ.get("M2A_SUMMARY_BUDGET_MS", "250"))
+
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+SPEAKER_RE = re.compile(r'^[A-Z][\w .-]{0,30}:\s*')
+WORD_RE = re.compile(r'[a-z0-9][a-z0-9@._-]*[a-z0-9]|[a-z]')
+
+STOPWORDS = frozenset("""
+a about after all also am an and any are as at be been but by can could did do does
+for from get got had has have he her here him his how i if in into is it its just
+let lets like me more my no not now of on one or our out over really right so some
+that the their them then there these they this to too up us was we well were what
+when which who will with would yeah yes you your okay ok sure thanks thank
+""".split())
+
+REDUNDANCY_THRESHOLD = 0.7
+
+
+def split_sentences(transcript: str):
+    # Lines, split further at sentence punctuation (the lookbehind split is
+    # only run on lines that can contain a boundary).
+    parts = []
+    for line in transcript.split("\n"):
+        if "." in line or "!" in line or "?" in line:
+            parts.extend(SENTENCE_SPLIT_RE.split(line))
+        else:
+            parts.append(line)
+    return [s for s in map(str.strip, parts) if s]
+
+
+def summarize_centroid(transcript: str, max_sentences: int = 3,
+                       sentence_budget: int = None, time_budget_ms: float = None, seed: int = 0) -> str:
+    """
+    Extractive summary: the sentences closest to the TF-IDF centroid of the
+    transcript, skipping near-duplicates, in transcript order.
+
+    Scoring is vectorized over a sparse (CSR-style) term matrix, so the cost
+    is linear in the number of tokens. Past `sentence_budget` sentences, or
+    once `time_budget_ms` is spent tokenizing, only a random sample of the
+    sentences (tokenized in shuffled order) is scored.
+    """
+    sentence_budget = SUMMARY_MAX_SENTENCES if sentence_budget is None else sentence_budget
+    time_budget_ms = SUMMARY_BUDGET_MS if time_budget_ms is None else time_budget_ms
+    deadline = time.perf_counter() + time_budget_ms / 1000
+    sentences = split_sentences(transcript)
+    return _centroid(sentences, lambda: summarize_transcript(transcript, max_sentences),
+                     max_sentences, sentence_budget, deadline, seed)
+
+
+def _centroid(sentences, lead, max_sentences, sentence_budget, deadline, seed):
+    # `lead()` gives the fallback summary for transcripts too short to rank
+    if len(sentences) <= max_sentences:
+        return lead()
+
+    # Shuffled so that a budget cut-off leaves an unbiased sample
+    order = np.random.default_rng(seed).permutation(len(sentences)).tolist()
+
+    vocab = {}
+    rows, indptr, indices, counts = [], [0], [], []
+    for n, i in enumerate(order):
+        if n >= sentence_budget or (n % 256 == 0 and n and time.perf_counter() > deadline):
+            break
+        terms = {}
+        for word in WORD_RE.findall(SPEAKER_RE.sub("", sentences[i]).lower()):
+            if word not in STOPWORDS:
+                t = vocab.setdefault(word, len(vocab))
+                terms[t] = terms.get(t, 0) + 1
+        if terms:
+            rows.append(i)
+            indices.extend(terms)
+            counts.extend(terms.values())
+            indptr.append(len(indices))
+
+    if len(rows) <= max_sentences:
+        return lead()
+
+    indptr = np.asarray(indptr)
+    indices = np.asarray(indices)
+    starts = indptr[:-1]
+    n_rows = len(rows)
+
+    # TF-IDF with sublinear tf, rows L2-normalized
+    df = np.bincount(indices, minlength=len(vocab))
+    idf = np.log((1 + n_rows) / (1 + df)) + 1.0
+    weights = (1.0 + np.log(np.asarray(counts, dtype=float))) * idf[indices]
+    norms = np.sqrt(np.add.reduceat(weights * weights, starts))
+    row_of = np.repeat(np.arange(n_rows), np.diff(indptr))
+    weights /= norms[row_of]
+
+    # cosine to the centroid = row . centroid / |centroid|
+    centroid = np.bincount(indices, weights=weights, minlength=len(vocab)) / n_rows
+    scores = np.add.reduceat(weights * centroid[indices], starts) / (np.linalg.norm(centroid) or 1.0)
+
+    chosen = []
+    for r in np.argsort(-scores, kind="stable"):
+        vec = dict(zip(indices[indptr[r]:indptr[r + 1]].tolist(), weights[indptr[r]:indptr[r + 1]].tolist()))
+        if any(_dot(vec, other) > REDUNDANCY_THRESHOLD for _, other in chosen):
+            continue
+        chosen.append((rows[r], vec))
+        if len(chosen) == max_sentences:
+            break
+
+    return "\n".join(f"- {sentences[i]}" for i in sorted(i for i, _ in chosen))
+
+
+def summarize_centroid_lines(lines, max_sentences: int = 3, sentence_budget: int = None,
+                             time_budget_ms: float = None, seed: int = 0) -> str:
+    """
+    summarize_centroid over an iterable of lines, read once. Only the lead
+    sentences and a uniform sample (reservoir) of `sentence_budget`
+    sentences are kept, so memory does not grow with the transcript.
+    """
+    sentence_budget = SUMMARY_MAX_SENTENCES if sentence_budget is None else sentence_budget
+    time_budget_ms = SUMMARY_BUDGET_MS if time_budget_ms is None else time_budget_ms
+    rng = random.Random(seed)
+    lead = _Lead(max_sentences)
+    sample, seen = [], 0
+    for line in lines:
+        lead.feed(line)
+        for sentence in split_sentences(line):
+            if len(sample) < sentence_budget:
+                sample.append((seen, sentence))
+            else:
+                j = rng.randrange(seen + 1)
+                if j < sentence_budget:
+                    sample[j] = (seen, sentence)
+            seen += 1
+    sample.sort()
+    deadline = time.perf_counter() + time_budget_ms / 1000
+    return _centroid([s for _, s in sample], lead.summary, max_sentences, len(sample), deadline, seed)
+
+
+def summarize_lead_lines(lines, max_sentences: int = 3) -> str:
+    """
+    summarize_transcript over an iterable of lines; stops reading once the
+    first `max_sentences` sentences are complete.
+    """
+    lead = _Lead(max_sentences)
+    for line in lines:
+        if lead.feed(line):
+            break
+    return lead.summary()
+
+
+class _Lead:
+    # summarize_transcript("\n".join(lines)) fed one line at a time. Only
+    # the new line is split: a sentence can end at the line break only if
+    # the text before it ends with punctuation.
+    def __init__(self, max_sentences):
+        self.max_sentences = max_sentences
+        self.sentences = []
+        self._pending = []  # lines of the sentence in progress
+
+    def feed(self, line):
+        # True once the summary is known
+        if len(self.sentences) >= self.max_sentences:
+            return True
+        if self._pending and self._pending[-1].endswith((".", "!", "?")):
+            self._flush()
+        first, *rest = SENTENCE_SPLIT_RE.split(line)
+        self._pending.append(first)
+        for part in rest:
+            self._flush()
+            self._pending.append(part)
+        return len(self.sentences) >= self.max_sentences
+
+    def _flush(self):
+        sentence = "\n".join(self._pending).strip()
+        self._pending = []
+        if sentence:
+            self.sentences.append(sentence)
+
+    def summary(self):
+        top = self.sentences[:self.max_sentences]
+        last = "\n".join(self._pending).strip()
+        if len(top) < self.max_sentences and last:
+            top.append(last)
+        if not top:
+            return "- No summary available."
+        return "\n".join(f"- {s}" for s in top)
+
+
+def _dot(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())
+
+
+STRATEGIES = {
+    "lead": summarize_transcript,
+    "centroid": summarize_centroid,
+}
+LINE_STRATEGIES = {
+    "lead": summarize_lead_lines,
+    "centroid": summarize_centroid_lines,
+}
+
+def summarize(transcript: str, strategy: str = None, max_sentences: int = 3) -> str:
+    """
+    Summarizes with the named strategy (default: M2A_SUMMARIZER).
+    """
+    return _strategy(STRATEGIES, strategy)(transcript, max_sentences=max_sentences)
+
+def summarize_lines(lines, strategy: str = None, max_sentences: int = 3) -> str:
+    """
+    summarize() for a transcript given as an iterable of lines (e.g. read
+    from a file), without holding it in memory.
+    """
+    return _strategy(LINE_STRATEGIES, strategy)(lines, max_sentences=max_sentences)
+
+def _strategy(table, strategy):
+    strategy = strategy or SUMMARIZER
+    try:
+        return table[strategy]
+    except KeyError:
+        raise ValueError(f"unknown summarizer {strategy!r}; expected one of {sorted(table)}")
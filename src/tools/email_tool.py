@@ -1,38 +1,125 @@
 # src/tools/email_tool.py
 from pathlib import Path
-from ..utils import timestamp, write_json
-import json
+from ..utils import timestamp, read_json, append_bytes, atomic_open, file_lock
+from ..serialization import dumps_json, loads_json
+from ..metrics import BYTES_WRITTEN, STORE_WRITE_SECONDS, timed
 
-EMAIL_LOG = Path("logs/email_log.json")
+EMAIL_LOG = Path("logs/email_log.jsonl")
+LEGACY_EMAIL_LOG = Path("logs/email_log.json")
 
-def ensure_email_log():
-    EMAIL_LOG.parent.mkdir(parents=True, exist_ok=True)
-    if not EMAIL_LOG.exists():
-        write_json(EMAIL_LOG, [])
+def ensure_email_log(path=EMAIL_LOG):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        path.touch()
 
 class EmailTool:
     """
-    Local email logger. Writes "sent emails" to logs/email_log.json
+    Local email logger. Appends "sent emails" to logs/email_log.jsonl, one JSON
+    object per line. Every send_* call appends its whole batch in one write.
+
+    Entries are {"to", "ticket", "sent_at"} for assignments, {"to",
+    "meeting_id", "tickets", "sent_at"} for digests and {"kind":
+    "due_reminder", ...} for reminders. The old logs/email_log.json array is
+    moved to the front of the new log once, then renamed to
+    email_log.json.migrated.
     """
-    def __init__(self):
-        ensure_email_log()
+    def __init__(self, path=EMAIL_LOG, legacy_path=LEGACY_EMAIL_LOG):
+        self.path = Path(path)
+        self.legacy_path = Path(legacy_path)
+        ensure_email_log(self.path)
+        if self.legacy_path.exists():
+            self._migrate_legacy_log()
 
     def send_assignment(self, to_email, ticket):
-        # Read existing log
-        try:
-            entries = json.loads(EMAIL_LOG.read_text())
-        except:
-            entries = []
+        return self.send_assignments([(to_email, ticket)])[0]
+
+    def send_assignments(self, assignments):
+        """
+        Sends one email per (to_email, ticket) pair.
+        """
+        sent_at = timestamp()
+        entries = [
+            {"to": to_email, "ticket": ticket, "sent_at": sent_at}
+            for to_email, ticket in assignments
+        ]
+        self._log(entries)
+
+        for entry in entries:
+            print(f"[EmailTool] Simulated email sent to {entry['to']} for ticket {entry['ticket']['id']}")
+
+        return [{"status": "sent"} for _ in entries]
+
+    def send_digests(self, digests, meeting_id=None):
+        """
+        Sends one email per recipient listing all of their tickets.
+        `digests` maps to_email -> list of tickets.
+        """
+        return self.send_digest_batches([(meeting_id, digests)])[0]
+
+    def send_digest_batches(self, batches):
+        """
+        `send_digests` for several meetings with a single log append.
+        `batches` is a list of (meeting_id, digests) pairs.
+        """
+        sent_at = timestamp()
+        entries = [
+            {"to": to_email, "meeting_id": meeting_id, "tickets": tickets, "sent_at": sent_at}
+            for meeting_id, digests in batches
+            for to_email, tickets in digests.items()
+        ]
+        self._log(entries)
+
+        for entry in entries:
+            ids = ", ".join(t["id"] for t in entry["tickets"])
+            print(f"[EmailTool] Simulated digest sent to {entry['to']} for tickets {ids}")
+
+        return [{to_email: {"status": "sent"} for to_email in digests} for _, digests in batches]
+
+    def send_reminders(self, reminders):
+        """
+        Sends due-date reminders with one log append. Each reminder is a
+        dict with "to", "meeting_id", "task" and "due".
+        """
+        sent_at = timestamp()
+        entries = [dict(reminder, kind="due_reminder", sent_at=sent_at) for reminder in reminders]
+        self._log(entries)
+
+        for entry in entries:
+            print(f"[EmailTool] Simulated reminder sent to {entry['to']}: due {entry['due']} - {entry['task']}")
 
-        entry = {
-            "to": to_email,
-            "ticket": ticket,
-            "sent_at": timestamp()
-        }
+        return [{"status": "sent"} for _ in entries]
 
-        entries.append(entry)
-        write_json(EMAIL_LOG, entries)
+    def entries(self):
+        """
+        Returns every logged email.
+        """
+        entries = []
+        with self.path.open("rb") as f:
+            for line in f:
+                try:
+                    entries.append(loads_json(line))
+                except ValueError:
+                    continue
+        return entries
 
-        print(f"[EmailTool] Simulated email sent to {to_email} for ticket {ticket['id']}")
+    def _migrate_legacy_log(self):
+        # Under the append lock, so no entry is appended in between.
+        with file_lock(self.path):
+            if not self.legacy_path.exists():
+                return  # migrated by another process
+            try:
+                legacy = read_json(self.legacy_path) or []
+            except Exception:
+                legacy = []
+            with atomic_open(self.path) as out, self.path.open("rb") as current:
+                out.write(b"".join(dumps_json(e) + b"\n" for e in legacy))
+                out.write(current.read())
+            self.legacy_path.replace(self.legacy_path.with_name(self.legacy_path.name + ".migrated"))
 
-        return {"status": "sent"}
\ No newline at end of file
+    def _log(self, entries):
+        if entries:
+            data = b"".join(dumps_json(e) + b"\n" for e in entries)
+            with timed(STORE_WRITE_SECONDS, store="email"):
+                append_bytes(self.path, data)
+            BYTES_WRITTEN.inc(len(data), store="email")
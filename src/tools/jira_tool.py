@@ -1,38 +1,318 @@
 # src/tools/jira_tool.py
+import os
+import threading
 import uuid
+from bisect import bisect_left, bisect_right
 from pathlib import Path
-from ..utils import write_json, timestamp
-import json
+from ..utils import write_json, read_json, append_bytes, file_lock, timestamp
+from ..serialization import dumps_json, loads_json
+from ..metrics import BYTES_WRITTEN, ISSUES_CREATED, STORE_WRITE_SECONDS, timed
 
 JIRA_DB = Path("artifacts/jira_issues.json")
+JIRA_LOG = Path("artifacts/jira_issues.jsonl")
+
+# Compact once at least this many superseded/unreadable records pile up
+# and they outnumber the live ones (checked after appends and at startup).
+COMPACT_MIN_DEAD = 1000
 
 class JiraTool:
     """
-    Local Jira-like tool. Stores issues in artifacts/jira_issues.json
+    Local Jira-like tool. Issues are appended to artifacts/jira_issues.jsonl
+    (one JSON object per line) and located through an in-memory
+    id -> byte offset index that is built once when the tool starts.
+    Creating an issue is a single append; the JSON array view in
+    artifacts/jira_issues.json is produced on demand by `export_json()`
+    (GET /issues/export).
+    Secondary indexes by assignee, due date and creation time, kept up to
+    date by the same catch-up pass, serve `query_issues()`.
+
+    Several processes may share the log: appends and compaction are
+    serialized by a file lock (see utils.append_bytes), and an instance
+    whose log was compacted by another process notices the new file and
+    re-indexes it.
     """
-    def __init__(self):
-        JIRA_DB.parent.mkdir(parents=True, exist_ok=True)
-        if not JIRA_DB.exists():
-            write_json(JIRA_DB, [])
+    def __init__(self, log_path=JIRA_LOG, export_path=JIRA_DB):
+        self.log_path = Path(log_path)
+        self.export_path = Path(export_path)
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.log_path.exists():
+            with file_lock(self.log_path):
+                if not self.log_path.exists():
+                    self._import_json_array()
+
+        self._mutex = threading.RLock()
+        self._reset_index()
+        self._catch_up()
+        if self._needs_compaction():
+            self.compact()
 
     def create_issue(self, summary, assignee=None, due=None, description=None):
+        return self.create_issues([{
+            "summary": summary,
+            "assignee": assignee,
+            "due": due,
+            "description": description
+        }])[0]
+
+    def create_issues(self, batch):
+        """
+        Creates several issues with a single append. `batch` is a list of
+        dicts with the `create_issue` keyword arguments. Either every issue
+        in the batch is committed or none is.
+        """
+        issues = []
+        for item in batch:
+            issues.append({
+                "id": f"ISSUE-{uuid.uuid4().hex[:8]}",
+                "summary": item.get("summary"),
+                "assignee": item.get("assignee"),
+                "due": item.get("due"),
+                "description": item.get("description"),
+                "created_at": timestamp()
+            })
+
+        if issues:
+            self._append(issues)
+            ISSUES_CREATED.inc(len(issues))
+        return issues
+
+    def update_issue(self, issue_id, **fields):
+        """
+        Appends a new version of an existing issue; the previous record is
+        dropped at the next compaction.
+        """
+        # Held across read and append so concurrent updates (from any
+        # process) apply on top of each other instead of overwriting.
+        with file_lock(self.log_path.with_name(self.log_path.name + ".update")):
+            issue = self.get_issue(issue_id)
+            if issue is None:
+                return None
+            issue.update(fields)
+            issue["id"] = issue_id
+            self._append([issue])
+        return issue
+
+    def get_issue(self, issue_id):
+        with self._open_log() as f:
+            offset = self._index.get(issue_id)
+            if offset is None:
+                return None
+            f.seek(offset)
+            return loads_json(f.readline())
+
+    def iter_issues(self):
+        """
+        Yields the current version of every issue in creation order.
+        """
+        with self._open_log() as f:
+            offset = 0
+            for line in f:
+                if offset >= self._indexed_size:
+                    break
+                record = _parse_line(line)
+                if record is not None and self._index.get(record["id"]) == offset:
+                    yield record
+                offset += len(line)
+
+    def list_issues(self):
+        return list(self.iter_issues())
+
+    def query_issues(self, assignee=None, due_from=None, due_to=None,
+                     created_from=None, created_to=None, limit=50, offset=0):
+        """
+        Issues matching every given filter, in creation order, as
+        (total, page). Dates are ISO strings compared as such; ranges are
+        inclusive and a date-only bound such as created_to="2025-12-01"
+        covers that whole day. Assignees match case-insensitively.
+
+        Only the index entries for the narrowest filter are scanned and only
+        the issues on the requested page are read from the log.
+        """
+        f = self._open_log()
+        with f, self._mutex:
+            return self._query(f, assignee, due_from, due_to, created_from, created_to, limit, offset)
+
+    def _query(self, f, assignee, due_from, due_to, created_from, created_to, limit, offset):
+        candidates = []
+        if assignee is not None:
+            candidates.append(self._by_assignee.get(_norm(assignee), {}).keys())
+        if due_from is not None or due_to is not None:
+            candidates.append(_range(self._by_due, due_from, due_to))
+        if created_from is not None or created_to is not None:
+            candidates.append(_range(self._by_created, created_from, created_to))
+
+        if candidates:
+            candidates.sort(key=len)
+            ids = set(candidates[0])
+            for other in candidates[1:]:
+                ids.intersection_update(other)
+            ids = sorted(ids, key=self._seq.__getitem__)
+        else:
+            ids = sorted(self._index, key=self._seq.__getitem__)
+
+        issues = []
+        for issue_id in ids[offset:offset + limit]:
+            f.seek(self._index[issue_id])
+            issues.append(loads_json(f.readline()))
+        return len(ids), issues
+
+    def export_json(self, path=None):
+        """
+        Writes the classic JSON array view (artifacts/jira_issues.json).
+        """
+        path = Path(path) if path else self.export_path
+        # Always JSON, whatever M2A_JSON_CODEC says: the export is read by
+        # other tools
+        write_json(path, self.list_issues(), codec="json")
+        return path
+
+    def compact(self):
+        """
+        Rewrites the log keeping only the current version of each issue.
+        Appends from every process wait until the new log is in place.
+        """
+        with file_lock(self.log_path), self._mutex:
+            tmp = self.log_path.with_name(self.log_path.name + ".tmp")
+            with tmp.open("wb") as f:
+                for issue in self.iter_issues():
+                    f.write(_encode(issue))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.log_path)
+
+            self._reset_index()
+            self._catch_up()
+
+    def _append(self, issues):
+        data = b"".join(_encode(issue) for issue in issues)
+        with timed(STORE_WRITE_SECONDS, store="jira"):
+            append_bytes(self.log_path, data)
+        BYTES_WRITTEN.inc(len(data), store="jira")
+        self._catch_up()
+        if self._needs_compaction():
+            self.compact()
+
+    def _needs_compaction(self):
+        return self._dead >= COMPACT_MIN_DEAD and self._dead > len(self._index)
+
+    def _open_log(self):
+        # An open log file whose index is current. If another process
+        # compacted (replaced) the log in between, index the new file.
+        while True:
+            self._catch_up()
+            f = self.log_path.open("rb")
+            if os.fstat(f.fileno()).st_ino == self._inode:
+                return f
+            f.close()
+
+    def _catch_up(self):
+        # Index whatever was appended since the last call (by this or any
+        # other JiraTool instance). A trailing line without a newline is an
+        # append still in progress and is left for the next call. A new
+        # inode (or a shorter file) means the log was compacted elsewhere.
+        with self._mutex, self.log_path.open("rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_ino != self._inode or st.st_size < self._indexed_size:
+                self._reset_index()
+                self._inode = st.st_ino
+            if st.st_size == self._indexed_size:
+                return
+            f.seek(self._indexed_size)
+            offset = self._indexed_size
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                record = _parse_line(line)
+                if record is None:
+                    self._dead += 1
+                else:
+                    if record["id"] in self._index:
+                        self._dead += 1
+                    self._index[record["id"]] = offset
+                    self._index_fields(record)
+                offset += len(line)
+            self._indexed_size = offset
+            self._sort_fields()
+
+    def _reset_index(self):
+        self._inode = None
+        self._index = {}
+        self._indexed_size = 0
+        self._dead = 0
+        self._seq = {}          # id -> creation order
+        self._fields = {}       # id -> (assignee, due, created_at) as indexed
+        self._by_assignee = {}  # normalized assignee -> {id: None}
+        self._by_due = []       # sorted [(due, id)]
+        self._by_created = []   # sorted [(created_at, id)]
+        self._unsorted = False
+
+    def _sort_fields(self):
+        # New entries are appended during a catch-up and sorted once at the
+        # end (mostly already in order, so this is close to linear).
+        if self._unsorted:
+            self._by_due.sort()
+            self._by_created.sort()
+            self._unsorted = False
+
+    def _index_fields(self, record):
+        issue_id = record["id"]
+        fields = (_norm(record.get("assignee")), _str_or_none(record.get("due")),
+                  _str_or_none(record.get("created_at")))
+        old = self._fields.get(issue_id)
+        if old == fields:
+            return
+        self._seq.setdefault(issue_id, len(self._seq))
+        if old is not None:
+            self._sort_fields()
+            self._by_assignee.get(old[0], {}).pop(issue_id, None)
+            for entries, key in ((self._by_due, old[1]), (self._by_created, old[2])):
+                if key is not None:
+                    i = bisect_left(entries, (key, issue_id))
+                    if i < len(entries) and entries[i] == (key, issue_id):
+                        del entries[i]
+        self._fields[issue_id] = fields
+        self._by_assignee.setdefault(fields[0], {})[issue_id] = None
+        if fields[1] is not None:
+            self._by_due.append((fields[1], issue_id))
+        if fields[2] is not None:
+            self._by_created.append((fields[2], issue_id))
+        self._unsorted = True
+
+    def _import_json_array(self):
+        # First start on a tree that still has the old JSON array store.
         issues = []
         try:
-            issues = json.loads(JIRA_DB.read_text())
+            issues = read_json(self.export_path) or []
         except Exception:
             issues = []
+        self.log_path.write_bytes(b"".join(_encode(issue) for issue in issues))
 
-        issue_id = f"ISSUE-{uuid.uuid4().hex[:8]}"
-        issue = {
-            "id": issue_id,
-            "summary": summary,
-            "assignee": assignee,
-            "due": due,
-            "description": description,
-            "created_at": timestamp()
-        }
 
-        issues.append(issue)
-        write_json(JIRA_DB, issues)
+def _encode(issue):
+    return dumps_json(issue) + b"\n"
+
+
+def _norm(assignee):
+    return assignee.strip().lower() if isinstance(assignee, str) else None
+
+
+def _str_or_none(value):
+    return value if isinstance(value, str) and value else None
+
+
+def _range(entries, low, high):
+    # ids of the (key, id) entries with low <= key <= high; a bare date as
+    # the upper bound includes timestamps later that day
+    start = 0 if low is None else bisect_left(entries, (low,))
+    end = len(entries) if high is None else bisect_right(entries, (high + "\uffff",))
+    return [issue_id for _, issue_id in entries[start:end]]
+
 
-        return issue
\ No newline at end of file
+def _parse_line(line):
+    try:
+        record = loads_json(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict) or "id" not in record:
+        return None
+    return record
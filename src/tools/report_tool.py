@@ -1,21 +1,79 @@
 # src/tools/report_tool.py
 import os
+import re
+import copy
+import json
+import uuid
+import hashlib
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 from docx import Document
 from docx.shared import Pt, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.units import mm
+from ..utils import write_json, read_json
+from ..metrics import BYTES_WRITTEN, REPORT_SECONDS, timed
 
 REPORTS_DIR = Path("artifacts/reports")
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
-def _safe_name(meeting_id: str):
-    ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-    return f"{meeting_id}_{ts}"
+RENDERED_FORMATS = ("docx", "pdf", "rtf")
+REPORT_NAME_RE = re.compile(r'^(report_.+)\.(txt|docx|pdf|rtf)$')
+
+# Worker processes for DOCX/PDF/RTF rendering; 0 renders in the calling thread.
+REPORT_PROCESSES = int(os.environ.get("M2A_REPORT_PROCESSES", str(min(3, os.cpu_count() or 1))))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def _render_pool():
+    # One spawn-based pool per process; spawn avoids forking a process that
+    # already runs request and stage threads.
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=REPORT_PROCESSES,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+def _discard_pool(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+def _render(fmt: str, path: Path, meeting_id, summary, actions, created_issues, notifications, date=None):
+    # Module-level so it can run in a worker process. Returns the render
+    # time, which the parent records (metrics are per process).
+    builder = getattr(ReportTool(), f"_build_{fmt}")
+    start = time.perf_counter()
+    try:
+        builder(path, meeting_id, summary, actions, created_issues, notifications, date)
+    except Exception as e:
+        print(f"[ReportTool] {fmt.upper()} generation error:", e)
+        Path(path).unlink(missing_ok=True)
+    return time.perf_counter() - start
+
+def _report_name(meeting_id, summary, actions, created_issues, notifications):
+    # Content-addressed: identical pipeline output maps to the same files.
+    payload = json.dumps([meeting_id, summary, actions, created_issues, notifications],
+                         sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    return f"report_{meeting_id}_{digest}"
+
+def report_date(date=None):
+    # The date printed in a report: the day it was generated
+    return date or datetime.utcnow().strftime("%d %b %Y")
 
 def format_summary_lines(summary_text: str):
     # summary_text might be "- s1\n- s2..."
@@ -32,50 +90,105 @@ class ReportTool:
     """
     Generates DOCX (Word), PDF and RTF meeting reports from structured pipeline output.
     """
+    def __init__(self):
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
-    def generate(self, meeting_id: str, summary: str, actions: list, created_issues: list, notifications: list):
+    def generate(self, meeting_id: str, summary: str, actions: list, created_issues: list,
+                 notifications: list, eager: bool = False):
         """
         Returns dict with paths: {'docx':..., 'pdf':..., 'rtf':..., 'text': ...}
+
+        Only the plain-text report is written here. DOCX, PDF and RTF are
+        rendered by `render()` the first time they are requested (or right
+        away with eager=True). File names carry a hash of the inputs, so
+        repeated identical requests reuse the files already on disk.
         """
-        safe = _safe_name(meeting_id)
-        docx_path = REPORTS_DIR / f"report_{safe}.docx"
-        pdf_path = REPORTS_DIR / f"report_{safe}.pdf"
-        rtf_path = REPORTS_DIR / f"report_{safe}.rtf"
-        txt_path = REPORTS_DIR / f"report_{safe}.txt"
-
-        # Build the "clean text" (plain but nicely formatted) for preview
-        text = self._build_plain_text(meeting_id, summary, actions, created_issues, notifications)
-        (REPORTS_DIR / txt_path.name).write_text(text, encoding="utf-8")
-
-        # Create DOCX
-        try:
-            self._build_docx(docx_path, meeting_id, summary, actions, created_issues, notifications)
-        except Exception as e:
-            print("[ReportTool] DOCX generation error:", e)
-
-        # Create PDF
-        try:
-            self._build_pdf(pdf_path, meeting_id, summary, actions, created_issues, notifications)
-        except Exception as e:
-            print("[ReportTool] PDF generation error:", e)
-
-        # Create RTF (simple)
-        try:
-            self._build_rtf(rtf_path, meeting_id, summary, actions, created_issues, notifications)
-        except Exception as e:
-            print("[ReportTool] RTF generation error:", e)
+        name = _report_name(meeting_id, summary, actions, created_issues, notifications)
+        txt_path = REPORTS_DIR / f"{name}.txt"
+        manifest_path = REPORTS_DIR / f"{name}.json"
+
+        if not manifest_path.exists():
+            # Every format carries this date, however much later it is rendered
+            date = report_date()
+            # Build the "clean text" (plain but nicely formatted) for preview
+            with timed(REPORT_SECONDS, format="txt"):
+                text = self._build_plain_text(meeting_id, summary, actions, created_issues, notifications, date).encode("utf-8")
+                txt_path.write_bytes(text)
+            BYTES_WRITTEN.inc(len(text), store="reports")
+            # Keep the inputs so the other formats can be rendered on demand
+            write_json(manifest_path, {
+                "meeting_id": meeting_id,
+                "summary": summary,
+                "actions": actions,
+                "created_issues": created_issues,
+                "notifications": notifications,
+                "date": date
+            })
+
+        if eager:
+            missing = [fmt for fmt in RENDERED_FORMATS if not (REPORTS_DIR / f"{name}.{fmt}").exists()]
+            self._render_formats(name, missing)
 
         return {
             "report_text_path": str(txt_path),
-            "report_docx_path": str(docx_path),
-            "report_pdf_path": str(pdf_path),
-            "report_rtf_path": str(rtf_path),
+            "report_docx_path": str(REPORTS_DIR / f"{name}.docx"),
+            "report_pdf_path": str(REPORTS_DIR / f"{name}.pdf"),
+            "report_rtf_path": str(REPORTS_DIR / f"{name}.rtf"),
         }
 
-    def _build_plain_text(self, meeting_id, summary, actions, created_issues, notifications):
+    def render(self, filename: str):
+        """
+        Returns the path of a report file under REPORTS_DIR, rendering it
+        from its stored inputs first if needed. Returns None for unknown
+        reports or if rendering failed.
+        """
+        m = REPORT_NAME_RE.match(filename)
+        if not m or Path(filename).name != filename:
+            return None
+        name, fmt = m.groups()
+        path = REPORTS_DIR / filename
+        if not path.exists() and fmt in RENDERED_FORMATS:
+            self._render_formats(name, [fmt])
+        return path if path.exists() else None
+
+    def _render_formats(self, name, formats):
+        manifest = read_json(REPORTS_DIR / f"{name}.json")
+        if manifest is None or not formats:
+            return
+        # Manifests from before the date was stored: the day they were written
+        date = manifest.get("date") or datetime.utcfromtimestamp(
+            (REPORTS_DIR / f"{name}.json").stat().st_mtime).strftime("%d %b %Y")
+        args = (manifest["meeting_id"], manifest["summary"], manifest["actions"],
+                manifest["created_issues"], manifest["notifications"], date)
+
+        # Render into temporary files and rename, so concurrent requests for
+        # the same report never see a half-written file.
+        jobs = [(fmt, REPORTS_DIR / f".{name}.{uuid.uuid4().hex}.{fmt}") for fmt in formats]
+        self._run_renders(jobs, args)
+        for fmt, tmp in jobs:
+            if tmp.exists():
+                BYTES_WRITTEN.inc(tmp.stat().st_size, store="reports")
+                os.replace(tmp, REPORTS_DIR / f"{name}.{fmt}")
+
+    def _run_renders(self, jobs, args):
+        # _render reports its own errors, so anything raised here is the pool.
+        if REPORT_PROCESSES > 0:
+            pool = _render_pool()
+            try:
+                futures = [pool.submit(_render, fmt, path, *args) for fmt, path in jobs]
+                for (fmt, _), future in zip(jobs, futures):
+                    REPORT_SECONDS.observe(future.result(), format=fmt)
+                return
+            except BrokenProcessPool as e:
+                print("[ReportTool] render pool failed, rendering in-process:", e)
+                _discard_pool(pool)
+        for fmt, path in jobs:
+            REPORT_SECONDS.observe(_render(fmt, path, *args), format=fmt)
+
+    def _build_plain_text(self, meeting_id, summary, actions, created_issues, notifications, date=None):
         # Use the natural-language format you requested
         lines = []
-        now = datetime.utcnow().strftime("%d %b %Y")
+        now = report_date(date)
         lines.append(f"Meeting Summary – {meeting_id}")
         lines.append(f"Date: {now}")
         lines.append("")
@@ -101,52 +214,121 @@ class ReportTool:
             lines.append(f"- Issue {n.get('issue')} -> status: {n.get('email_status')}")
         return "\n".join(lines)
 
-    def _build_docx(self, path: Path, meeting_id, summary, actions, created_issues, notifications):
+    def _build_docx(self, path: Path, meeting_id, summary, actions, created_issues, notifications, date=None):
+        get_renderer().build_docx(path, meeting_id, summary, actions, created_issues, notifications, date)
+
+    def _build_pdf(self, path: Path, meeting_id, summary, actions, created_issues, notifications, date=None):
+        get_renderer().build_pdf(path, meeting_id, summary, actions, created_issues, notifications, date)
+
+    def _build_rtf(self, path: Path, meeting_id, summary, actions, created_issues, notifications, date=None):
+        # Simple RTF writer with bold headings and blue color for headings
+        def rtf_escape(s: str):
+            return s.replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}')
+        blue_rgb = r'\red19\green71\blue138'
+        parts = []
+        parts.append(r'{\rtf1\ansi')
+        parts.append(r'{\colortbl ;' + blue_rgb + ';}')
+        parts.append(r'\fs24')  # default font size
+        parts.append(r'\b\cf1 ' + rtf_escape(f"Meeting Summary – {meeting_id}") + r'\b0\par')
+        parts.append(rtf_escape("Date: " + report_date(date)) + r'\par\par')
+        parts.append(r'\b\cf0 Summary of Discussion\b0\par')
+        for s in format_summary_lines(summary):
+            parts.append(rtf_escape("• " + s) + r'\par')
+        parts.append(r'\par')
+        parts.append(r'\b Extracted Action Items\b0\par')
+        for idx, a in enumerate(actions, start=1):
+            parts.append(rtf_escape(f"{idx}. {a.get('task')}") + r'\par')
+            parts.append(rtf_escape(f"   Owner: {a.get('owner') or 'Not assigned'}") + r'\par')
+            parts.append(rtf_escape(f"   Due: {a.get('due') or 'Not specified'}") + r'\par')
+        parts.append(r'\par')
+        parts.append(r'\b Tasks Created\b0\par')
+        for t in created_issues:
+            parts.append(rtf_escape(f"- {t.get('id')} — {t.get('summary')} (Owner: {t.get('assignee') or 'No owner'}; Due: {t.get('due') or 'Not specified'})") + r'\par')
+        parts.append(r'\par')
+        parts.append(r'\b Notifications Sent\b0\par')
+        for n in notifications:
+            parts.append(rtf_escape(f"- Issue {n.get('issue')} -> status: {n.get('email_status')}") + r'\par')
+        parts.append('}')
+        path.write_text("\n".join(parts), encoding="utf-8")
+
+
+BLUE = RGBColor(0x13, 0x47, 0x8A)  # professional blue
+
+class ReportRenderer:
+    """
+    Per-process DOCX/PDF rendering state. The PDF paragraph styles and a base
+    DOCX document (Normal font plus title/heading styles) are built once;
+    each report starts from a copy of the base document and only adds content.
+    """
+    def __init__(self):
+        styles = getSampleStyleSheet()
+        self.pdf_normal = styles['Normal']
+        self.pdf_heading = ParagraphStyle('Heading', parent=styles['Heading1'], fontName='Helvetica-Bold', fontSize=16, textColor="#13478A")
+        self.pdf_sub = ParagraphStyle('Sub', parent=styles['Heading2'], fontName='Helvetica-Bold', fontSize=12, textColor="#13478A")
+        self.pdf_bullet = ParagraphStyle('Bul', parent=self.pdf_normal, leftIndent=12, spaceAfter=6)
+
+        self._docx_base = self._make_docx_base()
+        self._docx_lock = threading.Lock()
+        # python-docx resolves a style name by scanning every style in the
+        # document, per paragraph; resolve the ids we use once instead.
+        self._style_ids = {
+            name: self._docx_base.styles[name].style_id
+            for name in ('Report Title', 'Report Heading', 'List Bullet', 'List Number')
+        }
+
+    def _make_docx_base(self):
         doc = Document()
-        style = doc.styles['Normal']
-        font = style.font
+        font = doc.styles['Normal'].font
         font.name = 'Calibri'
         font.size = Pt(11)
 
+        title = doc.styles.add_style('Report Title', WD_STYLE_TYPE.PARAGRAPH)
+        title.base_style = doc.styles['Normal']
+        title.font.bold = True
+        title.font.name = "Calibri"
+        title.font.size = Pt(18)
+        title.font.color.rgb = BLUE
+        title.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+
+        heading = doc.styles.add_style('Report Heading', WD_STYLE_TYPE.PARAGRAPH)
+        heading.base_style = doc.styles['Normal']
+        heading.font.bold = True
+        heading.font.size = Pt(14)
+        heading.font.color.rgb = BLUE
+        return doc
+
+    def new_docx(self):
+        # Copying the parsed base is about half the cost of Document().
+        with self._docx_lock:
+            return copy.deepcopy(self._docx_base)
+
+    def build_docx(self, path: Path, meeting_id, summary, actions, created_issues, notifications, date=None):
+        doc = self.new_docx()
+
         # Title
-        title = doc.add_paragraph()
-        run = title.add_run(f"Meeting Summary – {meeting_id}")
-        run.bold = True
-        run.font.name = "Calibri"
-        run.font.size = Pt(18)
-        run.font.color.rgb = RGBColor(0x13, 0x47, 0x8A)  # professional blue
-        title.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
+        self._add(doc, f"Meeting Summary – {meeting_id}", 'Report Title')
         doc.add_paragraph("")
 
         # Date / meta
         date_p = doc.add_paragraph()
         date_p.add_run("Date: ").bold = True
-        date_p.add_run(datetime.utcnow().strftime("%d %b %Y"))
+        date_p.add_run(report_date(date))
         doc.add_paragraph("")
 
         # Summary of Discussion
-        h = doc.add_paragraph()
-        run = h.add_run("Summary of Discussion")
-        run.bold = True
-        run.font.size = Pt(14)
-        run.font.color.rgb = RGBColor(0x13, 0x47, 0x8A)
+        self._add(doc, "Summary of Discussion", 'Report Heading')
         doc.add_paragraph("")
         for s in format_summary_lines(summary):
-            p = doc.add_paragraph(s, style='List Bullet')
-            p_format = p.paragraph_format
-            p_format.space_after = Pt(2)
+            p = self._add(doc, s, 'List Bullet')
+            p.paragraph_format.space_after = Pt(2)
 
         doc.add_paragraph("")
 
         # Action Items (as enumerated list with owner/due)
-        h2 = doc.add_paragraph()
-        run = h2.add_run("Extracted Action Items")
-        run.bold = True
-        run.font.size = Pt(14)
-        run.font.color.rgb = RGBColor(0x13, 0x47, 0x8A)
+        self._add(doc, "Extracted Action Items", 'Report Heading')
         doc.add_paragraph("")
         for idx, a in enumerate(actions, start=1):
-            p = doc.add_paragraph(f"{idx}. {a.get('task')}", style='List Number')
+            self._add(doc, f"{idx}. {a.get('task')}", 'List Number')
             # owner and due as indented lines
             p2 = doc.add_paragraph(f"Owner: {a.get('owner') or 'Not assigned'}")
             p2.paragraph_format.left_indent = Pt(18)
@@ -156,25 +338,17 @@ class ReportTool:
         doc.add_paragraph("")
 
         # Tasks Created
-        h3 = doc.add_paragraph()
-        run = h3.add_run("Tasks Created")
-        run.bold = True
-        run.font.size = Pt(14)
-        run.font.color.rgb = RGBColor(0x13, 0x47, 0x8A)
+        self._add(doc, "Tasks Created", 'Report Heading')
         doc.add_paragraph("")
         for t in created_issues:
-            p = doc.add_paragraph(f"- {t.get('id')} — {t.get('summary')}")
+            doc.add_paragraph(f"- {t.get('id')} — {t.get('summary')}")
             p2 = doc.add_paragraph(f"  Owner: {t.get('assignee') or 'No owner'}; Due: {t.get('due') or 'Not specified'}")
             p2.paragraph_format.left_indent = Pt(12)
 
         doc.add_paragraph("")
 
         # Notifications
-        h4 = doc.add_paragraph()
-        run = h4.add_run("Notifications Sent")
-        run.bold = True
-        run.font.size = Pt(14)
-        run.font.color.rgb = RGBColor(0x13, 0x47, 0x8A)
+        self._add(doc, "Notifications Sent", 'Report Heading')
         doc.add_paragraph("")
         for n in notifications:
             doc.add_paragraph(f"- Issue {n.get('issue')} -> status: {n.get('email_status')}")
@@ -182,21 +356,26 @@ class ReportTool:
         # Save
         doc.save(path)
 
-    def _build_pdf(self, path: Path, meeting_id, summary, actions, created_issues, notifications):
+    def _add(self, doc, text, style=None):
+        p = doc.add_paragraph(text)
+        if style:
+            p._p.style = self._style_ids[style]
+        return p
+
+    def build_pdf(self, path: Path, meeting_id, summary, actions, created_issues, notifications, date=None):
         # Use a simple flowable document
         doc = SimpleDocTemplate(str(path), pagesize=A4,
                                 leftMargin=20*mm, rightMargin=20*mm, topMargin=20*mm, bottomMargin=20*mm)
-        styles = getSampleStyleSheet()
-        styleN = styles['Normal']
-        styleH = ParagraphStyle('Heading', parent=styles['Heading1'], fontName='Helvetica-Bold', fontSize=16, textColor="#13478A")
-        styleSub = ParagraphStyle('Sub', parent=styles['Heading2'], fontName='Helvetica-Bold', fontSize=12, textColor="#13478A")
-        styleBul = ParagraphStyle('Bul', parent=styleN, leftIndent=12, spaceAfter=6)
+        styleN = self.pdf_normal
+        styleH = self.pdf_heading
+        styleSub = self.pdf_sub
+        styleBul = self.pdf_bullet
 
         story = []
         story.append(Paragraph(f"Meeting Summary – {meeting_id}", styleH))
         story.append(Spacer(1, 6))
 
-        story.append(Paragraph(f"<b>Date:</b> {datetime.utcnow().strftime('%d %b %Y')}", styleN))
+        story.append(Paragraph(f"<b>Date:</b> {report_date(date)}", styleN))
         story.append(Spacer(1, 8))
 
         story.append(Paragraph("Summary of Discussion", styleSub))
@@ -221,33 +400,16 @@ class ReportTool:
 
         doc.build(story)
 
-    def _build_rtf(self, path: Path, meeting_id, summary, actions, created_issues, notifications):
-        # Simple RTF writer with bold headings and blue color for headings
-        def rtf_escape(s: str):
-            return s.replace('\\', '\\\\').replace('{', '\\{').replace('}', '\\}')
-        blue_rgb = r'\red19\green71\blue138'
-        parts = []
-        parts.append(r'{\rtf1\ansi')
-        parts.append(r'{\colortbl ;' + blue_rgb + ';}')
-        parts.append(r'\fs24')  # default font size
-        parts.append(r'\b\cf1 ' + rtf_escape(f"Meeting Summary – {meeting_id}") + r'\b0\par')
-        parts.append(rtf_escape("Date: " + datetime.utcnow().strftime("%d %b %Y")) + r'\par\par')
-        parts.append(r'\b\cf0 Summary of Discussion\b0\par')
-        for s in format_summary_lines(summary):
-            parts.append(rtf_escape("• " + s) + r'\par')
-        parts.append(r'\par')
-        parts.append(r'\b Extracted Action Items\b0\par')
-        for idx, a in enumerate(actions, start=1):
-            parts.append(rtf_escape(f"{idx}. {a.get('task')}") + r'\par')
-            parts.append(rtf_escape(f"   Owner: {a.get('owner') or 'Not assigned'}") + r'\par')
-            parts.append(rtf_escape(f"   Due: {a.get('due') or 'Not specified'}") + r'\par')
-        parts.append(r'\par')
-        parts.append(r'\b Tasks Created\b0\par')
-        for t in created_issues:
-            parts.append(rtf_escape(f"- {t.get('id')} — {t.get('summary')} (Owner: {t.get('assignee') or 'No owner'}; Due: {t.get('due') or 'Not specified'})") + r'\par')
-        parts.append(r'\par')
-        parts.append(r'\b Notifications Sent\b0\par')
-        for n in notifications:
-            parts.append(rtf_escape(f"- Issue {n.get('issue')} -> status: {n.get('email_status')}") + r'\par')
-        parts.append('}')
-        path.write_text("\n".join(parts), encoding="utf-8")
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+def get_renderer():
+    """
+    Returns this process's shared ReportRenderer, building it on first use.
+    """
+    global _renderer
+    with _renderer_lock:
+        if _renderer is None:
+            _renderer = ReportRenderer()
+        return _renderer
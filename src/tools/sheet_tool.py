@@ -1,6 +1,9 @@
 # src/tools/sheet_tool.py
 import csv
+import io
 from pathlib import Path
+from ..utils import append_bytes, file_lock
+from ..metrics import BYTES_WRITTEN, STORE_WRITE_SECONDS, timed
 
 SHEET_CSV = Path("artifacts/sheet_rows.csv")
 
@@ -8,15 +11,32 @@ class SheetTool:
     """
     Appends rows to a CSV file to simulate a tracker (Google Sheets).
     """
-    def __init__(self):
-        SHEET_CSV.parent.mkdir(parents=True, exist_ok=True)
-        if not SHEET_CSV.exists():
-            with SHEET_CSV.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["ticket_id", "task", "owner", "due", "created_at"])
+    def __init__(self, path=SHEET_CSV):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.path.exists():
+            # Under the append lock, so no other process can create the file
+            # or append a row before the header is in place.
+            with file_lock(self.path):
+                if not self.path.exists():
+                    with self.path.open("w", newline="", encoding="utf-8") as f:
+                        writer = csv.writer(f)
+                        writer.writerow(["ticket_id", "task", "owner", "due", "created_at"])
 
     def append_row(self, row):
-        with SHEET_CSV.open("a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(row)
-        return {"status": "ok"}
+        return self.append_rows([row])
+
+    def append_rows(self, rows):
+        """
+        Appends all rows with one write, so a failure never leaves part of
+        the batch in the sheet.
+        """
+        buf = io.StringIO(newline="")
+        writer = csv.writer(buf)
+        writer.writerows(rows)
+        if buf.tell():
+            data = buf.getvalue().encode("utf-8")
+            with timed(STORE_WRITE_SECONDS, store="sheet"):
+                append_bytes(self.path, data)
+            BYTES_WRITTEN.inc(len(data), store="sheet")
+        return {"status": "ok", "rows": len(rows)}
@@ -1,20 +1,190 @@
 # src/utils.py
-import json
+import os
+import threading
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
+from .serialization import encode, decode
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 BASE_DIR = Path.cwd()
 
-def write_json(path, obj):
+# Set M2A_FSYNC=1 to fsync every append (crash-safe, but each append then
+# waits for the disk). By default appends are flushed to the OS only.
+FSYNC = os.environ.get("M2A_FSYNC", "0") != "0"
+
+def write_json(path, obj, codec=None):
+    # Atomic; `codec` defaults to M2A_JSON_CODEC (see serialization.py).
+    # Returns the number of bytes written.
+    data = encode(obj, codec)
+    write_bytes_atomic(path, data)
+    return len(data)
+
+def read_json(path):
+    # Reads files written by any codec, including the old indented JSON.
+    p = Path(path)
+    try:
+        data = p.read_bytes()
+    except FileNotFoundError:
+        return None
+    return decode(data)
+
+def write_bytes_atomic(path, data: bytes):
+    """
+    Writes `data` to a temporary file next to `path` and renames it into
+    place, so readers (in any process) see either the old or the new file.
+    """
+    with atomic_open(path) as f:
+        f.write(data)
+
+@contextmanager
+def atomic_open(path):
+    """
+    Like write_bytes_atomic for content written piecewise: yields a binary
+    file that replaces `path` when the block exits without an error.
+    """
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(obj, indent=2))
+    tmp = p.with_name(f".{p.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            yield f
+        os.replace(tmp, p)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
-def read_json(path):
+@contextmanager
+def file_lock(path, shared=False):
+    """
+    Cross-process lock on `path` (held on a separate `<path>.lock` file, so
+    `path` itself may be replaced while locked). Exclusive unless `shared`;
+    on Windows it is always exclusive.
+    """
     p = Path(path)
-    if p.exists():
-        return json.loads(p.read_text())
-    return None
+    lock_path = p.with_name(p.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
+
+
+class _Append:
+    __slots__ = ("data", "offset", "error", "done", "lead")
+
+    def __init__(self, data):
+        self.data = data
+        self.offset = None
+        self.error = None
+        self.done = threading.Event()
+        self.lead = False
+
+
+class _GroupCommit:
+    # Appends to one file from every thread of this process. Whoever finds
+    # no commit in progress becomes the leader: it writes everything queued
+    # so far with one write (and one fsync) under the cross-process file
+    # lock, then hands leadership to the oldest append queued meanwhile.
+    def __init__(self, path: Path):
+        self.path = path
+        self._mutex = threading.Lock()
+        self._queue = []
+        self._busy = False
+
+    def append(self, data: bytes):
+        item = _Append(data)
+        with self._mutex:
+            self._queue.append(item)
+            lead = not self._busy
+            self._busy = True
+        if not lead:
+            item.done.wait()
+            lead = item.lead
+        if lead:
+            self._lead()
+        if item.error is not None:
+            raise item.error
+        return item.offset
+
+    def _lead(self):
+        with self._mutex:
+            batch, self._queue = self._queue, []
+        self._commit(batch)
+        with self._mutex:
+            if self._queue:
+                nxt = self._queue[0]
+                nxt.lead = True
+                nxt.done.set()
+            else:
+                self._busy = False
+        for item in batch:
+            item.done.set()
+
+    def _commit(self, batch):
+        data = b"".join(item.data for item in batch)
+        try:
+            with file_lock(self.path), self.path.open("ab") as f:
+                start = f.seek(0, os.SEEK_END)
+                try:
+                    f.write(data)
+                    f.flush()
+                    if FSYNC:
+                        os.fsync(f.fileno())
+                except BaseException:
+                    f.truncate(start)
+                    raise
+        except BaseException as e:
+            for item in batch:
+                item.error = e
+            return
+        for item in batch:
+            item.offset = start
+            start += len(item.data)
+
+
+_group_commits = {}
+_group_commits_lock = threading.Lock()
+
+def append_bytes(path, data: bytes):
+    """
+    Appends `data` to the end of `path` and returns the offset it was
+    written at. Safe across threads and processes: appends are serialized
+    by a file lock, each lands in one piece, and concurrent appends from
+    this process are group-committed with a single write (and fsync, see
+    FSYNC). If the write fails the file is truncated back, so a reader
+    never sees a partial record.
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    key = str(p.resolve())
+    with _group_commits_lock:
+        gc = _group_commits.get(key)
+        if gc is None:
+            gc = _group_commits[key] = _GroupCommit(p)
+    return gc.append(data)
 
 def timestamp():
     return datetime.utcnow().isoformat() + "Z"
@@ -1,4 +1,4 @@
-// static/app.js - connects UI to /parse_transcript/
+// static/app.js - connects UI to the /jobs/ pipeline queue
 document.addEventListener("DOMContentLoaded", () => {
   const processBtn = document.getElementById("processBtn");
   const clearBtn = document.getElementById("clearBtn");
@@ -43,23 +43,24 @@ document.addEventListener("DOMContentLoaded", () => {
 
     try {
       const payload = { transcript, meeting_id: meetingId };
-      const res = await fetch("/parse_transcript/", {
+      const res = await fetch("/jobs/", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify(payload)
       });
 
       if (!res.ok) {
-        let msg = res.statusText;
-        try {
-          const err = await res.json();
-          if (err.detail) msg = JSON.stringify(err.detail);
-        } catch(e){}
-        showStatus("Server error: " + msg, true);
+        showStatus("Server error: " + await errorMessage(res), true);
+        return;
+      }
+
+      const job = await waitForJob((await res.json()).job_id);
+      if (job.status !== "done") {
+        showStatus("Processing failed: " + (job.error || "unknown error"), true);
         return;
       }
 
-      const json = await res.json();
+      const json = job.result;
 
       // Switch panels
       placeholder.classList.add("hidden");
@@ -116,6 +117,31 @@ document.addEventListener("DOMContentLoaded", () => {
     }
   });
 
+  async function waitForJob(jobId) {
+    // Poll the job until the background pipeline run has finished.
+    while (true) {
+      const res = await fetch(`/jobs/${jobId}`);
+      if (!res.ok) {
+        return { status: "failed", error: await errorMessage(res) };
+      }
+      const job = await res.json();
+      if (job.status === "done" || job.status === "failed") return job;
+
+      const running = Object.keys(job.stages || {}).filter(k => job.stages[k] === "running");
+      showStatus(job.status === "queued" ? "Queued…" : `Processing locally… (${running.join(", ") || "starting"})`);
+      await new Promise(r => setTimeout(r, 500));
+    }
+  }
+
+  async function errorMessage(res) {
+    let msg = res.statusText;
+    try {
+      const err = await res.json();
+      if (err.detail) msg = JSON.stringify(err.detail);
+    } catch(e){}
+    return msg;
+  }
+
   function buildFallback(json) {
     let parts = [];
     parts.push(`Meeting Summary – ${json.meeting_id}`);
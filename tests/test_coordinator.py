@@ -0,0 +1,23 @@
+# tests/test_coordinator.py
+import json
+from pathlib import Path
+from src.coordinator import Coordinator
+
+TRANSCRIPT = Path("data/sample_transcript.txt").read_text()
+
+def test_run_batch_yields_every_meeting_and_shares_store_writes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    coord = Coordinator()
+    single = coord.run_pipeline(TRANSCRIPT, "single")
+
+    results = list(coord.run_batch([(TRANSCRIPT, f"m{i}") for i in range(4)], parallelism=2))
+
+    assert sorted(r["index"] for r in results) == [0, 1, 2, 3]
+    for r in results:
+        assert r["meeting_id"] == f"m{r['index']}"
+        assert r["action_items"] == single["action_items"]
+        assert len(r["tasks"]) == len(single["tasks"])
+        assert json.loads((tmp_path / "mem" / f"{r['meeting_id']}.json").read_text())["actions"] == r["action_items"]
+
+    issue_lines = (tmp_path / "artifacts" / "jira_issues.jsonl").read_text().splitlines()
+    assert len(issue_lines) == 5 * len(single["tasks"])
@@ -0,0 +1,32 @@
+# tests/test_evaluate.py
+import json
+import evaluate
+from evaluate import compare_actions, iter_labels
+
+def test_compare_actions_counts_duplicates_as_multisets():
+    pred = [{"owner": "a@x.com"}, {"owner": "a@x.com"}, {"owner": "b@x.com", "due": "2025-12-01"}]
+    gold = [{"owner": "a@x.com"}, {"owner": "c@x.com", "due": "2025-12-01"}]
+
+    counts = compare_actions(pred, gold)
+    assert counts["owner"] == (1, 2, 1)
+    assert counts["due"] == (1, 0, 0)
+
+def test_iter_labels_streams_json_arrays_and_jsonl(tmp_path, monkeypatch):
+    items = [{"transcript": f"Action: Rohit will do {i}. " + "x" * i, "actions": []} for i in range(50)]
+    array = tmp_path / "labels.json"
+    array.write_text(" [\n" + ",\n".join(json.dumps(i) for i in items) + "\n]\n")
+    lines = tmp_path / "labels.jsonl"
+    lines.write_text("\n".join(json.dumps(i) for i in items) + "\n")
+
+    monkeypatch.setattr(evaluate, "READ_CHUNK", 16)
+    assert list(iter_labels(array)) == items
+    assert list(iter_labels(lines)) == items
+    lines.write_text("\n\n".join(json.dumps(i) for i in items))  # no trailing newline
+    assert list(iter_labels(lines)) == items
+
+def test_evaluate_in_process_and_pool_agree(tmp_path):
+    in_process = evaluate.evaluate("data/labels.json", workers=0, quiet=True)
+    pooled = evaluate.evaluate("data/labels.json", workers=2, batch_size=1, quiet=True)
+    assert in_process["fields"] == pooled["fields"]
+    assert in_process["meetings"] == pooled["meetings"] == 2
+    assert in_process["fields"]["owner"]["f1"] == 1.0
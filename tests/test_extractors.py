@@ -11,4 +11,39 @@ def test_simple_extraction():
     first = actions[0]
     assert first["owner"] == "rohit@example.com"
     assert first["due"] == "2025-12-01"
-    assert "Action:" in first["task"]
\ No newline at end of file
+    assert "Action:" in first["task"]
+
+def test_sample_transcript_items():
+    from pathlib import Path
+    actions = extract_action_items(Path("data/sample_transcript.txt").read_text())
+
+    assert [a["owner"] for a in actions] == [
+        "We@example.com", "rohit@example.com", None, None, "anu@example.com"
+    ]
+    assert [a["due"] for a in actions][:3] == ["2025-12-01", None, None]
+    assert actions[3]["due"] is not None  # "next week"
+    assert actions[4]["due"] == "2025-11-30"
+
+
+def test_lines_are_stripped_and_scanned_once():
+    from src.extractors import iter_action_items
+    transcript = "  Intro chatter\r\n\r\n  TODO: book the room, please. \r\nBye"
+    items = iter_action_items(transcript)
+
+    assert next(items)["task"] == "TODO: book the room, please."
+    assert list(items) == []
+
+
+def test_incremental_extractor_matches_whole_transcript():
+    from pathlib import Path
+    from src.extractors import IncrementalExtractor
+    transcript = Path("data/sample_transcript.txt").read_text()
+
+    extractor = IncrementalExtractor()
+    items = []
+    for i in range(0, len(transcript), 7):
+        items.extend(extractor.feed(transcript[i:i + 7]))
+    items.extend(extractor.close())
+
+    assert items == extract_action_items(transcript)
+    assert extractor.items_found == len(items)
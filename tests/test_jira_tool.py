@@ -0,0 +1,87 @@
+# tests/test_jira_tool.py
+import json
+from src.tools.jira_tool import JiraTool
+
+def test_issues_survive_restart(tmp_path):
+    log = tmp_path / "jira_issues.jsonl"
+    jira = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json")
+    first = jira.create_issue("Prepare slides", assignee="rohit@example.com", due="2025-12-01")
+    second = jira.create_issue("Check budget")
+
+    reopened = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json")
+    assert reopened.get_issue(first["id"]) == first
+    assert [i["id"] for i in reopened.list_issues()] == [first["id"], second["id"]]
+
+def test_legacy_json_array_is_imported_and_exported(tmp_path):
+    legacy = tmp_path / "jira_issues.json"
+    legacy.write_text(json.dumps([{"id": "ISSUE-old", "summary": "Old issue"}]))
+
+    jira = JiraTool(log_path=tmp_path / "jira_issues.jsonl", export_path=legacy)
+    jira.create_issue("New issue")
+    jira.export_json()
+
+    exported = json.loads(legacy.read_text())
+    assert [i["summary"] for i in exported] == ["Old issue", "New issue"]
+
+def test_compact_keeps_latest_version(tmp_path):
+    log = tmp_path / "jira_issues.jsonl"
+    jira = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json")
+    issue = jira.create_issue("Draft agenda")
+    jira.update_issue(issue["id"], assignee="anu@example.com")
+    assert len(log.read_text().splitlines()) == 2
+
+    jira.compact()
+    assert len(log.read_text().splitlines()) == 1
+    assert jira.get_issue(issue["id"])["assignee"] == "anu@example.com"
+
+def test_log_full_of_old_versions_is_compacted_at_startup(tmp_path, monkeypatch):
+    from src.tools import jira_tool
+    log = tmp_path / "jira_issues.jsonl"
+    issue = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json").create_issue("Draft agenda")
+    with log.open("ab") as f:  # e.g. written by a version without compaction
+        for n in range(5):
+            f.write(jira_tool._encode(dict(issue, summary=f"v{n}")))
+
+    monkeypatch.setattr(jira_tool, "COMPACT_MIN_DEAD", 3)
+    jira = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json")
+    assert len(log.read_text().splitlines()) == 1
+    assert jira.get_issue(issue["id"])["summary"] == "v4"
+
+def test_create_issues_commits_batch_in_one_append(tmp_path):
+    log = tmp_path / "jira_issues.jsonl"
+    jira = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json")
+    issues = jira.create_issues([
+        {"summary": "Prepare slides", "assignee": "rohit@example.com"},
+        {"summary": "Check budget", "due": "2025-11-30"},
+    ])
+
+    assert [i["summary"] for i in issues] == ["Prepare slides", "Check budget"]
+    assert len(log.read_text().splitlines()) == 2
+    assert jira.get_issue(issues[1]["id"])["due"] == "2025-11-30"
+
+def test_query_issues_by_assignee_and_due_range(tmp_path):
+    log = tmp_path / "jira_issues.jsonl"
+    jira = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json")
+    a = jira.create_issue("Slides", assignee="rohit@example.com", due="2025-12-01")
+    b = jira.create_issue("Budget", assignee="anu@example.com", due="2025-12-03")
+    c = jira.create_issue("Room", assignee="Rohit@example.com", due="2025-12-10")
+    d = jira.create_issue("Notes")
+
+    total, page = jira.query_issues(assignee="rohit@example.com")
+    assert total == 2 and [i["id"] for i in page] == [a["id"], c["id"]]
+    assert [i["id"] for i in jira.query_issues(due_from="2025-12-02", due_to="2025-12-10")[1]] == [b["id"], c["id"]]
+    assert jira.query_issues(assignee="rohit@example.com", due_to="2025-12-05")[1] == [a]
+    assert jira.query_issues(created_to=d["created_at"][:10])[0] == 4
+
+    total, page = jira.query_issues(limit=2, offset=2)
+    assert total == 4 and [i["id"] for i in page] == [c["id"], d["id"]]
+
+    # updates move the issue between index entries, in this and other instances
+    jira.update_issue(a["id"], assignee="anu@example.com", due="2026-01-01")
+    other = JiraTool(log_path=log, export_path=tmp_path / "jira_issues.json")
+    for tool in (jira, other):
+        assert [i["id"] for i in tool.query_issues(assignee="rohit@example.com")[1]] == [c["id"]]
+        assert [i["id"] for i in tool.query_issues(assignee="anu@example.com")[1]] == [a["id"], b["id"]]
+        assert tool.query_issues(due_from="2026-01-01")[1][0]["summary"] == "Slides"
+    jira.compact()
+    assert jira.query_issues(assignee="anu@example.com")[0] == 2
@@ -0,0 +1,50 @@
+# tests/test_jobs.py
+import time
+from src.jobs import JobQueue
+
+class FakeCoordinator:
+    def run_pipeline(self, transcript, meeting_id, on_stage=None):
+        for stage in ("summarize", "extract"):
+            on_stage(stage, "running")
+            on_stage(stage, "done")
+        if transcript == "boom":
+            raise ValueError("bad transcript")
+        return {"meeting_id": meeting_id, "summary": transcript}
+
+def wait(jobs, job_id):
+    for _ in range(200):
+        job = jobs.get(job_id)
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+def test_submit_returns_immediately_and_reports_result(tmp_path):
+    jobs = JobQueue(FakeCoordinator(), workers=2, path=tmp_path)
+    submitted = jobs.submit("hello", "m1")
+    assert submitted["status"] in ("queued", "running", "done")
+
+    job = wait(jobs, submitted["job_id"])
+    assert job["status"] == "done"
+    assert job["stages"] == {"summarize": "done", "extract": "done"}
+    assert job["result"] == {"meeting_id": "m1", "summary": "hello"}
+
+def test_failed_job_records_error(tmp_path):
+    jobs = JobQueue(FakeCoordinator(), workers=1, path=tmp_path)
+    job = wait(jobs, jobs.submit("boom", "m2")["job_id"])
+    assert job["status"] == "failed"
+    assert job["error"] == "bad transcript"
+    assert jobs.get("missing") is None
+
+def test_jobs_are_visible_to_other_worker_processes(tmp_path):
+    # A second JobQueue over the same directory stands in for another
+    # uvicorn worker answering the status poll.
+    jobs = JobQueue(FakeCoordinator(), workers=1, path=tmp_path)
+    other = JobQueue(FakeCoordinator(), workers=1, path=tmp_path)
+    job_id = jobs.submit("hello", "m1")["job_id"]
+
+    job = wait(other, job_id)
+    assert job["status"] == "done"
+    assert job["stages"] == {"summarize": "done", "extract": "done"}
+    assert job["result"] == {"meeting_id": "m1", "summary": "hello"}
+    assert other.get("../jira_issues") is None
@@ -0,0 +1,217 @@
+# tests/test_memory_store.py
+import pytest
+from src.agents.loop_agent import LoopAgent
+from src.memory.memory_store import MemoryStore, open_memory_store
+from src.memory.sqlite_store import SqliteMemoryStore
+
+MEETING = {"transcript": "Action: Rohit will prepare slides.", "summary": "- s", "actions": [{"task": "a"}]}
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    return open_memory_store(request.param, base=tmp_path / "mem")
+
+def test_store_and_load_round_trip(store):
+    store.store_meeting("m1", MEETING)
+    assert store.load_meeting("m1") == MEETING
+    assert store.load_meeting("missing") is None
+    assert store.list_meetings() == ["m1.json"]
+
+def test_loop_agent_follows_up_each_meeting_once(store):
+    store.store_meeting("m1", MEETING)
+    store.store_meeting("m2", MEETING)
+    agent = LoopAgent(mem=store)
+
+    assert sorted(agent.tick()) == ["m1", "m2"]
+    assert agent.tick() == []
+    loaded = store.load_meeting("m1")
+    assert loaded["followed_up"] is True
+    assert loaded["reminders"][0]["note"] == "Auto follow-up generated by LoopAgent"
+    assert loaded["transcript"] == MEETING["transcript"]
+
+def test_sqlite_store_imports_existing_json_meetings(tmp_path):
+    base = tmp_path / "mem"
+    MemoryStore(base).store_meeting("old", dict(MEETING, followed_up=True))
+
+    store = SqliteMemoryStore(base / "meetings.db", import_from=base)
+    assert store.load_meeting("old")["summary"] == "- s"
+    assert store.pending_followups() == []
+    assert store.meeting_info("old")["action_count"] == 1
+
+def test_changed_since_reports_only_new_writes(store):
+    store.store_meeting("m1", MEETING)
+    changed, cursor = store.changed_since(None)
+    assert changed == ["m1"]
+    assert store.changed_since(cursor)[0] == []
+
+    store.store_meeting("m2", MEETING)
+    assert store.changed_since(cursor)[0] == ["m2"]
+
+def test_json_store_reads_changes_from_its_journal(tmp_path, monkeypatch):
+    from src.memory import memory_store
+    base = tmp_path / "mem"
+    watcher, writer = MemoryStore(base), MemoryStore(base)  # e.g. two processes
+    writer.store_meeting("m1", MEETING)
+    changed, cursor = watcher.changed_since(None)
+    assert changed == ["m1"]
+
+    writer.store_meeting("m2", MEETING)
+    writer.mark_followed_up("m1", {"note": "n"})
+    changed, cursor = watcher.changed_since(cursor)
+    assert changed == ["m2", "m1"]
+    assert watcher.changed_since(cursor)[0] == []
+
+    # A full journal starts over; watchers then get every meeting once.
+    monkeypatch.setattr(memory_store, "JOURNAL_MAX_BYTES", 1)
+    writer.store_meeting("m3", MEETING)
+    changed, cursor = watcher.changed_since(cursor)
+    assert sorted(changed) == ["m1", "m2", "m3"]
+    assert watcher.changed_since(cursor)[0] == []
+
+def test_event_loop_follows_up_stored_meetings(store):
+    import asyncio
+
+    async def scenario():
+        store.store_meeting("before", MEETING)
+        agent = LoopAgent(mem=store, workers=2)
+        task = asyncio.create_task(agent.run_events())
+        await asyncio.sleep(0.05)
+        await asyncio.to_thread(store.store_meeting, "after", MEETING)
+        for _ in range(200):
+            if not store.pending_followups():
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(scenario())
+    assert store.pending_followups() == []
+    assert store.load_meeting("after")["followed_up"] is True
+
+def test_reminder_scheduler_fires_lead_days_before_due(store, tmp_path):
+    from datetime import datetime
+    from src.agents.loop_agent import ReminderScheduler
+    from src.tools.email_tool import EmailTool
+
+    store.store_meeting("m1", dict(MEETING, actions=[
+        {"task": "Prepare slides", "owner": "rohit@example.com", "due": "2025-12-05"},
+        {"task": "Book room", "owner": "anu@example.com", "due": "2025-12-01"},
+        {"task": "No owner", "owner": None, "due": "2025-12-01"},
+    ]))
+    clock = [datetime(2025, 11, 29, 12)]
+    email = EmailTool(path=tmp_path / "email.jsonl", legacy_path=tmp_path / "none.json")
+    scheduler = ReminderScheduler(store, email=email, lead_days=2, now=lambda: clock[0])
+    scheduler.load()
+
+    assert len(scheduler) == 2
+    assert scheduler.next_fire_at() == datetime(2025, 11, 29)
+    assert [r["task"] for r in scheduler.fire_due()] == ["Book room"]
+    assert scheduler.fire_due() == []
+
+    clock[0] = datetime(2025, 12, 3, 9)
+    assert [r["to"] for r in scheduler.fire_due()] == ["rohit@example.com"]
+    assert [e["task"] for e in email.entries()] == ["Book room", "Prepare slides"]
+
+    # Already-sent reminders are not scheduled again after a restart.
+    restarted = ReminderScheduler(store, email=email, lead_days=2, now=lambda: clock[0])
+    restarted.load()
+    assert len(restarted) == 0
+
+    # Storing the meeting again (without its "reminders") does not re-send.
+    store.store_meeting("m1", {k: v for k, v in store.load_meeting("m1").items() if k != "reminders"})
+    restarted = ReminderScheduler(store, email=email, lead_days=2, now=lambda: clock[0])
+    restarted.load()
+    assert len(restarted) == 0 and restarted.fire_due() == []
+
+def test_reminder_scheduler_requeues_reminders_when_sending_fails(store, tmp_path):
+    from datetime import datetime
+    from src.agents.loop_agent import ReminderScheduler
+    from src.tools.email_tool import EmailTool
+
+    class FlakyEmail(EmailTool):
+        fail = True
+        def send_reminders(self, reminders):
+            if self.fail:
+                raise OSError("disk full")
+            return super().send_reminders(reminders)
+
+    store.store_meeting("m1", dict(MEETING, actions=[
+        {"task": "Book room", "owner": "anu@example.com", "due": "2025-12-01"},
+    ]))
+    email = FlakyEmail(path=tmp_path / "email.jsonl", legacy_path=tmp_path / "none.json")
+    scheduler = ReminderScheduler(store, email=email, lead_days=2, now=lambda: datetime(2025, 11, 30))
+    scheduler.load()
+    with pytest.raises(OSError):
+        scheduler.fire_due()
+    assert len(scheduler) == 1
+
+    email.fail = False
+    assert [r["task"] for r in scheduler.fire_due()] == ["Book room"]
+    assert len(email.entries()) == 1
+
+def test_transcript_is_stored_compressed_and_loaded_lazily(store):
+    store.store_meeting("m1", MEETING)
+    loaded = store.load_meeting("m1")
+    assert not loaded.transcript_loaded
+    assert loaded["summary"] == "- s" and not loaded.transcript_loaded
+    assert "transcript" in loaded
+    assert loaded["transcript"] == MEETING["transcript"]
+    assert loaded.transcript_loaded
+
+def test_json_store_keeps_transcript_out_of_metadata(tmp_path):
+    import json
+    base = tmp_path / "mem"
+    store = MemoryStore(base)
+    store.store_meeting("m1", MEETING)
+    record = json.loads((base / "m1.json").read_text())
+    assert "transcript" not in record
+    blob = base / record["transcript_ref"]
+    mtime = blob.stat().st_mtime_ns
+
+    assert store.mark_followed_up("m1", {"note": "n"})
+    assert blob.stat().st_mtime_ns == mtime
+    assert store.load_meeting("m1")["transcript"] == MEETING["transcript"]
+
+def test_json_store_reads_and_migrates_inline_transcripts(tmp_path):
+    import json
+    base = tmp_path / "mem"
+    base.mkdir()
+    (base / "old.json").write_text(json.dumps(MEETING))
+    store = MemoryStore(base)
+    assert store.load_meeting("old") == MEETING
+
+    store.add_reminder("old", {"note": "n"})
+    assert "transcript_ref" in json.loads((base / "old.json").read_text())
+    assert store.load_meeting("old")["transcript"] == MEETING["transcript"]
+
+def test_search_ranks_meetings_and_filters_action_items(store):
+    store.store_meeting("m1", dict(MEETING, transcript="We discussed the vendor contract renewal.", actions=[
+        {"task": "Review vendor contract", "owner": "Rohit@example.com", "due": "2025-12-01"},
+        {"task": "Book room", "owner": "anu@example.com", "due": "2025-12-10"},
+    ]))
+    store.store_meeting("m2", dict(MEETING, transcript="Budget planning only."))
+
+    hits = store.search("vendor contract")
+    assert {h["meeting_id"] for h in hits} == {"m1"}
+    assert {h["kind"] for h in hits} == {"meeting", "action"}
+    assert [h["kind"] for h in store.search("vendor", fields=["task"])] == ["action"]
+
+    items = store.search(owner="rohit@example.com")
+    assert [(h["task"], h["due"]) for h in items] == [("Review vendor contract", "2025-12-01")]
+    assert [h["task"] for h in store.search(due_from="2025-12-05")] == ["Book room"]
+
+    # re-storing replaces the meeting's entries
+    store.store_meeting("m1", MEETING)
+    assert store.search("vendor") == []
+    with pytest.raises(ValueError):
+        store.search("x", fields=["nope"])
+
+def test_transcript_file_is_stored_and_indexed_in_pieces(store, tmp_path, monkeypatch):
+    monkeypatch.setattr("src.memory.search_index.INDEX_CHUNK", 64)
+    transcript = "".join(f"Line {i}: the vendor contract, part {i}.\n" for i in range(20))
+    path = tmp_path / "upload.txt"
+    path.write_text(transcript)
+
+    store.store_meeting("m1", {"summary": "- s", "actions": []}, transcript_path=path)
+    assert store.load_meeting("m1")["transcript"] == transcript
+    assert [h["meeting_id"] for h in store.search("vendor contract")] == ["m1"]
+    hits = store.search("part 17")
+    assert len(hits) == 1 and "[17]" in hits[0]["snippet"]
@@ -0,0 +1,49 @@
+# tests/test_metrics.py
+from pathlib import Path
+import pytest
+from src import metrics
+from src.coordinator import Coordinator
+
+TRANSCRIPT = Path("data/sample_transcript.txt").read_text()
+
+@pytest.fixture
+def registry(monkeypatch):
+    # Metrics created by a test go into a copy of the registry, so they do
+    # not show up in /metrics afterwards.
+    monkeypatch.setattr(metrics, "_registry", list(metrics._registry))
+
+def test_histogram_renders_cumulative_buckets(registry):
+    hist = metrics.Histogram("test_latency_seconds", "Test.", ["op"], buckets=(0.1, 1.0))
+    hist.observe(0.05, op="a")
+    hist.observe(0.5, op="a")
+    hist.observe(5.0, op="a")
+
+    text = metrics.render()
+    assert '# TYPE test_latency_seconds histogram' in text
+    assert 'test_latency_seconds_bucket{op="a",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{op="a",le="1.0"} 2' in text
+    assert 'test_latency_seconds_bucket{op="a",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{op="a"} 3' in text
+
+def test_disabled_metrics_record_nothing(registry, monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", False)
+    counter = metrics.Counter("test_disabled_total", "Test.")
+    hist = metrics.Histogram("test_disabled_seconds", "Test.")
+    with metrics.timed(hist):
+        counter.inc()
+    assert counter.value() == 0 and hist.count() == 0
+
+def test_pipeline_records_stages_stores_and_counts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    stages = {s: metrics.STAGE_SECONDS.count(stage=s) for s in ("summarize", "extract", "store", "reports")}
+    jira_bytes = metrics.BYTES_WRITTEN.value(store="jira")
+    issues = metrics.ISSUES_CREATED.value()
+
+    result = Coordinator().run_pipeline(TRANSCRIPT, "m1")
+
+    for stage, before in stages.items():
+        assert metrics.STAGE_SECONDS.count(stage=stage) == before + 1
+    assert metrics.BYTES_WRITTEN.value(store="jira") > jira_bytes
+    assert metrics.ISSUES_CREATED.value() == issues + len(result["tasks"])
+    assert metrics.STORE_WRITE_SECONDS.count(store="memory") >= 1
+    assert metrics.REPORT_SECONDS.count(format="txt") >= 1
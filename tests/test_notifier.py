@@ -0,0 +1,45 @@
+# tests/test_notifier.py
+from src.agents.notifier_agent import NotifierAgent
+
+ISSUES = [
+    {"id": "ISSUE-1", "assignee": "rohit@example.com"},
+    {"id": "ISSUE-2", "assignee": "anu@example.com"},
+    {"id": "ISSUE-3", "assignee": "rohit@example.com"},
+    {"id": "ISSUE-4", "assignee": None},
+]
+
+def test_digest_sends_one_email_per_owner(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    agent = NotifierAgent(digest=True)
+    results = agent.run(ISSUES, meeting_id="m1")
+
+    assert [r["issue"] for r in results] == ["ISSUE-1", "ISSUE-2", "ISSUE-3"]
+    entries = agent.email.entries()
+    assert [e["to"] for e in entries] == ["rohit@example.com", "anu@example.com"]
+    assert [t["id"] for t in entries[0]["tickets"]] == ["ISSUE-1", "ISSUE-3"]
+    assert entries[0]["meeting_id"] == "m1"
+
+def test_per_issue_mode_logs_every_issue(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    agent = NotifierAgent(digest=False)
+    results = agent.run(ISSUES)
+
+    assert all(r["email_status"] == "sent" for r in results)
+    assert [e["ticket"]["id"] for e in agent.email.entries()] == ["ISSUE-1", "ISSUE-2", "ISSUE-3"]
+
+def test_legacy_email_log_is_migrated_once(tmp_path):
+    import json
+    from src.tools.email_tool import EmailTool
+    legacy = tmp_path / "email_log.json"
+    legacy.write_text(json.dumps([{"to": "a@x.com", "ticket": {"id": "ISSUE-1"}, "sent_at": "t0"}]))
+    log = tmp_path / "email_log.jsonl"
+    log.write_text(json.dumps({"to": "b@x.com", "ticket": {"id": "ISSUE-2"}, "sent_at": "t1"}) + "\n")
+
+    email = EmailTool(path=log, legacy_path=legacy)
+    email.send_digests({"c@x.com": [{"id": "ISSUE-3"}]}, meeting_id="m1")
+    assert not legacy.exists() and (tmp_path / "email_log.json.migrated").exists()
+
+    reopened = EmailTool(path=log, legacy_path=legacy)
+    entries = reopened.entries()
+    assert [e["to"] for e in entries] == ["a@x.com", "b@x.com", "c@x.com"]
+    assert entries[2]["tickets"] == [{"id": "ISSUE-3"}] and entries[2]["meeting_id"] == "m1"
@@ -0,0 +1,84 @@
+# tests/test_report_tool.py
+from pathlib import Path
+from src.tools import report_tool
+from src.tools.report_tool import ReportTool
+from src.utils import read_json, write_json
+
+ARGS = ("m1", "- Kickoff.", [{"task": "Action: prepare slides", "owner": "rohit@example.com", "due": None}],
+        [{"id": "ISSUE-1", "summary": "Action: prepare slides", "assignee": "rohit@example.com"}],
+        [{"issue": "ISSUE-1", "email_status": "sent"}])
+
+def test_formats_are_rendered_lazily_and_cached_by_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_tool, "REPORTS_DIR", tmp_path)
+    monkeypatch.setattr(report_tool, "REPORT_PROCESSES", 0)
+    tool = ReportTool()
+
+    paths = tool.generate(*ARGS)
+    assert tool.generate(*ARGS) == paths
+    assert "Action: prepare slides" in (tmp_path / Path(paths["report_text_path"]).name).read_text(encoding="utf-8")
+    assert not any(p.suffix in (".docx", ".pdf", ".rtf") for p in tmp_path.iterdir())
+
+    pdf_name = Path(paths["report_pdf_path"]).name
+    pdf = tool.render(pdf_name)
+    assert pdf == tmp_path / pdf_name
+    assert pdf.read_bytes().startswith(b"%PDF")
+    assert not (tmp_path / pdf_name.replace(".pdf", ".docx")).exists()
+
+def test_render_rejects_unknown_names(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_tool, "REPORTS_DIR", tmp_path)
+    tool = ReportTool()
+    assert tool.render("report_missing_0123.pdf") is None
+    assert tool.render("../jira_issues.json") is None
+
+def test_docx_is_rendered_from_the_manifest(tmp_path, monkeypatch):
+    from docx import Document
+    monkeypatch.setattr(report_tool, "REPORTS_DIR", tmp_path)
+    monkeypatch.setattr(report_tool, "REPORT_PROCESSES", 0)
+    tool = ReportTool()
+    paths = tool.generate(*ARGS)
+
+    name = Path(paths["report_docx_path"]).name
+    manifest = read_json(tmp_path / name.replace(".docx", ".json"))
+    assert manifest["meeting_id"] == "m1" and manifest["actions"] == ARGS[2]
+
+    docx = tool.render(name)
+    assert docx == tmp_path / name
+    text = "\n".join(p.text for p in Document(docx).paragraphs)
+    assert "Meeting Summary – m1" in text and "prepare slides" in text
+    assert report_tool.get_renderer() is report_tool.get_renderer()
+
+def test_renders_in_process_when_the_pool_cannot_start(tmp_path, monkeypatch):
+    from concurrent.futures.process import BrokenProcessPool
+
+    class BrokenPool:
+        shut_down = False
+        def submit(self, *args):
+            raise BrokenProcessPool("cannot spawn")
+        def shutdown(self, wait=True):
+            self.shut_down = True
+
+    pool = BrokenPool()
+    monkeypatch.setattr(report_tool, "REPORTS_DIR", tmp_path)
+    monkeypatch.setattr(report_tool, "REPORT_PROCESSES", 2)
+    monkeypatch.setattr(report_tool, "_pool", pool)
+    tool = ReportTool()
+    paths = tool.generate(*ARGS)
+
+    pdf = tool.render(Path(paths["report_pdf_path"]).name)
+    assert pdf is not None and pdf.read_bytes().startswith(b"%PDF")
+    assert pool.shut_down and report_tool._pool is None
+
+def test_rendered_formats_carry_the_generation_date(tmp_path, monkeypatch):
+    monkeypatch.setattr(report_tool, "REPORTS_DIR", tmp_path)
+    monkeypatch.setattr(report_tool, "REPORT_PROCESSES", 0)
+    tool = ReportTool()
+    paths = tool.generate(*ARGS)
+    manifest_path = tmp_path / Path(paths["report_text_path"]).name.replace(".txt", ".json")
+    manifest = read_json(manifest_path)
+    assert f"Date: {manifest['date']}" in Path(paths["report_text_path"]).read_text(encoding="utf-8")
+
+    # Rendered on a later day: still dated when the meeting was processed
+    manifest["date"] = "01 Dec 2025"
+    write_json(manifest_path, manifest)
+    rtf = tool.render(Path(paths["report_rtf_path"]).name)
+    assert "Date: 01 Dec 2025" in rtf.read_text(encoding="utf-8")
@@ -0,0 +1,123 @@
+# tests/test_result_cache.py
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+import pytest
+from src.coordinator import Coordinator
+from src.result_cache import ResultCache
+
+TRANSCRIPT = Path("data/sample_transcript.txt").read_text()
+
+try:
+    fork = multiprocessing.get_context("fork")
+except ValueError:
+    fork = None
+
+def test_repeat_and_restart_return_stored_result(tmp_path):
+    calls = []
+    cache = ResultCache(tmp_path, max_entries=1)
+    compute = lambda: calls.append(1) or {"n": len(calls)}
+
+    assert cache.get_or_compute("m1", "text", compute) == {"n": 1}
+    assert cache.get_or_compute("m1", "text", compute) == {"n": 1}
+    assert cache.get_or_compute("m1", "other text", compute) == {"n": 2}
+    # evicted from the LRU (size 1) and from memory entirely: read from disk
+    assert ResultCache(tmp_path).get_or_compute("m1", "text", compute) == {"n": 1}
+    assert len(calls) == 2
+
+def test_concurrent_duplicates_share_one_computation(tmp_path):
+    cache = ResultCache(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"ok": True}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("m", "t", compute)))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1 and results == [{"ok": True}] * 8
+
+def test_failures_are_not_cached(tmp_path):
+    cache = ResultCache(tmp_path)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("m", "t", fail)
+    assert cache.get_or_compute("m", "t", lambda: {"ok": True}) == {"ok": True}
+
+def test_resubmitted_meeting_creates_no_new_issues(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    coord = Coordinator()
+    first = coord.run_pipeline(TRANSCRIPT, "m1")
+    issues = (tmp_path / "artifacts" / "jira_issues.jsonl").read_text()
+
+    assert coord.run_pipeline(TRANSCRIPT, "m1") == first
+    assert next(coord.run_batch([(TRANSCRIPT, "m1")]))["tasks"] == first["tasks"]
+    assert (tmp_path / "artifacts" / "jira_issues.jsonl").read_text() == issues
+
+def test_callers_get_their_own_copy(tmp_path):
+    cache = ResultCache(tmp_path)
+    first = cache.get_or_compute("m", "t", lambda: {"tasks": [1]})
+    first["tasks"].append(2)
+    hit = cache.get_or_compute("m", "t", lambda: {"tasks": []})
+    hit["tasks"].append(3)
+    assert cache.get_or_compute("m", "t", lambda: {"tasks": []}) == {"tasks": [1]}
+    assert cache.get("m", "t") == {"tasks": [1]}
+
+def _compute_in_process(tmp_path, marker_dir):
+    def compute():
+        (marker_dir / f"{os.getpid()}").touch()
+        time.sleep(0.2)
+        return {"ok": True}
+    assert ResultCache(tmp_path).get_or_compute("m", "t", compute) == {"ok": True}
+
+@pytest.mark.skipif(fork is None, reason="needs the fork start method")
+def test_processes_share_one_computation(tmp_path):
+    markers = tmp_path / "calls"
+    markers.mkdir()
+    procs = [fork.Process(target=_compute_in_process, args=(tmp_path / "results", markers)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+    assert len(list(markers.iterdir())) == 1
+
+def test_duplicate_and_concurrent_batches_create_issues_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    coord = Coordinator()
+    batch = [(TRANSCRIPT, "dup"), (TRANSCRIPT, "other"), (TRANSCRIPT, "dup")]
+    outputs = []
+    threads = [threading.Thread(target=lambda: outputs.append(list(coord.run_batch(batch))))
+               for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    single = coord.run_pipeline(TRANSCRIPT, "dup")
+    for results in outputs:
+        assert sorted(r["index"] for r in results) == [0, 1, 2]
+        assert all("error" not in r for r in results)
+        assert [r["tasks"] for r in results if r["meeting_id"] == "dup"] == [single["tasks"]] * 2
+    issues = (tmp_path / "artifacts" / "jira_issues.jsonl").read_text().splitlines()
+    assert len(issues) == 2 * len(single["tasks"])
+    assert not list((tmp_path / "artifacts" / "results").glob("*.lock"))
+
+def test_abandoned_batch_leaves_its_meetings_to_the_next_caller(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    coord = Coordinator()
+    batch = coord.run_batch([(TRANSCRIPT, "a"), (TRANSCRIPT, "b")], parallelism=1)
+    next(batch)
+    batch.close()
+    assert coord.run_pipeline(TRANSCRIPT, "b")["meeting_id"] == "b"
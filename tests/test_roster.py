@@ -0,0 +1,109 @@
+# tests/test_roster.py
+import json
+import os
+import pytest
+from src.extractors import IncrementalExtractor, extract_action_items
+from src.roster import Roster, load_roster
+
+PEOPLE = [
+    {"name": "Rohit Sharma", "email": "rohit.sharma@corp.com", "aliases": ["RS"]},
+    {"name": "Anu Priya", "email": "anu@corp.com"},
+    {"name": "Anu Raj", "email": "araj@corp.com"},
+    {"name": "Will Turner", "email": "will@corp.com"},
+    {"name": "Mary Ann Lee", "email": "mal@corp.com", "aliases": ["Mary Ann"]},
+]
+
+def test_names_aliases_and_unique_first_names_resolve():
+    roster = Roster(PEOPLE)
+    assert roster.find("Rohit will send the deck") == "rohit.sharma@corp.com"
+    assert roster.find("RS to check the numbers") == "rohit.sharma@corp.com"
+    # "Anu" is ambiguous, the full name is not
+    assert roster.find("Anu will call") is None
+    assert roster.find("we will ask Anu Raj to check") == "araj@corp.com"
+    # the longest overlapping name, and the one followed by will/to
+    assert roster.find("Mary Ann Lee to follow up with Rohit") == "mal@corp.com"
+    assert roster.find("Rohit asked Mary Ann to follow up") == "mal@corp.com"
+    # whole, capitalized words only
+    assert roster.find("we will talk to rohit about RSVPs") is None
+
+def test_extraction_prefers_roster_over_made_up_addresses():
+    transcript = "Action: Rohit to draft the plan.\nTODO: Will Turner will book the room.\nTask: Zed to clean up."
+    roster = Roster(PEOPLE)
+    assert [a["owner"] for a in extract_action_items(transcript, roster=roster)] == [
+        "rohit.sharma@corp.com", "will@corp.com", "Zed@example.com"
+    ]
+    extractor = IncrementalExtractor(roster=roster)
+    assert [a["owner"] for a in extractor.feed(transcript) + extractor.close()][:2] == [
+        "rohit.sharma@corp.com", "will@corp.com"
+    ]
+    assert extract_action_items(transcript)[0]["owner"] == "Rohit@example.com"
+
+def test_roster_files_are_cached_until_they_change(tmp_path):
+    csv_path = tmp_path / "roster.csv"
+    csv_path.write_text("name,email,aliases\nRohit Sharma,rohit.sharma@corp.com,RS;Ro\n")
+    roster = load_roster(csv_path)
+    assert load_roster(csv_path) is roster
+    assert roster.find("Ro will do it") == "rohit.sharma@corp.com"
+
+    csv_path.write_text("name,email,aliases\nRohit Sharma,rohit@corp.com,\n")
+    st = csv_path.stat()
+    os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_roster(csv_path).find("Rohit will do it") == "rohit@corp.com"
+
+    json_path = tmp_path / "roster.json"
+    json_path.write_text(json.dumps(PEOPLE))
+    assert extract_action_items("Action: Anu Priya to review.", roster=str(json_path))[0]["owner"] == "anu@corp.com"
+
+def test_names_that_are_common_words_need_will_or_to():
+    roster = Roster(PEOPLE)
+    assert roster.find("Will we ship on Friday? Rohit to confirm") == "rohit.sharma@corp.com"
+    assert roster.find("Will we ship on Friday?") is None
+    assert roster.find("Will to book the room") == "will@corp.com"
+    assert roster.find("Will Turner said the room is booked") == "will@corp.com"
+
+def test_unreadable_roster_falls_back_to_the_last_one(tmp_path, capsys):
+    csv_path = tmp_path / "roster.csv"
+    csv_path.write_text("name,email,aliases\nRohit Sharma,rohit@corp.com,\n")
+    roster = load_roster(csv_path)
+    csv_path.unlink()
+    assert load_roster(csv_path) is roster
+    assert load_roster(csv_path) is roster
+    assert capsys.readouterr().out.count("cannot read") == 1
+    with pytest.raises(OSError):
+        load_roster(csv_path, reload=True)
+    assert load_roster(tmp_path / "missing.csv") is None
+
+def test_roster_changes_change_result_keys(tmp_path, monkeypatch):
+    from src import roster as roster_module
+    from src.result_cache import result_key
+    before = result_key("m1", "Action: Rohit to draft the plan.")
+    csv_path = tmp_path / "roster.csv"
+    csv_path.write_text("name,email,aliases\nRohit Sharma,rohit@corp.com,\n")
+    monkeypatch.setattr(roster_module, "ROSTER_PATH", str(csv_path))
+    with_roster = result_key("m1", "Action: Rohit to draft the plan.")
+    assert with_roster != before
+
+    csv_path.write_text("name,email,aliases\nRohit Sharma,rohit.sharma@corp.com,\n")
+    assert load_roster(reload=True).find("Rohit to go") == "rohit.sharma@corp.com"
+    assert result_key("m1", "Action: Rohit to draft the plan.") not in (before, with_roster)
+
+def test_invalid_roster_edits_keep_the_previous_roster(tmp_path, capsys):
+    json_path = tmp_path / "roster.json"
+    json_path.write_text(json.dumps(PEOPLE))
+    roster = load_roster(json_path)
+    json_path.write_text(json.dumps(PEOPLE)[:40])  # caught mid-save
+    line = "Action: Anu Priya to review."
+    assert extract_action_items(line, roster=str(json_path))[0]["owner"] == "anu@corp.com"
+    assert load_roster(json_path) is roster
+
+    csv_path = tmp_path / "roster.csv"
+    csv_path.write_bytes(b"name,email,aliases\nAnu Priya,anu@corp.com,\n")
+    load_roster(csv_path)
+    csv_path.write_bytes(b"name,email,aliases\n\xff\xfe broken\n")
+    assert extract_action_items(line, roster=str(csv_path))[0]["owner"] == "anu@corp.com"
+    assert capsys.readouterr().out.count("cannot read") == 2
+    with pytest.raises(ValueError):
+        load_roster(csv_path, reload=True)
+
+    csv_path.write_bytes(b"name,email,aliases\nAnu Priya,priya@corp.com,\n")
+    assert extract_action_items(line, roster=str(csv_path))[0]["owner"] == "priya@corp.com"
@@ -0,0 +1,39 @@
+# tests/test_serialization.py
+import json
+import pytest
+from src import serialization
+from src.memory.transcripts import MeetingRecord
+from src.utils import read_json, write_json
+
+MEETING = {"meeting_id": "m1", "summary": "Plan — Q3", "actions": [{"owner": "anu@example.com", "due": None}]}
+
+def test_default_codec_is_compact_json(tmp_path):
+    path = tmp_path / "m1.json"
+    written = write_json(path, MEETING)
+    assert written == path.stat().st_size
+    assert b"\n" not in path.read_bytes()
+    assert json.loads(path.read_bytes()) == MEETING
+
+def test_old_indented_files_still_read(tmp_path):
+    path = tmp_path / "m1.json"
+    path.write_text(json.dumps(MEETING, indent=2))
+    assert read_json(path) == MEETING
+    assert read_json(tmp_path / "missing.json") is None
+
+def test_every_codec_round_trips(tmp_path):
+    for codec in serialization.CODECS:
+        write_json(tmp_path / f"{codec}.json", MEETING, codec=codec)
+        assert read_json(tmp_path / f"{codec}.json") == MEETING
+    with pytest.raises(ValueError):
+        write_json(tmp_path / "x.json", MEETING, codec="yaml")
+
+@pytest.mark.skipif(serialization.msgpack is None, reason="msgpack not installed")
+def test_msgpack_files_are_tagged(tmp_path):
+    path = tmp_path / "m1.json"
+    write_json(path, MEETING, codec="msgpack")
+    assert path.read_bytes().startswith(serialization.MSGPACK_MAGIC)
+
+def test_lazy_records_and_big_ints_are_serialized():
+    record = MeetingRecord({"summary": "s"}, lambda: "full transcript")
+    assert serialization.decode(serialization.encode(record)) == {"summary": "s", "transcript": "full transcript"}
+    assert serialization.decode(serialization.encode({"n": 2 ** 70})) == {"n": 2 ** 70}
@@ -0,0 +1,18 @@
+# tests/test_sheet_tool.py
+import csv
+from src.tools.sheet_tool import SheetTool
+
+def test_append_rows_writes_whole_batch(tmp_path):
+    path = tmp_path / "sheet_rows.csv"
+    sheet = SheetTool(path=path)
+    sheet.append_rows([
+        ["ISSUE-1", "Prepare slides", "rohit@example.com", "2025-12-01", "t1"],
+        ["ISSUE-2", "Check budget, then report", "", "", "t2"],
+    ])
+    sheet.append_row(["ISSUE-3", "Book room", "", "", "t3"])
+
+    with path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["ticket_id", "task", "owner", "due", "created_at"]
+    assert [r[0] for r in rows[1:]] == ["ISSUE-1", "ISSUE-2", "ISSUE-3"]
+    assert rows[2][1] == "Check budget, then report"
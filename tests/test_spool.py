@@ -0,0 +1,43 @@
+# tests/test_spool.py
+import pytest
+from pathlib import Path
+from src.coordinator import Coordinator
+from src.result_cache import result_key
+from src.spool import TranscriptSpool, iter_transcript_chunks, iter_transcript_lines
+
+TRANSCRIPT = Path("data/sample_transcript.txt").read_text()
+
+def test_chunks_and_lines_give_back_the_file(tmp_path):
+    text = "short\n" + "x" * 50 + "\nünïcode line\n\nlast without newline"
+    path = tmp_path / "t.txt"
+    path.write_text(text, encoding="utf-8")
+
+    chunks = list(iter_transcript_chunks(path, chunk_bytes=8))
+    assert "".join(chunks) == text
+    assert all(c.endswith("\n") for c in chunks[:-1])
+    assert list(iter_transcript_lines(path, chunk_bytes=8)) == text.split("\n")
+
+def test_spool_key_matches_result_key_and_rejects_bad_utf8(tmp_path):
+    data = TRANSCRIPT.encode("utf-8")
+    with TranscriptSpool("m1", path=tmp_path) as spool:
+        for i in range(0, len(data), 7):
+            spool.write(data[i:i + 7])
+        assert spool.close() == result_key("m1", TRANSCRIPT)
+        assert spool.path.read_bytes() == data
+    assert not spool.path.exists()
+
+    with TranscriptSpool("m1", path=tmp_path) as spool, pytest.raises(UnicodeDecodeError):
+        spool.write(b"\xff\xfe")
+
+def test_run_pipeline_file_matches_run_pipeline(tmp_path, monkeypatch):
+    path = tmp_path / "upload.txt"
+    path.write_text(TRANSCRIPT)
+    monkeypatch.chdir(tmp_path)
+    coord = Coordinator()
+
+    from_file = coord.run_pipeline_file(path, "upload")
+    assert coord.mem.load_meeting("upload")["transcript"] == TRANSCRIPT
+    # same result-cache key: the text submission is served from the cache
+    assert coord.run_pipeline(TRANSCRIPT, "upload") == from_file
+    assert from_file["summary"] == coord.summarizer.run(TRANSCRIPT)
+    assert from_file["action_items"] == coord.extractor.run(TRANSCRIPT)
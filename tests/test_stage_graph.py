@@ -0,0 +1,41 @@
+# tests/test_stage_graph.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.stage_graph import Stage, run_stages
+
+def test_independent_stages_overlap_and_results_flow_to_dependents():
+    both_started = threading.Barrier(2, timeout=5)
+
+    def left():
+        both_started.wait()
+        return 2
+
+    def right():
+        both_started.wait()
+        return 3
+
+    events = []
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = run_stages([
+            Stage("left", left),
+            Stage("right", right),
+            Stage("total", lambda left, right: left * right, deps=("left", "right")),
+        ], pool, on_stage=lambda name, status: events.append((name, status)))
+
+    assert results == {"left": 2, "right": 3, "total": 6}
+    assert events.index(("total", "running")) > events.index(("left", "done"))
+
+def test_failure_stops_dependents_and_is_raised():
+    ran = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        with pytest.raises(RuntimeError, match="boom"):
+            run_stages([
+                Stage("broken", broken),
+                Stage("after", lambda broken: ran.append(broken), deps=("broken",)),
+            ], pool)
+    assert ran == []
@@ -0,0 +1,72 @@
+# tests/test_store_concurrency.py
+import csv
+import multiprocessing
+import pytest
+from src.memory.memory_store import MemoryStore
+from src.memory.sqlite_store import SqliteMemoryStore
+from src.tools.jira_tool import JiraTool
+from src.tools.sheet_tool import SheetTool
+
+WORKERS = 4
+PER_WORKER = 25
+
+try:
+    fork = multiprocessing.get_context("fork")
+except ValueError:
+    fork = None
+
+pytestmark = pytest.mark.skipif(fork is None, reason="needs the fork start method")
+
+def _run(target, *args):
+    procs = [fork.Process(target=target, args=(n,) + args) for n in range(WORKERS)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(60)
+        assert p.exitcode == 0
+
+def _create_issues(n, tmp):
+    jira = JiraTool(log_path=tmp / "jira.jsonl", export_path=tmp / "jira.json")
+    for i in range(PER_WORKER):
+        jira.create_issue(f"task {n}-{i}", assignee=f"w{n}@example.com")
+        if n == 0 and i % 5 == 4:
+            jira.compact()
+
+def test_jira_writers_in_several_processes(tmp_path):
+    _run(_create_issues, tmp_path)
+
+    jira = JiraTool(log_path=tmp_path / "jira.jsonl", export_path=tmp_path / "jira.json")
+    summaries = sorted(i["summary"] for i in jira.list_issues())
+    assert summaries == sorted(f"task {n}-{i}" for n in range(WORKERS) for i in range(PER_WORKER))
+    assert jira.query_issues(assignee="w1@example.com")[0] == PER_WORKER
+
+def _append_rows(n, tmp):
+    sheet = SheetTool(path=tmp / "sheet.csv")
+    for i in range(PER_WORKER):
+        sheet.append_rows([[f"task {n}-{i}", f"w{n}@example.com", None]])
+
+def test_sheet_appends_in_several_processes(tmp_path):
+    _run(_append_rows, tmp_path)
+
+    with (tmp_path / "sheet.csv").open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "ticket_id"
+    assert len(rows) == 1 + WORKERS * PER_WORKER
+
+def _add_reminders(n, store_factory):
+    store = store_factory()
+    for i in range(PER_WORKER):
+        assert store.add_reminder("m1", f"r{n}-{i}")
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_reminders_from_several_processes_are_not_lost(tmp_path, backend):
+    if backend == "json":
+        factory = lambda: MemoryStore(tmp_path / "mem")
+    else:
+        factory = lambda: SqliteMemoryStore(tmp_path / "mem" / "meetings.db", import_from=None)
+    factory().store_meeting("m1", {"transcript": "Anu will send notes.", "actions": []})
+
+    _run(_add_reminders, factory)
+
+    reminders = factory().load_meeting("m1")["reminders"]
+    assert sorted(reminders) == sorted(f"r{n}-{i}" for n in range(WORKERS) for i in range(PER_WORKER))
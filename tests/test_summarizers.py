@@ -0,0 +1,31 @@
+# tests/test_summarizers.py
+import pytest
+from src.agents.summarizer_agent import SummarizerAgent
+from src.summarizers import summarize, summarize_centroid
+
+SMALL_TALK = ["Hi all, can everyone hear me?", "Give it a minute, people are still joining.",
+              "How was the weekend?", "Great, thanks for asking."]
+TOPIC = ["The vendor contract renewal needs legal review of the vendor pricing.",
+         "Legal flagged the vendor contract pricing clause for review.",
+         "We should finish the vendor contract review before renewal."]
+
+def test_centroid_prefers_the_dominant_topic_over_opening_small_talk():
+    transcript = "\n".join(SMALL_TALK + TOPIC * 5 + ["Bye everyone."])
+    lines = summarize_centroid(transcript, max_sentences=2).splitlines()
+    assert len(lines) == 2
+    assert all("vendor" in line for line in lines)
+    # near-duplicates of an already chosen sentence are skipped
+    assert len(set(lines)) == 2
+
+    lead = summarize(transcript, strategy="lead", max_sentences=2).splitlines()
+    assert lead == ["- " + s for s in SMALL_TALK[:2]]
+
+def test_centroid_sampling_budget_still_returns_a_summary():
+    transcript = "\n".join((SMALL_TALK + TOPIC) * 200)
+    out = summarize_centroid(transcript, sentence_budget=50, time_budget_ms=0)
+    assert len(out.splitlines()) == 3
+
+def test_summarizer_agent_strategy_is_selectable():
+    assert SummarizerAgent("centroid").run("Short one.") == "- Short one."
+    with pytest.raises(ValueError):
+        SummarizerAgent("nope").run("text")